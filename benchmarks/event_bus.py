@@ -0,0 +1,46 @@
+import argparse
+import timeit
+
+from core.event.bus import EventBus
+from core.event.events import EngineEvent
+
+SUBSCRIBER_COUNTS: tuple[int, ...] = (10, 1_000, 10_000)
+
+class _Subscriber():
+    def __init__(self) -> None:
+        self.calls: int = 0
+
+    def tick(self, deltatime: float) -> None:
+        self.calls += 1
+
+def _subscribe(count: int) -> list[_Subscriber]:
+    EventBus.clear()
+    subscribers: list[_Subscriber] = [_Subscriber() for _ in range(count)]
+    for index, subscriber in enumerate(subscribers):
+        EventBus.subscribe(EngineEvent.TICK, subscriber.tick, priority = index % 3)
+
+    return subscribers
+
+def _measure(statement, count: int, repeat: int) -> float:
+    number: int = max(1, 100_000 // count)
+    best: float = min(timeit.repeat(statement, number = number, repeat = repeat))
+    return best / number
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Measures EventBus emit cost per call at different subscriber counts.")
+    parser.add_argument("--repeat", type = int, default = 5)
+    arguments = parser.parse_args()
+
+    print(f"{'subscribers':>12} {'subscribe ms':>14} {'emit us':>12} {'emit_fast us':>14} {'ns/callback':>12}")
+    for count in SUBSCRIBER_COUNTS:
+        subscribe_time: float = timeit.timeit(lambda: _subscribe(count), number = 1)
+
+        emit_time: float = _measure(lambda: EventBus.emit(EngineEvent.TICK, 0.016), count, arguments.repeat)
+        emit_fast_time: float = _measure(lambda: EventBus.emit_fast(EngineEvent.TICK, 0.016), count, arguments.repeat)
+
+        print(f"{count:>12} {subscribe_time * 1e3:>14.2f} {emit_time * 1e6:>12.2f} {emit_fast_time * 1e6:>14.2f} {emit_fast_time * 1e9 / count:>12.1f}")
+
+    EventBus.clear()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,219 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+
+import numpy as np
+import pygame
+
+from time import perf_counter_ns
+from typing import Callable, Iterable
+
+from core.engine import Engine
+from core.entity.entity import Entity
+from core.flags import Flags
+from core.render.scene.scene import Scene
+
+SCENARIOS: dict[str, int] = {
+    "boxes": 500,
+    "idle": 2_000,
+    "birds": 50
+}
+PERCENTILES: tuple[int, ...] = (50, 95, 99)
+
+class BenchmarkEngine(Engine):
+    """Headless engine with a fixed timestep that records how long each frame spends ticking and rendering."""
+
+    def __init__(self, ticks: int) -> None:
+        super().__init__(Flags.HEADLESS, fixed_deltatime = 1 / 60)
+        self.scene: Scene = Scene()
+        self.on_tick: Callable[[int], None] | None = None
+
+        self._tick_times: np.ndarray = np.zeros(ticks, dtype = np.int64)
+        self._render_times: np.ndarray = np.zeros(ticks, dtype = np.int64)
+        self._frame_times: np.ndarray = np.zeros(ticks, dtype = np.int64)
+        self._frame_start: int = 0
+
+    def _handle_events(self, events: Iterable[pygame.event.Event] | None = None) -> None:
+        # The first call of every frame, so it doubles as the frame boundary
+        now: int = perf_counter_ns()
+        if self._frame > 0:
+            self._frame_times[self._frame - 1] = now - self._frame_start
+        self._frame_start = now
+
+        super()._handle_events(events)
+
+    def _tick(self, deltatime: float) -> None:
+        start: int = perf_counter_ns()
+        super()._tick(deltatime)
+        self._tick_times[self._frame] = perf_counter_ns() - start
+
+    def _render(self, surface: pygame.Surface, deltatime: float) -> None:
+        start: int = perf_counter_ns()
+        super()._render(surface, deltatime)
+        self._render_times[self._frame] = perf_counter_ns() - start
+
+    def tick(self, deltatime: float) -> None:
+        if self.on_tick is not None:
+            self.on_tick(self._frame)
+
+    def render(self, surface: pygame.Surface, deltatime: float) -> None:
+        surface.fill((0, 0, 0))
+
+    def get_times(self, warmup: int) -> dict[str, np.ndarray]:
+        # The last frame has no following boundary, so its total is measured here
+        self._frame_times[self._frame - 1] = perf_counter_ns() - self._frame_start
+        return {
+            "tick": self._tick_times[warmup:self._frame],
+            "render": self._render_times[warmup:self._frame],
+            "frame": self._frame_times[warmup:self._frame]
+        }
+
+def _build_boxes(engine: BenchmarkEngine, count: int, rng: random.Random) -> None:
+    world = engine.scene.world
+    for _ in range(count):
+        world.create_dynamic_body((rng.uniform(0, world.width - 20), rng.uniform(-2000, 600)), 20, 20, color = (255, 255, 255))
+
+def _build_idle(engine: BenchmarkEngine, count: int, rng: random.Random) -> None:
+    entities: list[Entity] = [Entity(pygame.Vector2(rng.uniform(0, 1900), rng.uniform(0, 1060)), pygame.Vector2(20, 20)) for _ in range(count)]
+    engine.scene.entity_manager.add(entities)
+
+def _build_birds(engine: BenchmarkEngine, count: int, rng: random.Random) -> None:
+    from player import Player
+
+    world = engine.scene.world
+    birds: list[Player] = []
+    for _ in range(count):
+        bird: Player = Player(world)
+        bird._body.position = world.to_b2_position((rng.uniform(0, world.width - 50), rng.uniform(0, 900)), 50, 50)
+        bird.set_sprite("walking")
+        birds.append(bird)
+
+    engine.scene.entity_manager.add(birds)
+
+    def animate(frame: int) -> None:
+        if frame % 10 == 0:
+            for bird in birds:
+                bird.cycle_animation_sprite("walking")
+
+    engine.on_tick = animate
+
+BUILDERS: dict[str, Callable[[BenchmarkEngine, int, random.Random], None]] = {
+    "boxes": _build_boxes,
+    "idle": _build_idle,
+    "birds": _build_birds
+}
+
+def _get_peak_memory() -> float:
+    """Returns this process's peak resident memory in MiB."""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [(name, ctypes.c_size_t) for name in ("PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+
+    import resource
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_scenario(name: str, count: int, ticks: int, warmup: int, seed: int) -> dict:
+    """Builds and runs one scenario in this process and returns its timings in milliseconds."""
+    pygame.init()
+    engine: BenchmarkEngine = BenchmarkEngine(ticks + warmup)
+    BUILDERS[name](engine, count, random.Random(seed))
+
+    # Game code may print every tick; keep stdout clean for the JSON result
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        engine.start(ticks + warmup)
+
+    result: dict = {"scenario": name, "count": count, "ticks": ticks}
+    for metric, times in engine.get_times(warmup).items():
+        for percentile in PERCENTILES:
+            result[f"{metric}_p{percentile}_ms"] = float(np.percentile(times, percentile)) / 1e6
+
+    result["peak_memory_mb"] = _get_peak_memory()
+    return result
+
+def _run_isolated(name: str, count: int, ticks: int, warmup: int, seed: int) -> dict:
+    """Runs a scenario in a fresh interpreter so peak memory and global engine state are per scenario."""
+    command: list[str] = [sys.executable, "-m", "benchmarks.scenarios", "--worker", name, "--count", str(count), "--ticks", str(ticks), "--warmup", str(warmup), "--seed", str(seed)]
+    completed = subprocess.run(command, capture_output = True, text = True, env = {**os.environ, "SDL_VIDEODRIVER": "dummy", "SDL_AUDIODRIVER": "dummy"})
+    if completed.returncode != 0:
+        raise RuntimeError(f"Scenario '{name}' failed:\n{completed.stderr}")
+
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Returns a message for every metric that got slower (or used more memory) than the baseline by more than tolerance."""
+    regressions: list[str] = []
+    previous: dict[tuple[str, int], dict] = {(entry["scenario"], entry["count"]): entry for entry in baseline}
+
+    for result in results:
+        reference: dict | None = previous.get((result["scenario"], result["count"]))
+        if reference is None:
+            continue
+
+        for key, value in result.items():
+            if not (key.endswith("_ms") or key.endswith("_mb")) or key not in reference:
+                continue
+
+            if value > reference[key] * (1 + tolerance):
+                regressions.append(f"{result['scenario']}: {key} {value:.3f} > baseline {reference[key]:.3f} (+{(value / reference[key] - 1) * 100:.0f}%)")
+
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Runs scripted scenes headless at a fixed timestep and reports frame time percentiles and peak memory as JSON.")
+    parser.add_argument("scenarios", nargs = "*", metavar = "scenario", help = f"Any of {', '.join(SCENARIOS)}; runs all by default")
+    parser.add_argument("--count", type = int, default = None, help = "Overrides each scenario's default object count")
+    parser.add_argument("--ticks", type = int, default = 600)
+    parser.add_argument("--warmup", type = int, default = 60)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--output", help = "Writes the results to a file instead of stdout")
+    parser.add_argument("--baseline", help = "Fails if any metric regressed against this results file")
+    parser.add_argument("--tolerance", type = float, default = 0.15, help = "Allowed slowdown against the baseline, as a fraction")
+    parser.add_argument("--worker", help = argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    unknown: list[str] = [name for name in arguments.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    if arguments.worker:
+        print(json.dumps(run_scenario(arguments.worker, arguments.count, arguments.ticks, arguments.warmup, arguments.seed)))
+        return
+
+    results: list[dict] = [
+        _run_isolated(name, arguments.count or SCENARIOS[name], arguments.ticks, arguments.warmup, arguments.seed)
+        for name in arguments.scenarios or SCENARIOS
+    ]
+
+    output: str = json.dumps(results, indent = 4)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(output)
+    else:
+        print(output)
+
+    if arguments.baseline:
+        with open(arguments.baseline, "r") as file:
+            regressions: list[str] = compare(results, json.load(file), arguments.tolerance)
+
+        for regression in regressions:
+            print(regression, file = sys.stderr)
+
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,173 @@
+import argparse
+import json
+import os
+import posixpath
+import pygame
+
+from typing import Final
+
+from core.logger import Logger
+
+ATLAS_PADDING: Final[int] = 1
+MAX_SHEET_SIZE: Final[int] = 2048
+INDEX_FILE: Final[str] = "index.json"
+
+def region_name(path: str) -> str:
+    """Normalises an image path to the region name it is stored under: forward slashes on every OS, so an index baked on
+    Windows resolves on Linux and the other way round."""
+    return posixpath.normpath(path.replace("\\", "/"))
+
+class TextureAtlas():
+    def __init__(self, sheets: list[pygame.Surface], regions: dict[str, tuple[int, pygame.Rect]]) -> None:
+        self._sheets: list[pygame.Surface] = sheets
+        self._regions: dict[str, tuple[int, pygame.Rect]] = regions
+        self._subsurfaces: dict[str, pygame.Surface] = {}
+
+    @property
+    def sheets(self) -> list[pygame.Surface]:
+        return self._sheets
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._regions)
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, name: str) -> bool:
+        return region_name(name) in self._regions
+
+    def get_region(self, name: str) -> tuple[int, pygame.Rect]:
+        """Returns the sheet index and the rect an image occupies on that sheet."""
+        return self._regions[region_name(name)]
+
+    def get(self, name: str) -> pygame.Surface:
+        """Returns a subsurface of the sheet holding name. It shares the sheet's pixels, so it must not be drawn onto."""
+        key: str = region_name(name)
+        subsurface: pygame.Surface | None = self._subsurfaces.get(key)
+        if subsurface is None:
+            sheet, rect = self._regions[key]
+            subsurface = self._sheets[sheet].subsurface(rect)
+            self._subsurfaces[key] = subsurface
+
+        return subsurface
+
+    def convert(self) -> None:
+        """Converts the sheets to the display format. Needs a display mode."""
+        self._sheets = [sheet.convert_alpha() for sheet in self._sheets]
+        self._subsurfaces.clear()
+
+    @classmethod
+    def build(cls, images: dict[str, pygame.Surface], max_size: int = MAX_SHEET_SIZE, padding: int = ATLAS_PADDING) -> "TextureAtlas":
+        """Packs images into as few sheets as fit within max_size using shelf packing, tallest images first."""
+        order: list[str] = sorted(images, key = lambda name: (-images[name].get_height(), name))
+        placements: list[list[tuple[str, pygame.Rect]]] = [[]]
+        shelf_x: int = padding
+        shelf_y: int = padding
+        shelf_height: int = 0
+
+        for name in order:
+            width, height = images[name].get_size()
+            if width + padding * 2 > max_size or height + padding * 2 > max_size:
+                raise ValueError(f"Image '{name}' ({width}x{height}) does not fit in a {max_size}x{max_size} sheet.")
+
+            if shelf_x + width + padding > max_size:
+                shelf_x = padding
+                shelf_y += shelf_height + padding
+                shelf_height = 0
+
+            if shelf_y + height + padding > max_size:
+                placements.append([])
+                shelf_x = padding
+                shelf_y = padding
+                shelf_height = 0
+
+            placements[-1].append((name, pygame.Rect(shelf_x, shelf_y, width, height)))
+            shelf_x += width + padding
+            shelf_height = max(shelf_height, height)
+
+        sheets: list[pygame.Surface] = []
+        regions: dict[str, tuple[int, pygame.Rect]] = {}
+        for index, placed in enumerate(placements):
+            if not placed:
+                continue
+
+            # Trim the sheet to what was actually used
+            width: int = max(rect.right for _, rect in placed) + padding
+            height: int = max(rect.bottom for _, rect in placed) + padding
+            sheet: pygame.Surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            for name, rect in placed:
+                sheet.blit(images[name], rect)
+                regions[region_name(name)] = (index, rect)
+
+            sheets.append(sheet)
+
+        return cls(sheets, regions)
+
+    @classmethod
+    def from_directory(cls, directory: str, extensions: tuple[str, ...] = (".png",), exclude: str | None = None, **kwargs) -> "TextureAtlas":
+        """Builds an atlas of every image under a directory, named by their paths so they match AssetCache keys."""
+        images: dict[str, pygame.Surface] = {}
+        for root, directories, files in os.walk(directory):
+            if exclude is not None:
+                directories[:] = [name for name in directories if os.path.normpath(os.path.join(root, name)) != os.path.normpath(exclude)]
+
+            for file in sorted(files):
+                if file.lower().endswith(extensions):
+                    path: str = os.path.join(root, file)
+                    images[region_name(path)] = pygame.image.load(path)
+
+        return cls.build(images, **kwargs)
+
+    def save(self, directory: str) -> None:
+        """Writes every sheet as a PNG next to a JSON index of the regions."""
+        os.makedirs(directory, exist_ok = True)
+        sheet_files: list[str] = []
+        for index, sheet in enumerate(self._sheets):
+            sheet_files.append(f"sheet{index}.png")
+            pygame.image.save(sheet, os.path.join(directory, sheet_files[-1]))
+
+        index_data: dict = {
+            "sheets": sheet_files,
+            "regions": {name: [sheet, *rect] for name, (sheet, rect) in self._regions.items()}
+        }
+        with open(os.path.join(directory, INDEX_FILE), "w") as file:
+            json.dump(index_data, file, indent = 4)
+
+    @classmethod
+    def load(cls, directory: str) -> "TextureAtlas":
+        """Loads a baked atlas, converting the sheets when a display mode is set."""
+        with open(os.path.join(directory, INDEX_FILE), "r") as file:
+            index_data: dict = json.load(file)
+
+        sheets: list[pygame.Surface] = [pygame.image.load(os.path.join(directory, name)) for name in index_data["sheets"]]
+        if pygame.display.get_surface() is not None:
+            sheets = [sheet.convert_alpha() for sheet in sheets]
+
+        regions: dict[str, tuple[int, pygame.Rect]] = {
+            region_name(name): (sheet, pygame.Rect(x, y, width, height))
+            for name, (sheet, x, y, width, height) in index_data["regions"].items()
+        }
+        return cls(sheets, regions)
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        return os.path.isfile(os.path.join(directory, INDEX_FILE))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = "Bakes every image under a directory into texture atlas sheets with a JSON rect index.")
+    parser.add_argument("source", nargs = "?", default = "assets")
+    parser.add_argument("output", nargs = "?", default = os.path.join("assets", "atlas"))
+    parser.add_argument("--max-size", type = int, default = MAX_SHEET_SIZE)
+    parser.add_argument("--padding", type = int, default = ATLAS_PADDING)
+    args = parser.parse_args()
+
+    logger: Logger = Logger("TextureAtlas")
+    atlas: TextureAtlas = TextureAtlas.from_directory(args.source, exclude = args.output, max_size = args.max_size, padding = args.padding)
+    atlas.save(args.output)
+
+    sizes: str = ", ".join(f"{sheet.get_width()}x{sheet.get_height()}" for sheet in atlas.sheets)
+    logger.info(f"Packed {len(atlas)} images into {len(atlas.sheets)} sheet(s) ({sizes}) in {args.output}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,159 @@
+import os
+import pygame
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import Iterable
+
+from core.assets.atlas import TextureAtlas, region_name
+from core.logger import Logger
+
+class AssetCache():
+    _logger: Logger = Logger("AssetCache")
+    _lock: threading.Lock = threading.Lock()
+    _executor: ThreadPoolExecutor | None = None
+    _pending: dict[str, Future] = {}
+    _images: dict[str, pygame.Surface] = {}
+    _timings: dict[str, float] = {}
+    _atlas: TextureAtlas | None = None
+    _batch_remaining: int = 0
+    _batch_started: float = 0.0
+
+    @staticmethod
+    def _key(path: str) -> str:
+        # The same normalisation as atlas region names, so cache keys and atlas lookups agree
+        return region_name(path)
+
+    @staticmethod
+    def get_image(path: str) -> pygame.Surface:
+        """Returns the shared, display-converted surface for an image path, decoding it at most once."""
+        key: str = AssetCache._key(path)
+        image: pygame.Surface | None = AssetCache._images.get(key)
+        if image is not None:
+            return image
+
+        atlas: TextureAtlas | None = AssetCache._atlas
+        if atlas is not None and key in atlas:
+            image = atlas.get(key)
+            AssetCache._images[key] = image
+            return image
+
+        with AssetCache._lock:
+            future: Future | None = AssetCache._pending.pop(key, None)
+
+        # Blocks only if the worker has not reached this image yet
+        raw: pygame.Surface = future.result() if future is not None else AssetCache._load(key)
+
+        # convert_alpha needs a display mode and must run on the main thread
+        image = raw.convert_alpha() if pygame.display.get_surface() is not None else raw
+        AssetCache._images[key] = image
+        return image
+
+    @staticmethod
+    def _load(key: str) -> pygame.Surface:
+        start: float = perf_counter()
+        image: pygame.Surface = pygame.image.load(key)
+        AssetCache._timings[key] = (perf_counter() - start) * 1000.0
+        return image
+
+    @staticmethod
+    def preload(paths: Iterable[str]) -> None:
+        """Decodes images on a worker thread while the caller keeps running; get_image picks the results up."""
+        submitted: list[Future] = []
+        with AssetCache._lock:
+            if AssetCache._executor is None:
+                AssetCache._executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "AssetCache")
+
+            for path in paths:
+                key: str = AssetCache._key(path)
+                if key in AssetCache._images or key in AssetCache._pending:
+                    continue
+
+                if AssetCache._atlas is not None and key in AssetCache._atlas:
+                    continue
+
+                if AssetCache._batch_remaining == 0:
+                    AssetCache._batch_started = perf_counter()
+
+                AssetCache._batch_remaining += 1
+                future: Future = AssetCache._executor.submit(AssetCache._load, key)
+                AssetCache._pending[key] = future
+                submitted.append(future)
+
+        # Outside the lock: a future that is already done runs its callback inline, and _on_preloaded takes the lock
+        for future in submitted:
+            future.add_done_callback(AssetCache._on_preloaded)
+
+    @staticmethod
+    def preload_directory(directory: str, extensions: tuple[str, ...] = (".png",)) -> list[str]:
+        """Preloads every image under a directory and returns the manifest of paths queued."""
+        manifest: list[str] = []
+        for root, _, files in os.walk(directory):
+            for file in sorted(files):
+                if file.lower().endswith(extensions):
+                    manifest.append(os.path.join(root, file))
+
+        AssetCache.preload(manifest)
+        return manifest
+
+    @staticmethod
+    def use_atlas(atlas: TextureAtlas | None) -> None:
+        """Serves images packed in the atlas as subsurfaces of its sheets instead of loading them one by one."""
+        AssetCache._atlas = atlas
+        # Drop surfaces handed out before the switch so later lookups resolve against the atlas
+        AssetCache._images.clear()
+
+    @staticmethod
+    def get_atlas() -> TextureAtlas | None:
+        return AssetCache._atlas
+
+    @staticmethod
+    def _on_preloaded(future: Future) -> None:
+        if future.exception() is not None:
+            AssetCache._logger.error(f"Failed to preload image: {future.exception()}")
+
+        with AssetCache._lock:
+            AssetCache._batch_remaining -= 1
+            if AssetCache._batch_remaining == 0:
+                AssetCache.report((perf_counter() - AssetCache._batch_started) * 1000.0)
+
+    @staticmethod
+    def wait() -> None:
+        """Blocks until every queued preload has been decoded."""
+        with AssetCache._lock:
+            futures: list[Future] = list(AssetCache._pending.values())
+
+        for future in futures:
+            future.exception()
+
+    @staticmethod
+    def is_cached(path: str) -> bool:
+        return AssetCache._key(path) in AssetCache._images
+
+    @staticmethod
+    def get_pending_count() -> int:
+        return AssetCache._batch_remaining
+
+    @staticmethod
+    def get_timings() -> dict[str, float]:
+        """Returns the decode time of every loaded image in milliseconds, keyed by path."""
+        return dict(AssetCache._timings)
+
+    @staticmethod
+    def report(elapsed: float | None = None) -> None:
+        timings: dict[str, float] = AssetCache.get_timings()
+        if not timings:
+            return
+
+        slowest: str = max(timings, key = timings.get)
+        wall_time: str = f", {elapsed:.1f} ms wall time" if elapsed is not None else ""
+        AssetCache._logger.info(f"Loaded {len(timings)} images in {sum(timings.values()):.1f} ms{wall_time} (slowest: {slowest} at {timings[slowest]:.1f} ms)")
+
+    @staticmethod
+    def clear() -> None:
+        AssetCache.wait()
+        with AssetCache._lock:
+            AssetCache._pending.clear()
+            AssetCache._images.clear()
+            AssetCache._timings.clear()
\ No newline at end of file
@@ -1,118 +1,312 @@
-import pygame
-import sys
-
-from core.logger import Logger
-from core.event.bus import EventBus
-from core.event.events import EngineEvent
-from core.input.action import InputAction
-from core.input.keyboard.key import Key, Mods, KeyMod
-from core.input.keyboard.keyboard import Keyboard
-from core.input.mouse.mouse import Mouse
-from core.input.mouse.button import MouseButton
-from core.render.scene.scene_manager import SceneManager
-from core.interfaces.listener import EventListener
-from core.interfaces.tickable import Tickable
-from core.interfaces.renderable import Renderable
-from core.flags import Flags
-
-class Engine(Tickable, Renderable, EventListener):
-    def __init__(self, flags: int = 0b0) -> None:
-        EventListener.__init__(self)
-
-        self._version: str = "1.0.0"
-        self._running: bool = False
-        self.logger: Logger = Logger("Engine")
-        self._flags: int = flags
-        
-        self.screen = pygame.display.set_mode((1080, 720), pygame.DOUBLEBUF | pygame.NOFRAME, vsync = 1)
-        self.display: pygame.Surface = pygame.Surface((1920, 1080))
-        self.fps: int = 0
-        self._deltatime: float = 0.0
-        self._clock: pygame.time.Clock = pygame.time.Clock()
-
-    @property
-    def running(self) -> bool:
-        return self._running
-    
-    @property
-    def flags(self) -> int:
-        return self._flags
-    
-    def init(self) -> None:
-        Mouse.init()
-        Keyboard.init()
-
-        if not pygame.font.get_init():
-            pygame.font.init()
-        
-        if not pygame.mixer.get_init():
-            pygame.mixer.init()
-    
-    def _tick(self, deltatime: float) -> None:
-        EventBus.emit(EngineEvent.TICK, deltatime)
-
-    def _render(self, surface: pygame.Surface, deltatime: float) -> None:
-        EventBus.emit(EngineEvent.RENDER, surface, deltatime)
-        self.screen.blit(pygame.transform.scale(surface, self.screen.get_size()), (0, 0))
-
-    def _on_key_down(self, key: Key) -> None:
-        EventBus.emit(EngineEvent.KEY, key, InputAction.KEYDOWN)
-        EventBus.emit(EngineEvent.KEYDOWN, key)
-
-    def _on_key_up(self, key: Key) -> None:
-        EventBus.emit(EngineEvent.KEY, key, InputAction.KEYUP)
-        EventBus.emit(EngineEvent.KEYUP, key)
-
-    def _on_mouse_down(self, button: MouseButton) -> None:
-        EventBus.emit(EngineEvent.MOUSE, button, InputAction.MOUSEBUTTONDOWN)
-        EventBus.emit(EngineEvent.MOUSEBUTTONDOWN, button)
-
-    def _on_mouse_up(self, button: MouseButton) -> None:
-        EventBus.emit(EngineEvent.MOUSE, button, InputAction.MOUSEBUTTONUP)
-        EventBus.emit(EngineEvent.MOUSEBUTTONUP, button)
-
-    def _on_mouse_motion(self, old_position: pygame.Vector2, new_position: pygame.Vector2, relative_position: pygame.Vector2, buttons: list[int]) -> None:
-        EventBus.emit(EngineEvent.MOUSE, old_position, new_position, relative_position, buttons, InputAction.MOUSEMOTION)
-        EventBus.emit(EngineEvent.MOUSEMOTION, old_position, new_position, relative_position, buttons)
-
-    def _handle_events(self) -> None:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self._running = False
-            elif event.type == pygame.KEYDOWN:
-                self._on_key_down(Key(event.key, event.scancode, event.unicode, Mods(event.mod)))
-            elif event.type == pygame.KEYUP:
-                self._on_key_up(Key(event.key, event.scancode, event.unicode, Mods(event.mod)))
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self._on_mouse_down(event.button)
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self._on_mouse_up(event.button)
-            elif event.type == pygame.MOUSEMOTION:
-                self._on_mouse_motion(Mouse.get_position(), pygame.Vector2(event.pos), pygame.Vector2(event.rel), event.buttons)
-    
-    def start(self) -> None:
-        self.logger.info(f"Initialising engine v{self._version} | pygame-ce {pygame.version.ver} | SDL {'.'.join([str(_) for _ in pygame.get_sdl_version()])} | python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-
-        self._running = True
-
-        self.init()
-        self.scene_manager: SceneManager = SceneManager()
-
-        EventBus.emit(EngineEvent.START)
-        self._mainloop()
-
-    def stop(self) -> None:
-        self.logger.info("Engine stopping...")
-        self._running = False
-
-    def _mainloop(self) -> None:
-        while self.running:
-            self._handle_events()
-
-            self._tick(self._deltatime)
-            self._render(self.display, self._deltatime)
-
-            pygame.display.flip()
-            self._deltatime = self._clock.tick(self.fps) / 1000.0
-
+import os
+import pygame
+import sys
+
+from typing import Iterable
+
+from core.logger import Logger
+from core.profiler import Profiler
+from core.event.bus import EventBus
+from core.event.events import EngineEvent
+from core.input.action import InputAction
+from core.input.keyboard.key import Key, Mods, KeyMod
+from core.input.keyboard.keyboard import Keyboard
+from core.input.recording import InputRecorder, InputReplay
+from core.input.mouse.mouse import Mouse
+from core.input.mouse.button import MouseButton
+from core.render.scene.scene_manager import SceneManager
+from core.render.presenter import Presenter, ScaleFilter
+from core.render.dirty_rects import DirtyRects
+from core.render.pipeline import RenderPipeline
+from core.render.snapshot import RenderSnapshot
+from core.render.profiler_overlay import ProfilerOverlay
+from core.interfaces.listener import EventListener
+from core.interfaces.tickable import Tickable
+from core.interfaces.renderable import Renderable
+from core.flags import Flags
+
+class Engine(Tickable, Renderable, EventListener):
+    def __init__(self, flags: int = 0b0, *, fixed_deltatime: float | None = None, scale_filter: ScaleFilter = ScaleFilter.NEAREST, record_input: str | None = None, replay_input: str | None = None) -> None:
+        EventListener.__init__(self)
+
+        self._version: str = "1.0.0"
+        self._running: bool = False
+        self.logger: Logger = Logger("Engine")
+        self._flags: int = flags
+        self._fixed_deltatime: float | None = fixed_deltatime
+        self._frame: int = 0
+        self._recorder: InputRecorder | None = InputRecorder(record_input) if record_input is not None else None
+        # Replays take input and deltatimes from the log and run unthrottled on the dummy driver
+        self._replay: InputReplay | None = InputReplay(replay_input) if replay_input is not None else None
+        
+        if self.has_flag(Flags.HEADLESS) or self._replay is not None:
+            self.screen = self._create_headless_screen((1080, 720))
+        else:
+            self.screen = pygame.display.set_mode((1080, 720), pygame.DOUBLEBUF | pygame.NOFRAME, vsync = 1)
+
+        self.display: pygame.Surface = pygame.Surface((1920, 1080))
+        self.presenter: Presenter = Presenter(self.screen, self.display.get_size(), scale_filter)
+        self.fps: int = 0
+        self._deltatime: float = fixed_deltatime if fixed_deltatime is not None else 0.0
+        self._clock: pygame.time.Clock = pygame.time.Clock()
+        self.profiler_overlay: ProfilerOverlay | None = None
+        self._pipeline: RenderPipeline = RenderPipeline(self.display, self._present_frame)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+    
+    @property
+    def flags(self) -> int:
+        return self._flags
+    
+    @property
+    def headless(self) -> bool:
+        return self.has_flag(Flags.HEADLESS)
+    
+    @property
+    def frame(self) -> int:
+        return self._frame
+    
+    @property
+    def fixed_deltatime(self) -> float | None:
+        return self._fixed_deltatime
+    
+    def has_flag(self, flag: int) -> bool:
+        return bool(self._flags & flag)
+    
+    def _create_headless_screen(self, size: tuple[int, int]) -> pygame.Surface:
+        # SDL only reads the driver hints when its subsystems initialise
+        if pygame.display.get_init() and pygame.display.get_driver() != "dummy":
+            self.logger.warn(f"Display already initialised with the '{pygame.display.get_driver()}' driver, restarting it headless")
+            pygame.display.quit()
+
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+        return pygame.display.set_mode(size)
+    
+    def init(self) -> None:
+        Mouse.init()
+        Keyboard.init()
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+    
+    def _tick(self, deltatime: float) -> None:
+        EventBus.emit_fast(EngineEvent.TICK, deltatime)
+
+    def _render(self, surface: pygame.Surface, deltatime: float) -> None:
+        EventBus.emit_fast(EngineEvent.RENDER, surface, deltatime)
+
+    def _present(self, surface: pygame.Surface) -> None:
+        self.presenter.present(surface)
+        if Profiler.enabled:
+            Profiler.phase("scale")
+
+        pygame.display.flip()
+
+    def _present_dirty(self, surface: pygame.Surface) -> None:
+        """Scales and pushes only the areas renderables reported as changed; frames where nothing changed skip presenting."""
+        bounds: pygame.Rect = surface.get_rect()
+        rects: list[pygame.Rect] = DirtyRects.collect(bounds)
+        if not rects:
+            return
+
+        if rects[0] == bounds:
+            self._present(surface)
+        else:
+            rects = self.presenter.present_regions(surface, rects)
+            if Profiler.enabled:
+                Profiler.phase("scale")
+
+            pygame.display.update(rects)
+
+    def _present_frame(self, surface: pygame.Surface, rects: list[pygame.Rect] | None) -> None:
+        """Presents a whole frame, or only the given dirty areas, from the render thread. Profiler phases stay on the main thread."""
+        bounds: pygame.Rect = surface.get_rect()
+        if rects is None or (rects and rects[0] == bounds):
+            self.presenter.present(surface)
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(self.presenter.present_regions(surface, rects))
+
+    def _on_key_down(self, key: Key) -> None:
+        EventBus.emit_fast(EngineEvent.KEY, key, InputAction.KEYDOWN)
+        EventBus.emit_fast(EngineEvent.KEYDOWN, key)
+
+    def _on_key_up(self, key: Key) -> None:
+        EventBus.emit_fast(EngineEvent.KEY, key, InputAction.KEYUP)
+        EventBus.emit_fast(EngineEvent.KEYUP, key)
+
+    def _on_mouse_down(self, button: MouseButton) -> None:
+        EventBus.emit_fast(EngineEvent.MOUSE, button, InputAction.MOUSEBUTTONDOWN)
+        EventBus.emit_fast(EngineEvent.MOUSEBUTTONDOWN, button)
+
+    def _on_mouse_up(self, button: MouseButton) -> None:
+        EventBus.emit_fast(EngineEvent.MOUSE, button, InputAction.MOUSEBUTTONUP)
+        EventBus.emit_fast(EngineEvent.MOUSEBUTTONUP, button)
+
+    def _on_mouse_motion(self, old_position: pygame.Vector2, new_position: pygame.Vector2, relative_position: pygame.Vector2, buttons: list[int]) -> None:
+        EventBus.emit_fast(EngineEvent.MOUSE, old_position, new_position, relative_position, buttons, InputAction.MOUSEMOTION)
+        EventBus.emit_fast(EngineEvent.MOUSEMOTION, old_position, new_position, relative_position, buttons)
+
+    def _next_events(self) -> list[pygame.event.Event] | None:
+        """Returns this frame's input, from SDL or the replay log, and records it when recording. None means the replay has ended."""
+        if self._replay is None:
+            events: list[pygame.event.Event] = pygame.event.get()
+        else:
+            frame: tuple[int, float, list[pygame.event.Event]] | None = self._replay.next_frame()
+            if frame is None:
+                return None
+
+            _, self._deltatime, events = frame
+
+        if self._recorder is not None:
+            self._recorder.record_frame(self._frame, self._deltatime, events)
+
+        return events
+
+    def _handle_events(self, events: Iterable[pygame.event.Event] | None = None) -> None:
+        # Mouse motion is accumulated and emitted once per frame; a high polling rate mouse sends hundreds of events
+        motion: tuple[tuple[int, int], int, int, tuple[int, ...]] | None = None
+
+        for event in pygame.event.get() if events is None else events:
+            if event.type == pygame.MOUSEMOTION:
+                if motion is None:
+                    motion = (event.pos, event.rel[0], event.rel[1], event.buttons)
+                else:
+                    motion = (event.pos, motion[1] + event.rel[0], motion[2] + event.rel[1], event.buttons)
+                continue
+
+            # Anything else sees the pointer where it was when the event happened
+            if motion is not None:
+                self._flush_motion(motion)
+                motion = None
+
+            if event.type == pygame.QUIT:
+                self._running = False
+            elif event.type == pygame.KEYDOWN:
+                self._on_key_down(Key.get(event.key, event.scancode, event.unicode, event.mod))
+            elif event.type == pygame.KEYUP:
+                self._on_key_up(Key.get(event.key, event.scancode, event.unicode, event.mod))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                self._on_mouse_down(event.button)
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self._on_mouse_up(event.button)
+
+        if motion is not None:
+            self._flush_motion(motion)
+
+    def _flush_motion(self, motion: tuple[tuple[int, int], int, int, tuple[int, ...]]) -> None:
+        position, relative_x, relative_y, buttons = motion
+        self._on_mouse_motion(Mouse.get_position(), pygame.Vector2(position), pygame.Vector2(relative_x, relative_y), buttons)
+    
+    def start(self, ticks: int | None = None) -> None:
+        self.logger.info(f"Initialising engine v{self._version} | pygame-ce {pygame.version.ver} | SDL {'.'.join([str(_) for _ in pygame.get_sdl_version()])} | python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
+
+        self._running = True
+
+        self.init()
+        self.scene_manager: SceneManager = SceneManager()
+
+        if self.has_flag(Flags.PROFILE):
+            Profiler.enable()
+            self.profiler_overlay = ProfilerOverlay()
+
+        EventBus.emit(EngineEvent.START)
+        self._mainloop(ticks)
+
+    def run(self, ticks: int | None = None) -> None:
+        """Resumes the main loop of a started engine, until stopped or for the given number of ticks."""
+        self._running = True
+        self._mainloop(ticks)
+
+    def stop(self) -> None:
+        self.logger.info("Engine stopping...")
+        self._running = False
+
+    def _mainloop(self, ticks: int | None = None) -> None:
+        if ticks is not None and ticks <= 0:
+            return
+
+        headless: bool = self.has_flag(Flags.HEADLESS)
+        render: bool = not self.has_flag(Flags.SKIP_RENDER)
+        dirty_rects: bool = self.has_flag(Flags.DIRTY_RECTS) and not headless
+        if dirty_rects and not DirtyRects.enabled:
+            DirtyRects.enable()
+        # Presenting moves to a render thread that draws each frame while the next one ticks
+        pipelined: bool = self.has_flag(Flags.PIPELINED) and render and not headless
+        if pipelined:
+            self._pipeline.start()
+        last_frame: int | None = self._frame + ticks if ticks is not None else None
+
+        while self.running:
+            # Checked once per frame so the phase timers cost nothing while profiling is off
+            profiling: bool = Profiler.enabled
+            if profiling:
+                Profiler.begin_frame(self._frame)
+
+            events: list[pygame.event.Event] | None = self._next_events()
+            if events is None:
+                break
+
+            Keyboard.update()
+            self._handle_events(events)
+            if profiling:
+                Profiler.phase("events")
+
+            self._tick(self._deltatime)
+            if profiling:
+                Profiler.phase("tick")
+
+            if pipelined:
+                snapshot: RenderSnapshot = self._pipeline.begin()
+                self._render(snapshot, self._deltatime)
+                if dirty_rects:
+                    snapshot.dirty = DirtyRects.collect(self.display.get_rect())
+                if profiling:
+                    Profiler.phase("render")
+            elif render:
+                self._render(self.display, self._deltatime)
+                if profiling:
+                    Profiler.phase("render")
+
+            if pipelined:
+                # Waits only while the render thread is still presenting the previous frame
+                self._pipeline.submit(snapshot)
+            elif dirty_rects:
+                self._present_dirty(self.display)
+            elif not headless:
+                self._present(self.display)
+
+            if profiling and not headless:
+                Profiler.phase("flip")
+
+            self._frame += 1
+
+            if self._fixed_deltatime is not None:
+                self._deltatime = self._fixed_deltatime
+            else:
+                self._deltatime = self._clock.tick(0 if headless or self._replay is not None else self.fps) / 1000.0
+
+            if profiling:
+                Profiler.phase("wait")
+
+            if last_frame is not None and self._frame >= last_frame:
+                self._pipeline.stop()
+                if self._recorder is not None:
+                    self._recorder.flush()
+                return
+
+        self._pipeline.stop()
+        if self._recorder is not None:
+            self._recorder.close()
+            self.logger.info(f"Recorded {self._recorder.frames} frames of input to '{self._recorder.path}'")
+        if self._replay is not None:
+            elapsed: float = self._replay.elapsed
+            self.logger.info(f"Replayed {self._replay.frames} frames from '{self._replay.path}' in {elapsed:.2f}s ({elapsed / max(self._replay.frames, 1) * 1000:.2f} ms per frame)")
         pygame.quit()
\ No newline at end of file
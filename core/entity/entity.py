@@ -1,70 +1,174 @@
-import pygame
-
-from core.game_object import GameObject
-from core.interfaces.tickable import Tickable
-from core.interfaces.renderable import Renderable
-from core.interfaces.listener import EventListener
-
-from core.entity.sprite import Sprite, SpriteTable, SpriteAnimation
-from core.direction import Direction
-
-class Entity(GameObject, Tickable, Renderable, EventListener):
-    def __init__(self, position: pygame.Vector2 = pygame.Vector2(0, 0), size: pygame.Vector2 = pygame.Vector2(20, 20), sprite_table: SpriteTable | None = None, default_sprite: str | None = None) -> None:
-        super().__init__(position)
-        EventListener.__init__(self)
-
-        self._size: pygame.Vector2 = size
-        self._sprite_table: SpriteTable | None = sprite_table
-        self._default_sprite: str | None = default_sprite
-        self._current_sprite: Sprite | SpriteAnimation | None = self._sprite_table.get_sprite(self._default_sprite) if self._sprite_table and self._default_sprite else None
-        
-    @property
-    def size(self) -> pygame.Vector2:
-        return self._size
-    
-    @size.setter
-    def size(self, size: pygame.Vector2) -> None:
-        self._size = size
-
-    @property
-    def current_sprite(self) -> Sprite | None:
-        return self._current_sprite
-
-    def get_collider_rect(self) -> pygame.Rect:
-        return pygame.Rect(self._position, self._size)
-
-    def set_sprite(self, name: str) -> None:
-        if self._sprite_table is None:
-            raise ValueError("Sprite table is not set for this entity.")
-        
-        sprite: Sprite | SpriteAnimation = self._sprite_table.get_sprite(name, return_sprite_animation_instance = True)
-        self._current_sprite = sprite
-
-    def reset_sprite(self) -> None:
-        if self._current_sprite:
-            self._current_sprite.reset()
-
-    def set_sprite_rotation(self, rotation: float) -> None:
-        if self._current_sprite:
-            self._current_sprite.rotation = rotation
-
-    def set_sprite_direction(self, direction: Direction) -> None:
-        self._sprite_table.set_movement_direction(direction)
-
-    def cycle_animation_sprite(self, name: str) -> None:
-        sprite: SpriteAnimation = self._sprite_table.get_animation_sprite(name)
-        sprite.cycle()
-
-    def tick(self, deltatime: float) -> None:
-        ...
-
-    def render(self, screen: pygame.Surface, deltatime: float) -> None:
-        if self._current_sprite:
-            # mask: pygame.mask.Mask = pygame.mask.from_surface(self._current_sprite.get_rendered_image())
-            # mask_surface: pygame.Surface = mask.to_surface()
-            # Check rect collision first, then check mask collision
-
-            screen.blit(self._current_sprite.get_rendered_image(), self._position)
-        else:
-            pygame.draw.rect(screen, (255, 0, 0), self.get_collider_rect())
-            pygame.draw.rect(screen, (255, 255, 255,), self.get_collider_rect(), 1)
\ No newline at end of file
+import pygame
+
+from core.game_object import GameObject
+from core.interfaces.tickable import Tickable
+from core.interfaces.renderable import Renderable
+from core.interfaces.listener import EventListener
+
+from core.entity.sprite import Sprite, SpriteTable, SpriteAnimation
+from core.direction import Direction
+from core.render.spatial_hash import SpatialHash
+from core.render.dirty_rects import DirtyRects
+from core.render.snapshot import draw_rect
+
+class Entity(GameObject, Tickable, Renderable, EventListener):
+    def __init__(self, position: pygame.Vector2 = pygame.Vector2(0, 0), size: pygame.Vector2 = pygame.Vector2(20, 20), sprite_table: SpriteTable | None = None, default_sprite: str | None = None, tags: set[str] | None = None) -> None:
+        super().__init__(position)
+        EventListener.__init__(self)
+
+        self._size: pygame.Vector2 = size
+        self._sprite_table: SpriteTable | None = sprite_table
+        self._default_sprite: str | None = default_sprite
+        self._current_sprite: Sprite | SpriteAnimation | None = self._sprite_table.get_sprite(self._default_sprite) if self._sprite_table and self._default_sprite else None
+        self._spatial_hash: SpatialHash | None = None
+        self._visible: bool = True
+        self._entity_id: int | None = None
+        self._tags: set[str] = set(tags) if tags else set()
+        # Render state lives on the entity so sprite tables can be shared
+        self._facing: Direction | None = None
+        self._rotation: float = 0.0
+        self._animation_indices: dict[str, int] = {}
+        self._drawn_rect: pygame.Rect | None = None
+        self._drawn_image: pygame.Surface | None = None
+        
+    @property
+    def entity_id(self) -> int | None:
+        """Stable id assigned by the EntityManager that owns this entity, None while unmanaged."""
+        return self._entity_id
+    
+    @property
+    def tags(self) -> frozenset[str]:
+        return frozenset(self._tags)
+
+    @property
+    def position(self) -> pygame.Vector2:
+        return self._position
+    
+    @position.setter
+    def position(self, position: pygame.Vector2) -> None:
+        self._position = position
+        if self._spatial_hash is not None:
+            self._spatial_hash.update(self, self.get_collider_rect())
+
+    @property
+    def size(self) -> pygame.Vector2:
+        return self._size
+    
+    @size.setter
+    def size(self, size: pygame.Vector2) -> None:
+        self._size = size
+        if self._spatial_hash is not None:
+            self._spatial_hash.update(self, self.get_collider_rect())
+
+    @property
+    def visible(self) -> bool:
+        """False while the entity is culled outside the camera view; culled entities skip rendering."""
+        return self._visible
+    
+    @visible.setter
+    def visible(self, visible: bool) -> None:
+        self._visible = visible
+        if not visible:
+            self.invalidate()
+
+    @property
+    def spatial_hash(self) -> SpatialHash | None:
+        return self._spatial_hash
+    
+    @spatial_hash.setter
+    def spatial_hash(self, spatial_hash: SpatialHash | None) -> None:
+        """Indexes the entity in a spatial hash, which its position and size setters then keep updated."""
+        if self._spatial_hash is not None:
+            self._spatial_hash.remove(self)
+
+        self._spatial_hash = spatial_hash
+        if spatial_hash is not None:
+            spatial_hash.update(self, self.get_collider_rect())
+
+    @property
+    def current_sprite(self) -> Sprite | None:
+        return self._current_sprite
+
+    @property
+    def facing(self) -> Direction | None:
+        """Direction sprites are drawn facing, or None to draw them as authored."""
+        return self._facing
+
+    @property
+    def rotation(self) -> float:
+        return self._rotation
+
+    def get_collider_rect(self) -> pygame.Rect:
+        return pygame.Rect(self._position, self._size)
+
+    def set_sprite(self, name: str) -> None:
+        if self._sprite_table is None:
+            raise ValueError("Sprite table is not set for this entity.")
+        
+        sprite: Sprite | SpriteAnimation = self._sprite_table.get_sprite(name, return_sprite_animation_instance = True)
+        self._current_sprite = sprite
+
+    def reset_sprite(self) -> None:
+        self._facing = None
+        self._rotation = 0.0
+
+    def set_sprite_rotation(self, rotation: float) -> None:
+        self._rotation = rotation
+
+    def set_sprite_direction(self, direction: Direction) -> None:
+        self._facing = direction
+
+    def cycle_animation_sprite(self, name: str) -> None:
+        sprite: SpriteAnimation = self._sprite_table.get_animation_sprite(name)
+        self._animation_indices[name] = sprite.get_next_index(self._animation_indices.get(name, 0))
+
+    def set_animation_index(self, name: str, index: int) -> None:
+        self._animation_indices[name] = index
+
+    def invalidate(self) -> None:
+        """Marks the area the entity was last drawn over as dirty, for when it stops being drawn."""
+        if self._drawn_rect is not None:
+            DirtyRects.mark(self._drawn_rect)
+            self._drawn_rect = None
+            self._drawn_image = None
+
+    def _draw(self, screen: pygame.Surface, image: pygame.Surface, position: pygame.Vector2) -> None:
+        rect: pygame.Rect = screen.blit(image, position)
+        if DirtyRects.enabled:
+            self._report_drawn(rect, image)
+
+    def _report_drawn(self, rect: pygame.Rect, image: pygame.Surface | None = None) -> None:
+        """Reports the old and new areas as dirty when the entity moved or changed image since the last frame."""
+        if rect != self._drawn_rect or image is not self._drawn_image:
+            if self._drawn_rect is not None:
+                DirtyRects.mark(self._drawn_rect)
+            DirtyRects.mark(rect)
+            self._drawn_rect = rect
+            self._drawn_image = image
+
+    def get_rendered_image(self) -> pygame.Surface:
+        """Resolves the current sprite or animation frame with this entity's facing and rotation applied."""
+        sprite: Sprite | SpriteAnimation = self._current_sprite
+        if isinstance(sprite, SpriteAnimation):
+            sprite = sprite.get_frame(self._animation_indices.get(sprite.name, 0))
+
+        return sprite.get_rendered_image(self._facing, self._rotation)
+
+    def tick(self, deltatime: float) -> None:
+        ...
+
+    def render(self, screen: pygame.Surface, deltatime: float) -> None:
+        if not self._visible:
+            return
+
+        if self._current_sprite:
+            # mask: pygame.mask.Mask = pygame.mask.from_surface(self.get_rendered_image())
+            # mask_surface: pygame.Surface = mask.to_surface()
+            # Check rect collision first, then check mask collision
+
+            self._draw(screen, self.get_rendered_image(), self._position)
+        else:
+            draw_rect(screen, (255, 0, 0), self.get_collider_rect())
+            draw_rect(screen, (255, 255, 255,), self.get_collider_rect(), 1)
+            if DirtyRects.enabled:
+                self._report_drawn(self.get_collider_rect())
\ No newline at end of file
@@ -1,54 +1,220 @@
-import pygame
-
-from typing import overload
-
-from core.entity.entity import Entity
-
-from core.interfaces.tickable import Tickable
-from core.interfaces.renderable import Renderable
-from core.interfaces.listener import EventListener
-
-class EntityManager(Tickable, Renderable, EventListener):
-    def __init__(self) -> None:
-        EventListener.__init__(self)
-        self._entities: list[Entity] = []
-
-    @property
-    def entities(self) -> list[Entity]:
-        return self._entities
-    
-    @overload
-    def add(self, entity: Entity) -> None:
-        ...
-
-    @overload
-    def add(self, entities: list[Entity]) -> None:
-        ...
-
-    @overload
-    def add(self, *entities: Entity) -> None:
-        ...
-
-    def add(self, *entities: Entity | list[Entity]) -> None:
-        if len(entities) == 1:
-            if isinstance(entities[0], list):
-                self.add(*entities[0])
-            else:
-                self._add_entity(entities[0])
-        else:
-            for entity in entities:
-                self._add_entity(entity)
-
-    def _add_entity(self, entity: Entity) -> None:
-        if entity not in self._entities:
-            self._entities.append(entity)
-
-    def remove(self, entity: Entity) -> None:
-        if entity in self._entities:
-            self._entities.remove(entity)
-
-    def tick(self, deltatime: float) -> None:
-        ...
-
-    def render(self, screen: pygame.Surface, deltatime: float) -> None:
-        ...
\ No newline at end of file
+import pygame
+
+from operator import attrgetter
+from typing import Final, Iterator, overload
+
+from core.entity.entity import Entity
+from core.render.camera import Camera
+from core.render.spatial_hash import SpatialHash
+
+from core.interfaces.tickable import Tickable
+from core.interfaces.renderable import Renderable
+from core.interfaces.listener import EventListener
+from core.event.bus import EventBus
+from core.event.events import EngineEvent
+
+CULL_MARGIN: Final[int] = 64
+# Below the default priority, so managed entities tick after the world steps and draw over its body shapes
+PRIORITY: Final[int] = 0
+
+class EntityManager(Tickable, Renderable, EventListener):
+    def __init__(self) -> None:
+        EventBus.subscribe(EngineEvent.TICK, self.tick, priority = PRIORITY)
+        EventBus.subscribe(EngineEvent.RENDER, self.render, priority = PRIORITY)
+
+        self._entities: list[Entity] = []
+        self._slots: dict[int, int] = {}
+        self._next_id: int = 0
+        self._types: dict[type, dict[int, Entity]] = {}
+        self._tags: dict[str, dict[int, Entity]] = {}
+        self._pending_add: dict[Entity, None] = {}
+        self._pending_remove: dict[Entity, None] = {}
+
+        self._spatial_hash: SpatialHash = SpatialHash()
+        self._camera: Camera | None = None
+        self._visible: set[Entity] = set()
+
+    @property
+    def entities(self) -> list[Entity]:
+        return self._entities
+    
+    @property
+    def spatial_hash(self) -> SpatialHash:
+        return self._spatial_hash
+    
+    @property
+    def camera(self) -> Camera | None:
+        return self._camera
+    
+    @camera.setter
+    def camera(self, camera: Camera | None) -> None:
+        """Culls entities outside the camera's view; without a camera every entity renders."""
+        self._camera = camera
+        self._visible = set(self._entities)
+        for entity in self._entities:
+            entity.visible = True
+
+    def __len__(self) -> int:
+        return len(self._entities)
+    
+    def __contains__(self, entity: Entity) -> bool:
+        slot: int | None = self._slots.get(entity._entity_id)
+        return slot is not None and self._entities[slot] is entity
+    
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self._entities)
+
+    def get(self, entity_id: int) -> Entity | None:
+        slot: int | None = self._slots.get(entity_id)
+        return self._entities[slot] if slot is not None else None
+
+    def get_by_type(self, entity_type: type, *, exact: bool = False) -> list[Entity]:
+        """Returns the managed entities of a type, including subclasses unless exact is set."""
+        if exact:
+            return list(self._types.get(entity_type, {}).values())
+        
+        entities: list[Entity] = []
+        for indexed_type, indexed in self._types.items():
+            if issubclass(indexed_type, entity_type):
+                entities.extend(indexed.values())
+
+        return entities
+
+    def get_by_tag(self, tag: str) -> list[Entity]:
+        return list(self._tags.get(tag, {}).values())
+    
+    def add_tag(self, entity: Entity, tag: str) -> None:
+        entity._tags.add(tag)
+        if entity.entity_id is not None:
+            self._tags.setdefault(tag, {})[entity.entity_id] = entity
+
+    def remove_tag(self, entity: Entity, tag: str) -> None:
+        entity._tags.discard(tag)
+        if entity.entity_id is not None and tag in self._tags:
+            self._tags[tag].pop(entity.entity_id, None)
+
+    def get_visible(self) -> set[Entity]:
+        if self._camera is None:
+            return set(self._entities)
+        
+        return self._visible
+    
+    @overload
+    def add(self, entity: Entity) -> None:
+        ...
+
+    @overload
+    def add(self, entities: list[Entity]) -> None:
+        ...
+
+    @overload
+    def add(self, *entities: Entity) -> None:
+        ...
+
+    def add(self, *entities: Entity | list[Entity]) -> None:
+        """Queues entities to be added at the next frame boundary."""
+        if len(entities) == 1 and isinstance(entities[0], list):
+            entities = entities[0]
+
+        queued: list[Entity] = [entity for entity in entities if self._add_entity(entity)]
+        if queued:
+            # The manager drives its entities, so their own bus subscriptions are dropped now, in one pass per event, rather
+            # than at flush; otherwise an entity added before a frame is ticked by the bus and again by the manager
+            EventBus.unsubscribe_all(EngineEvent.TICK, [entity.tick for entity in queued])
+            EventBus.unsubscribe_all(EngineEvent.RENDER, [entity.render for entity in queued])
+
+    def _add_entity(self, entity: Entity) -> bool:
+        """Queues one entity and returns whether it was newly queued."""
+        if entity in self._pending_remove:
+            del self._pending_remove[entity]
+        elif entity not in self and entity not in self._pending_add:
+            self._pending_add[entity] = None
+            return True
+
+        return False
+
+    def remove(self, entity: Entity) -> None:
+        """Queues an entity to be removed at the next frame boundary. Removed entities are no longer ticked or rendered."""
+        if entity in self._pending_add:
+            del self._pending_add[entity]
+        elif entity in self:
+            self._pending_remove[entity] = None
+
+    def flush(self) -> None:
+        """Applies queued adds and removes; called by tick so that iteration never sees the list change."""
+        if self._pending_remove:
+            removed: list[Entity] = list(self._pending_remove)
+            self._pending_remove.clear()
+            for entity in removed:
+                self._remove_now(entity)
+
+        if self._pending_add:
+            added: list[Entity] = list(self._pending_add)
+            self._pending_add.clear()
+            for entity in added:
+                self._add_now(entity)
+
+    def _add_now(self, entity: Entity) -> None:
+        entity_id: int = self._next_id
+        self._next_id += 1
+
+        entity._entity_id = entity_id
+        self._slots[entity_id] = len(self._entities)
+        self._entities.append(entity)
+
+        self._types.setdefault(type(entity), {})[entity_id] = entity
+        for tag in entity._tags:
+            self._tags.setdefault(tag, {})[entity_id] = entity
+
+        entity.spatial_hash = self._spatial_hash
+        entity.visible = True
+        self._visible.add(entity)
+
+    def _remove_now(self, entity: Entity) -> None:
+        entity_id: int = entity.entity_id
+        slot: int = self._slots.pop(entity_id)
+
+        # Swap-remove: the last entity takes the freed slot
+        last: Entity = self._entities.pop()
+        if last is not entity:
+            self._entities[slot] = last
+            self._slots[last.entity_id] = slot
+
+        self._types[type(entity)].pop(entity_id, None)
+        for tag in entity._tags:
+            self._tags[tag].pop(entity_id, None)
+
+        entity._entity_id = None
+        entity.spatial_hash = None
+        entity.invalidate()
+        entity.visible = True
+        self._visible.discard(entity)
+
+    def _update_visibility(self) -> None:
+        # Only entities entering or leaving the view are touched, so the cost follows the visible set
+        visible: set[Entity] = self._camera.get_visible(self._spatial_hash, CULL_MARGIN)
+        for entity in self._visible - visible:
+            entity.visible = False
+        for entity in visible - self._visible:
+            entity.visible = True
+
+        self._visible = visible
+
+    def tick(self, deltatime: float) -> None:
+        self.flush()
+
+        for entity in self._entities:
+            entity.tick(deltatime)
+
+        if self._camera is not None:
+            self._update_visibility()
+
+    def render(self, screen: pygame.Surface, deltatime: float) -> None:
+        if self._camera is None:
+            for entity in self._entities:
+                entity.render(screen, deltatime)
+        else:
+            for entity in sorted(self._visible, key = _by_entity_id):
+                entity.render(screen, deltatime)
+
+_by_entity_id = attrgetter("_entity_id")
\ No newline at end of file
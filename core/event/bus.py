@@ -1,99 +1,173 @@
-from typing import Callable, Any
-from enum import Enum
-
-from core.event.exceptions import InvalidEventException
-
-_bus_subscribers: dict[str, list[dict]] = {}
-
-class EventBus:
-    @staticmethod
-    def subscribe(event: Enum | str, callback: Callable, /, *, priority: int = 1) -> int | None:
-        """Subscribes a method to an event."""
-        result = EventBus.validate_event(event)
-        if result is None:
-            return 0
-        
-        if isinstance(event, Enum):
-            event = event.value
-
-        # instance = getattr(callback, "__self__", None)
-        # if instance is None or not isinstance(instance, EventListener):
-        #     raise TypeError(f"Method '{callback.__name__}' must belong to a subclass of EventListener")
-
-        if event not in _bus_subscribers:
-            _bus_subscribers[event] = []
-
-        _bus_subscribers[event].append({"callback": callback, "priority": priority})
-        _bus_subscribers[event].sort(key = lambda sub: sub["priority"], reverse = True)
-
-    @staticmethod
-    def unsubscribe(event: Enum | str, callback: Callable, /) -> int | None:
-        """Unsubscribes a method from an event."""
-        result = EventBus.validate_event(event)
-        if result is None:
-            return 0
-        
-        if isinstance(event, Enum):
-            event = event.value
-
-        if event in _bus_subscribers:
-            _bus_subscribers[event] = [
-                sub for sub in _bus_subscribers[event] if sub["callback"] != callback
-            ]
-
-    @staticmethod
-    def emit(event: Enum | str, /, *args, **kwargs) -> int:
-        """Calls an event with optional data, invoking subscribed callbacks."""
-        result = EventBus.validate_event(event)
-        if result is None:
-            return 0
-        
-        if isinstance(event, Enum):
-            event = event.value
-
-        call_count = 0
-        if event in _bus_subscribers:
-            for subscriber in _bus_subscribers[event]:
-                subscriber["callback"](*args, **kwargs)
-                call_count += 1
-
-        return call_count
-
-    @staticmethod
-    def validate_event(event: Any, /) -> int | None:
-        """Validates that an event is an Enum or string."""
-        if not isinstance(event, (Enum, str)):
-            raise InvalidEventException(event)
-        return 1
-
-# class EventBusContextManager:
-#     """Context-managed event subscription with auto-unsubscribe on exit."""
-
-#     def __init__(self) -> None:
-#         self.__bus_subscribers: dict[str, list[dict]] = {}
-
-#     def on(self, event: Enum | str, /, *, priority: int = 1) -> Callable:
-#         """Decorator to subscribe a method with enforced EventListener membership."""
-
-#         if isinstance(event, Enum):
-#             event = event.value
-            
-#         def wrapper(callback: Callable) -> Callable:
-#             instance = getattr(callback, "__self__", None)
-#             if instance is None or not isinstance(instance, EventListener):
-#                 raise TypeError(f"Method '{callback.__name__}' must belong to a subclass of EventListener")
-
-#             EventBus.subscribe(event, callback, priority = priority)
-#             if event not in self.__bus_subscribers:
-#                 self.__bus_subscribers[event] = []
-#             self.__bus_subscribers[event].append({"callback": callback, "priority": priority})
-#             return callback
-#         return wrapper
-
-#     def __enter__(self) -> 'EventBusContextManager':
-#         return self
-
-#     def __exit__(self, exc_type, exc_value, traceback) -> None:
-#         for event, subscribers in self.__bus_subscribers.items():
-#             for subscriber in subscribers:
-#                 EventBus.unsubscribe(event, subscriber["callback"])
+from typing import Callable, Any, Iterable
+from enum import Enum
+from bisect import bisect_right
+
+from core.event.exceptions import InvalidEventException
+
+_bus_subscribers: dict[str, list[dict]] = {}
+_bus_priorities: dict[str, list[int]] = {}
+_bus_dispatch: dict[str, tuple[Callable, ...]] = {}
+
+class EventBus:
+    @staticmethod
+    def subscribe(event: Enum | str, callback: Callable, /, *, priority: int = 1) -> int | None:
+        """Subscribes a method to an event."""
+        result = EventBus.validate_event(event)
+        if result is None:
+            return 0
+        
+        if isinstance(event, Enum):
+            event = event.value
+
+        # instance = getattr(callback, "__self__", None)
+        # if instance is None or not isinstance(instance, EventListener):
+        #     raise TypeError(f"Method '{callback.__name__}' must belong to a subclass of EventListener")
+
+        if event not in _bus_subscribers:
+            _bus_subscribers[event] = []
+            _bus_priorities[event] = []
+
+        # Priorities are stored negated so the list stays ascending for bisect, and bisect_right
+        # keeps subscribers of equal priority in subscription order.
+        index: int = bisect_right(_bus_priorities[event], -priority)
+        _bus_priorities[event].insert(index, -priority)
+        _bus_subscribers[event].insert(index, {"callback": callback, "priority": priority})
+        _bus_dispatch.pop(event, None)
+
+    @staticmethod
+    def unsubscribe(event: Enum | str, callback: Callable, /) -> int | None:
+        """Unsubscribes a method from an event."""
+        result = EventBus.validate_event(event)
+        if result is None:
+            return 0
+        
+        if isinstance(event, Enum):
+            event = event.value
+
+        if event in _bus_subscribers:
+            _bus_subscribers[event] = [
+                sub for sub in _bus_subscribers[event] if sub["callback"] != callback
+            ]
+            _bus_priorities[event] = [-sub["priority"] for sub in _bus_subscribers[event]]
+            _bus_dispatch.pop(event, None)
+
+    @staticmethod
+    def unsubscribe_all(event: Enum | str, callbacks: Iterable[Callable], /) -> int | None:
+        """Unsubscribes several methods from an event in a single pass."""
+        result = EventBus.validate_event(event)
+        if result is None:
+            return 0
+        
+        if isinstance(event, Enum):
+            event = event.value
+
+        removed: set[Callable] = set(callbacks)
+        if event in _bus_subscribers and removed:
+            _bus_subscribers[event] = [
+                sub for sub in _bus_subscribers[event] if sub["callback"] not in removed
+            ]
+            _bus_priorities[event] = [-sub["priority"] for sub in _bus_subscribers[event]]
+            _bus_dispatch.pop(event, None)
+
+    @staticmethod
+    def clear(event: Enum | str | None = None, /) -> None:
+        """Removes every subscriber from an event, or from all events if none is given."""
+        if event is None:
+            _bus_subscribers.clear()
+            _bus_priorities.clear()
+            _bus_dispatch.clear()
+            return
+
+        EventBus.validate_event(event)
+        if isinstance(event, Enum):
+            event = event.value
+
+        _bus_subscribers.pop(event, None)
+        _bus_priorities.pop(event, None)
+        _bus_dispatch.pop(event, None)
+
+    @staticmethod
+    def emit(event: Enum | str, /, *args, **kwargs) -> int:
+        """Calls an event with optional data, invoking subscribed callbacks."""
+        result = EventBus.validate_event(event)
+        if result is None:
+            return 0
+        
+        if isinstance(event, Enum):
+            event = event.value
+
+        callbacks: tuple[Callable, ...] | None = _bus_dispatch.get(event)
+        if callbacks is None:
+            callbacks = EventBus._rebuild(event)
+
+        for callback in callbacks:
+            callback(*args, **kwargs)
+
+        return len(callbacks)
+
+    @staticmethod
+    def emit_fast(event: Enum, /, *args) -> int:
+        """Calls an Enum event with positional data, skipping validation. Meant for per-frame events like TICK and RENDER."""
+        callbacks: tuple[Callable, ...] | None = _bus_dispatch.get(event._value_)
+        if callbacks is None:
+            callbacks = EventBus._rebuild(event._value_)
+
+        for callback in callbacks:
+            callback(*args)
+
+        return len(callbacks)
+
+    @staticmethod
+    def subscriber_count(event: Enum | str, /) -> int:
+        """Returns the number of callbacks subscribed to an event."""
+        EventBus.validate_event(event)
+        if isinstance(event, Enum):
+            event = event.value
+
+        return len(_bus_subscribers.get(event, ()))
+
+    @staticmethod
+    def validate_event(event: Any, /) -> int | None:
+        """Validates that an event is an Enum or string."""
+        if not isinstance(event, (Enum, str)):
+            raise InvalidEventException(event)
+        return 1
+
+    @staticmethod
+    def _rebuild(event: str, /) -> tuple[Callable, ...]:
+        """Rebuilds the callback tuple that emit iterates, after subscriptions to an event changed."""
+        callbacks: tuple[Callable, ...] = tuple(sub["callback"] for sub in _bus_subscribers.get(event, ()))
+        _bus_dispatch[event] = callbacks
+        return callbacks
+
+# class EventBusContextManager:
+#     """Context-managed event subscription with auto-unsubscribe on exit."""
+
+#     def __init__(self) -> None:
+#         self.__bus_subscribers: dict[str, list[dict]] = {}
+
+#     def on(self, event: Enum | str, /, *, priority: int = 1) -> Callable:
+#         """Decorator to subscribe a method with enforced EventListener membership."""
+
+#         if isinstance(event, Enum):
+#             event = event.value
+            
+#         def wrapper(callback: Callable) -> Callable:
+#             instance = getattr(callback, "__self__", None)
+#             if instance is None or not isinstance(instance, EventListener):
+#                 raise TypeError(f"Method '{callback.__name__}' must belong to a subclass of EventListener")
+
+#             EventBus.subscribe(event, callback, priority = priority)
+#             if event not in self.__bus_subscribers:
+#                 self.__bus_subscribers[event] = []
+#             self.__bus_subscribers[event].append({"callback": callback, "priority": priority})
+#             return callback
+#         return wrapper
+
+#     def __enter__(self) -> 'EventBusContextManager':
+#         return self
+
+#     def __exit__(self, exc_type, exc_value, traceback) -> None:
+#         for event, subscribers in self.__bus_subscribers.items():
+#             for subscriber in subscribers:
+#                 EventBus.unsubscribe(event, subscriber["callback"])
@@ -1,2 +1,6 @@
-class Flags():
-    ...
\ No newline at end of file
+class Flags():
+    HEADLESS: int = 0b1
+    SKIP_RENDER: int = 0b10
+    DIRTY_RECTS: int = 0b100
+    PROFILE: int = 0b1000
+    PIPELINED: int = 0b10000
\ No newline at end of file
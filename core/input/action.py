@@ -1,8 +1,8 @@
-from enum import Enum
-
-class InputAction(Enum):
-    KEYDOWN = "keydown"
-    KEYUP = "keyup"
-    MOUSEBUTTONDOWN = "mousebuttondown"
-    MOUSEBUTTONUP = "mousebuttonup"
+from enum import Enum
+
+class InputAction(Enum):
+    KEYDOWN = "keydown"
+    KEYUP = "keyup"
+    MOUSEBUTTONDOWN = "mousebuttondown"
+    MOUSEBUTTONUP = "mousebuttonup"
     MOUSEMOTION = "mousemotion"
\ No newline at end of file
@@ -1,39 +1,117 @@
-from typing import overload
-
-from core.event.bus import EventBus
-from core.event.events import EngineEvent
-from core.interfaces.listener import EventListener
-
-from core.input.keyboard.key import Key
-
-class Keyboard(EventListener):
-    _keys: dict[int, bool] = {}
-
-    @staticmethod
-    def init() -> None:
-        for name, value in vars(Key).items():
-            if name.startswith("KEY_") and isinstance(value, int):
-                Keyboard._keys[value] = False
-                
-        EventBus.subscribe(EngineEvent.KEYDOWN, lambda key: Keyboard._set_pressed(key, True))
-        EventBus.subscribe(EngineEvent.KEYUP, lambda key: Keyboard._set_pressed(key, False))
-
-    @overload
-    @staticmethod
-    def get_pressed(key: int) -> bool:
-        ...
-
-    @overload
-    @staticmethod
-    def get_pressed(key: Key) -> bool:
-        ...
-        
-    def get_pressed(key: Key | int) -> bool:
-        if isinstance(key, Key):
-            return Keyboard._keys[key.code]
-        elif isinstance(key, int):
-            return Keyboard._keys[key]
-        
-    @staticmethod
-    def _set_pressed(key: Key, pressed: bool) -> None:
-        Keyboard._keys[key.code] = pressed
\ No newline at end of file
+from typing import Final, overload
+
+from core.event.bus import EventBus
+from core.event.events import EngineEvent
+from core.interfaces.listener import EventListener
+
+from core.input.keyboard.key import Key
+
+# SDL keycodes are either a character code or a scancode (always below 512) with bit 30 set. Folding bit 30 down to bit 9
+# gives the scancode keys and characters below 0x200, which covers pygame's named K_* constants, their own slot in a 1 KiB
+# table: slot = (code & 0x1FF) | 0x200 if code & 0x40000000 else code. Layout-dependent characters above 0x1FF (Cyrillic,
+# Greek, ...) would collide with those, so they get one of the extra slots past the table the first time they are seen. The
+# extra slots are reserved up front, as get_state's views would stop the bytearray from growing
+SLOT_COUNT: Final[int] = 0x400
+EXTRA_SLOT_COUNT: Final[int] = 0x100
+
+def _slot(code: int) -> int:
+    if code < 0x200 or code & 0x40000000:
+        return (code & 0x1FF) | ((code >> 21) & 0x200)
+
+    slot: int | None = Keyboard._extra_slots.get(code)
+    if slot is None:
+        # Past the reserve, which no keyboard layout comes close to, the last slot is shared
+        slot = SLOT_COUNT + min(len(Keyboard._extra_slots), EXTRA_SLOT_COUNT - 1)
+        Keyboard._extra_slots[code] = slot
+
+    return slot
+
+class Keyboard(EventListener):
+    _state: bytearray = bytearray(SLOT_COUNT + EXTRA_SLOT_COUNT)
+    _previous: bytearray = bytearray(SLOT_COUNT + EXTRA_SLOT_COUNT)
+    # Keys pressed and released within one frame, released on the next update so the press is still seen
+    _deferred_releases: set[int] = set()
+    # Keycodes outside the table -> their slot past SLOT_COUNT
+    _extra_slots: dict[int, int] = {}
+
+    @staticmethod
+    def init() -> None:
+        Keyboard.reset()
+        EventBus.subscribe(EngineEvent.KEYDOWN, Keyboard._on_key_down)
+        EventBus.subscribe(EngineEvent.KEYUP, Keyboard._on_key_up)
+
+    @staticmethod
+    def reset() -> None:
+        Keyboard._state[:] = bytes(SLOT_COUNT + EXTRA_SLOT_COUNT)
+        Keyboard._previous[:] = bytes(SLOT_COUNT + EXTRA_SLOT_COUNT)
+        Keyboard._deferred_releases.clear()
+
+    @staticmethod
+    def update() -> None:
+        """Makes the current state the previous frame's; called by the engine at the start of every frame, before input events."""
+        Keyboard._previous[:] = Keyboard._state
+        for slot in Keyboard._deferred_releases:
+            Keyboard._state[slot] = 0
+        Keyboard._deferred_releases.clear()
+
+    @staticmethod
+    def slot(code: int) -> int:
+        """Index of a keycode in get_state and snapshot."""
+        return _slot(code)
+
+    @overload
+    @staticmethod
+    def get_pressed(key: int) -> bool:
+        ...
+
+    @overload
+    @staticmethod
+    def get_pressed(key: Key) -> bool:
+        ...
+
+    @staticmethod
+    def get_pressed(key: Key | int) -> bool:
+        if isinstance(key, Key):
+            key = key.code
+        return Keyboard._state[_slot(key)] != 0
+
+    @staticmethod
+    def just_pressed(key: Key | int) -> bool:
+        """Whether the key went down since the previous frame."""
+        if isinstance(key, Key):
+            key = key.code
+        slot: int = _slot(key)
+        return Keyboard._state[slot] > Keyboard._previous[slot]
+
+    @staticmethod
+    def just_released(key: Key | int) -> bool:
+        """Whether the key went up since the previous frame."""
+        if isinstance(key, Key):
+            key = key.code
+        slot: int = _slot(key)
+        return Keyboard._state[slot] < Keyboard._previous[slot]
+
+    @staticmethod
+    def get_state() -> memoryview:
+        """A read-only view of the live state, one byte per slot. Cheaper than snapshot, but changes as events arrive."""
+        return memoryview(Keyboard._state).toreadonly()
+
+    @staticmethod
+    def snapshot() -> bytes:
+        """A copy of this frame's state, one byte per slot, indexed with Keyboard.slot."""
+        return bytes(Keyboard._state)
+
+    @staticmethod
+    def _on_key_down(key: Key) -> None:
+        slot: int = _slot(key.code)
+        Keyboard._state[slot] = 1
+        # Pressed again after a release this frame, so the key is held and the pending release no longer applies
+        Keyboard._deferred_releases.discard(slot)
+
+    @staticmethod
+    def _on_key_up(key: Key) -> None:
+        slot: int = _slot(key.code)
+        if Keyboard._previous[slot] == 0 and Keyboard._state[slot]:
+            Keyboard._deferred_releases.add(slot)
+        else:
+            Keyboard._state[slot] = 0
\ No newline at end of file
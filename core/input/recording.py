@@ -0,0 +1,145 @@
+import pygame
+import struct
+
+from time import perf_counter
+from typing import BinaryIO, Final, Iterable
+
+MAGIC: Final[bytes] = b"INPT"
+VERSION: Final[int] = 2
+
+_HEADER: Final[struct.Struct] = struct.Struct("<4sH")
+# (record type, frame index, deltatime). The deltatime is kept as a double, exactly as the engine used it, since the physics
+# accumulator sums it in double precision and a rounded value can move a fixed step onto a different frame
+_FRAME: Final[struct.Struct] = struct.Struct("<BId")
+# (record type, key, scancode, mod, unicode byte length) followed by the UTF-8 text
+_KEY: Final[struct.Struct] = struct.Struct("<BiiHB")
+# (record type, button)
+_BUTTON: Final[struct.Struct] = struct.Struct("<BB")
+# (record type, x, y, relative x, relative y, button bitmask)
+_MOTION: Final[struct.Struct] = struct.Struct("<BiiiiB")
+_TYPE: Final[struct.Struct] = struct.Struct("<B")
+
+FRAME: Final[int] = 0
+KEYDOWN: Final[int] = 1
+KEYUP: Final[int] = 2
+MOUSEBUTTONDOWN: Final[int] = 3
+MOUSEBUTTONUP: Final[int] = 4
+MOUSEMOTION: Final[int] = 5
+QUIT: Final[int] = 6
+
+class InputRecorder():
+    """Writes the input events the engine handles, one frame header with its deltatime before each frame's events, to a binary log."""
+
+    def __init__(self, path: str) -> None:
+        self._path: str = path
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION))
+        self._frames: int = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def frames(self) -> int:
+        return self._frames
+
+    def record_frame(self, frame: int, deltatime: float, events: Iterable[pygame.event.Event]) -> None:
+        write = self._file.write
+        write(_FRAME.pack(FRAME, frame, deltatime))
+        for event in events:
+            kind: int = event.type
+            if kind == pygame.MOUSEMOTION:
+                buttons: int = sum(1 << index for index, pressed in enumerate(event.buttons) if pressed)
+                write(_MOTION.pack(MOUSEMOTION, event.pos[0], event.pos[1], event.rel[0], event.rel[1], buttons))
+            elif kind == pygame.KEYDOWN or kind == pygame.KEYUP:
+                text: bytes = event.unicode.encode()
+                write(_KEY.pack(KEYDOWN if kind == pygame.KEYDOWN else KEYUP, event.key, event.scancode, event.mod, len(text)))
+                write(text)
+            elif kind == pygame.MOUSEBUTTONDOWN or kind == pygame.MOUSEBUTTONUP:
+                write(_BUTTON.pack(MOUSEBUTTONDOWN if kind == pygame.MOUSEBUTTONDOWN else MOUSEBUTTONUP, event.button))
+            elif kind == pygame.QUIT:
+                write(_TYPE.pack(QUIT))
+
+        self._frames += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+class InputReplay():
+    """Reads a log written by InputRecorder back one frame at a time, as pygame events the engine handles like live input."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._data: bytes = file.read()
+
+        magic, version = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a version {VERSION} input recording")
+
+        self._path: str = path
+        self._offset: int = _HEADER.size
+        self._frames: int = 0
+        self._started: float | None = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def frames(self) -> int:
+        """How many frames have been read so far."""
+        return self._frames
+
+    @property
+    def finished(self) -> bool:
+        return self._offset >= len(self._data)
+
+    @property
+    def elapsed(self) -> float:
+        """Wall-clock seconds since the first frame was read."""
+        return perf_counter() - self._started if self._started is not None else 0.0
+
+    def next_frame(self) -> tuple[int, float, list[pygame.event.Event]] | None:
+        """Returns the next frame's index, deltatime and events, or None at the end of the log."""
+        data: bytes = self._data
+        if self._offset >= len(data):
+            return None
+
+        if self._started is None:
+            self._started = perf_counter()
+
+        kind, frame, deltatime = _FRAME.unpack_from(data, self._offset)
+        assert kind == FRAME, f"Corrupt input recording at byte {self._offset}"
+        offset: int = self._offset + _FRAME.size
+        events: list[pygame.event.Event] = []
+
+        while offset < len(data) and data[offset] != FRAME:
+            kind = data[offset]
+            if kind == MOUSEMOTION:
+                _, x, y, relative_x, relative_y, buttons = _MOTION.unpack_from(data, offset)
+                offset += _MOTION.size
+                events.append(pygame.event.Event(pygame.MOUSEMOTION, pos = (x, y), rel = (relative_x, relative_y), buttons = tuple(bool(buttons & (1 << index)) for index in range(3))))
+            elif kind == KEYDOWN or kind == KEYUP:
+                _, key, scancode, mod, length = _KEY.unpack_from(data, offset)
+                offset += _KEY.size
+                text: str = data[offset:offset + length].decode()
+                offset += length
+                events.append(pygame.event.Event(pygame.KEYDOWN if kind == KEYDOWN else pygame.KEYUP, key = key, scancode = scancode, mod = mod, unicode = text))
+            elif kind == MOUSEBUTTONDOWN or kind == MOUSEBUTTONUP:
+                _, button = _BUTTON.unpack_from(data, offset)
+                offset += _BUTTON.size
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN if kind == MOUSEBUTTONDOWN else pygame.MOUSEBUTTONUP, button = button))
+            elif kind == QUIT:
+                offset += _TYPE.size
+                events.append(pygame.event.Event(pygame.QUIT))
+            else:
+                raise ValueError(f"Unknown record type {kind} at byte {offset} of '{self._path}'")
+
+        self._offset = offset
+        self._frames += 1
+        return (frame, deltatime, events)
\ No newline at end of file
@@ -1,24 +1,264 @@
-from colorama import Fore
-from datetime import datetime
-
-class Logger():
-    def __init__(self, name: str) -> None:
-        self.name: str = name
-
-    def _get_timestamp(self) -> str:
-        return datetime.now().strftime("%H:%M:%S")
-
-    def debug(self, message: str) -> None:
-        print(f"[{self._get_timestamp()}] [{self.name}/DEBUG]: {message}")
-
-    def info(self, message: str) -> None:
-        print(f"[{self._get_timestamp()}] [{self.name}/{Fore.BLUE}INFO{Fore.RESET}]: {message}")
-
-    def warn(self, message: str) -> None:
-        print(f"[{self._get_timestamp()}] [{self.name}/{Fore.LIGHTYELLOW_EX}WARN{Fore.RESET}]: {message}")
-
-    def error(self, message: str) -> None:
-        print(f"[{self._get_timestamp()}] [{self.name}/{Fore.LIGHTRED_EX}ERROR{Fore.RESET}]: {message}")
-
-    def critical(self, message: str) -> None:
-        print(f"[{self._get_timestamp()}] [{self.name}/{Fore.RED}CRITICAL{Fore.RESET}]: {message}")
\ No newline at end of file
+import atexit
+import json
+import queue
+import struct
+import sys
+import threading
+import time
+
+from colorama import Fore
+from enum import Enum, IntEnum
+from typing import BinaryIO, Callable, Final, TextIO
+
+class LogLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARN = 30
+    ERROR = 40
+    CRITICAL = 50
+
+class LogFormat(Enum):
+    JSON_LINES = "jsonl"
+    BINARY = "binary"
+
+_LABELS: Final[dict[int, str]] = {
+    LogLevel.DEBUG: "DEBUG",
+    LogLevel.INFO: f"{Fore.BLUE}INFO{Fore.RESET}",
+    LogLevel.WARN: f"{Fore.LIGHTYELLOW_EX}WARN{Fore.RESET}",
+    LogLevel.ERROR: f"{Fore.LIGHTRED_EX}ERROR{Fore.RESET}",
+    LogLevel.CRITICAL: f"{Fore.RED}CRITICAL{Fore.RESET}",
+}
+
+# Binary sink records: (unix time, level, logger name byte length, message byte length) followed by both UTF-8 strings
+_RECORD: Final[struct.Struct] = struct.Struct("<dBHI")
+# Longest flush() waits for the writer, so a stuck sink cannot hang the process on exit
+FLUSH_TIMEOUT: Final[float] = 5.0
+
+Record = tuple[float, int, str, str]
+
+class Logger():
+    """Named logger. Messages below the logger's level are dropped before any formatting; the rest are queued and written by a
+    background thread, so logging never blocks the caller on the terminal or a file."""
+
+    # Instances read the global level through the class until set_level gives them their own
+    level: int = LogLevel.INFO
+
+    _queue: queue.SimpleQueue[Record | Callable[[], None]] = queue.SimpleQueue()
+    _writer: threading.Thread | None = None
+    _writer_lock: threading.Lock = threading.Lock()
+    _sink: TextIO | BinaryIO | None = None
+    _sink_format: LogFormat = LogFormat.JSON_LINES
+    # Rate-limited call sites: (code object id, bytecode offset) -> [time of the last emitted message, messages suppressed since].
+    # Keyed by id as hashing a code object hashes its whole body
+    _call_sites: dict[tuple[int, int], list] = {}
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+
+    @staticmethod
+    def set_global_level(level: int) -> None:
+        Logger.level = level
+
+    def set_level(self, level: int | None) -> None:
+        """Overrides the global level for this logger; None goes back to following it."""
+        if level is not None:
+            self.level = level
+        elif "level" in self.__dict__:
+            del self.level
+
+    def enabled(self, level: int) -> bool:
+        """Whether a message at this level would be logged, for guarding arguments that are expensive to build."""
+        return level >= self.level
+
+    def debug(self, message: str, *args: object, every: float | None = None) -> None:
+        if self.level <= LogLevel.DEBUG:
+            self._log(LogLevel.DEBUG, message, args, every)
+
+    def info(self, message: str, *args: object, every: float | None = None) -> None:
+        if self.level <= LogLevel.INFO:
+            self._log(LogLevel.INFO, message, args, every)
+
+    def warn(self, message: str, *args: object, every: float | None = None) -> None:
+        if self.level <= LogLevel.WARN:
+            self._log(LogLevel.WARN, message, args, every)
+
+    def error(self, message: str, *args: object, every: float | None = None) -> None:
+        if self.level <= LogLevel.ERROR:
+            self._log(LogLevel.ERROR, message, args, every)
+
+    def critical(self, message: str, *args: object, every: float | None = None) -> None:
+        if self.level <= LogLevel.CRITICAL:
+            self._log(LogLevel.CRITICAL, message, args, every)
+            # Likely the last thing said before a crash, so make sure it is out
+            Logger.flush()
+
+    def _log(self, level: int, message: str, args: tuple[object, ...], every: float | None) -> None:
+        """Applies the rate limit, formats %-style arguments and queues the message. Arguments are formatted here rather than on the
+        writer thread, as they are often mutable (vectors, lists) and may have changed by the time it runs."""
+        now: float = time.time()
+        suppressed: int = 0
+        if every is not None:
+            # Two frames up is the debug/info/... caller
+            frame = sys._getframe(2)
+            site: tuple[int, int] = (id(frame.f_code), frame.f_lasti)
+            state: list | None = Logger._call_sites.get(site)
+            if state is None:
+                Logger._call_sites[site] = [now, 0]
+            elif now - state[0] < every:
+                state[1] += 1
+                return
+            else:
+                suppressed = state[1]
+                state[0] = now
+                state[1] = 0
+
+        if args:
+            message = message % args
+        if suppressed:
+            message = f"{message} ({suppressed} more suppressed)"
+
+        if Logger._writer is None:
+            Logger._start_writer()
+        Logger._queue.put((now, level, self.name, message))
+
+    @staticmethod
+    def set_sink(path: str | None, format: LogFormat = LogFormat.JSON_LINES) -> None:
+        """Also writes every message to a file, as JSON lines or packed binary records. None closes the current sink."""
+        file: TextIO | BinaryIO | None = None
+        if path is not None:
+            file = open(path, "w", encoding = "utf-8") if format == LogFormat.JSON_LINES else open(path, "wb")
+
+        def swap() -> None:
+            if Logger._sink is not None:
+                Logger._sink.close()
+            Logger._sink = file
+            Logger._sink_format = format
+
+        # Swapped on the writer thread, between batches, so no message is split across files
+        Logger._submit(swap)
+
+    @staticmethod
+    def flush() -> None:
+        """Blocks until everything logged so far has been written."""
+        writer: threading.Thread | None = Logger._writer
+        if writer is None or threading.current_thread() is writer or not writer.is_alive():
+            return
+
+        done: threading.Event = threading.Event()
+        Logger._queue.put(done.set)
+        done.wait(FLUSH_TIMEOUT)
+
+    @staticmethod
+    def _submit(command: Callable[[], None]) -> None:
+        if Logger._writer is None:
+            Logger._start_writer()
+        Logger._queue.put(command)
+
+    @staticmethod
+    def _start_writer() -> None:
+        with Logger._writer_lock:
+            if Logger._writer is not None:
+                return
+
+            Logger._writer = threading.Thread(target = Logger._run_writer, name = "logger", daemon = True)
+            Logger._writer.start()
+            atexit.register(Logger._shutdown)
+
+    @staticmethod
+    def _shutdown() -> None:
+        Logger.flush()
+        sink: TextIO | BinaryIO | None = Logger._sink
+        Logger._sink = None
+        if sink is not None:
+            try:
+                sink.close()
+            except Exception as error:
+                Logger._report(f"Logger sink failed to close: {error!r}")
+
+    @staticmethod
+    def _run_writer() -> None:
+        # strftime is the slow part of a line, and every message within one second shares the result
+        stamped_second: int = -1
+        timestamp: str = ""
+
+        while True:
+            batch: list[Record | Callable[[], None]] = [Logger._queue.get()]
+            try:
+                while len(batch) < 256:
+                    batch.append(Logger._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            lines: list[str] = []
+            records: list[Record] = []
+            for item in batch:
+                if callable(item):
+                    # Commands (sink swaps, flushes) run in order with the messages around them
+                    Logger._write(lines, records)
+                    lines = []
+                    records = []
+                    try:
+                        item()
+                    except Exception as error:
+                        Logger._report(f"Logger command {item!r} failed: {error!r}")
+                    continue
+
+                created, level, name, message = item
+                second: int = int(created)
+                if second != stamped_second:
+                    stamped_second = second
+                    timestamp = time.strftime("%H:%M:%S", time.localtime(created))
+                lines.append(f"[{timestamp}] [{name}/{_LABELS[level]}]: {message}\n")
+                records.append(item)
+
+            Logger._write(lines, records)
+
+    @staticmethod
+    def _write(lines: list[str], records: list[Record]) -> None:
+        if not lines:
+            return
+
+        try:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            # stdout is gone (closed pipe, interpreter shutting down); the file sink still gets the messages
+            pass
+
+        sink: TextIO | BinaryIO | None = Logger._sink
+        if sink is None:
+            return
+
+        try:
+            Logger._write_sink(sink, records)
+        except Exception as error:
+            # Keep logging to the console rather than let the writer thread die
+            Logger._report(f"Logger sink failed, closing it: {error!r}")
+            Logger._sink = None
+            try:
+                sink.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _write_sink(sink: TextIO | BinaryIO, records: list[Record]) -> None:
+        if Logger._sink_format == LogFormat.JSON_LINES:
+            sink.write("".join(json.dumps({"time": created, "level": LogLevel(level).name, "logger": name, "message": message}) + "\n" for created, level, name, message in records))
+        else:
+            chunks: list[bytes] = []
+            for created, level, name, message in records:
+                name_bytes: bytes = name.encode()
+                message_bytes: bytes = message.encode()
+                chunks.append(_RECORD.pack(created, level, len(name_bytes), len(message_bytes)))
+                chunks.append(name_bytes)
+                chunks.append(message_bytes)
+            sink.write(b"".join(chunks))
+
+        sink.flush()
+
+    @staticmethod
+    def _report(message: str) -> None:
+        try:
+            sys.stderr.write(message + "\n")
+        except (OSError, ValueError):
+            pass
\ No newline at end of file
@@ -0,0 +1,339 @@
+import numpy as np
+import pygame
+
+from Box2D import b2Body
+from typing import Final
+
+from core.render.coordinates import CoordinateTransform
+from core.render.dirty_rects import DirtyRects
+from core.render.snapshot import draw_polygons
+from core.render.spatial_hash import SpatialHash
+
+MAX_VERTICES: Final[int] = 8
+# Cell range of bodies not yet placed in the spatial hash
+NO_CELL: Final[int] = np.iinfo(np.int64).min
+
+class BodyBatch():
+    def __init__(self, transform: CoordinateTransform, capacity: int = 64) -> None:
+        self._transform: CoordinateTransform = transform
+        self._capacity: int = 0
+
+        self._bodies: list[b2Body] = []
+        self._indices: dict[b2Body, int] = {}
+        self._colors: list[tuple[int, int, int] | None] = []
+        self._spatial_hash: SpatialHash | None = None
+        self._index_dirty: bool = False
+
+        self._allocate(capacity)
+
+    @property
+    def bodies(self) -> list[b2Body]:
+        return self._bodies
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def __contains__(self, body: b2Body) -> bool:
+        return body in self._indices
+
+    @property
+    def transform(self) -> CoordinateTransform:
+        """World to screen transform, shared with the World that owns the batch."""
+        return self._transform
+
+    @property
+    def spatial_hash(self) -> SpatialHash | None:
+        return self._spatial_hash
+
+    @spatial_hash.setter
+    def spatial_hash(self, spatial_hash: SpatialHash | None) -> None:
+        """Indexes every tracked body by its screen bounds in the given spatial hash, which is then kept up to date after each step."""
+        if self._spatial_hash is not None:
+            self._spatial_hash.clear()
+
+        self._spatial_hash = spatial_hash
+        self._cells[:] = NO_CELL
+        self._index_dirty = True
+
+    def _allocate(self, capacity: int) -> None:
+        count: int = len(self._bodies)
+
+        def grow(array: np.ndarray | None, shape: tuple[int, ...], dtype: type = np.float64) -> np.ndarray:
+            grown: np.ndarray = np.zeros((capacity, *shape), dtype = dtype)
+            if array is not None:
+                grown[:count] = array[:count]
+            return grown
+
+        first: bool = self._capacity == 0
+        self._counts: np.ndarray = grow(None if first else self._counts, (), np.int32)
+        self._local: np.ndarray = grow(None if first else self._local, (MAX_VERTICES, 2))
+        self._current: np.ndarray = grow(None if first else self._current, (3,))
+        self._previous: np.ndarray = grow(None if first else self._previous, (3,))
+        self._drawn: np.ndarray = grow(None if first else self._drawn, (), np.bool_)
+        self._radius: np.ndarray = grow(None if first else self._radius, ())
+        self._cells: np.ndarray = grow(None if first else self._cells, (4,), np.int64)
+        # Screen bounds (left, top, right, bottom) each body was last drawn at, for dirty-rect rendering
+        self._bounds: np.ndarray = grow(None if first else self._bounds, (4,), np.int64)
+        self._was_drawn: np.ndarray = grow(None if first else self._was_drawn, (), np.bool_)
+
+        # Scratch buffers, fully rewritten every frame
+        self._interpolated: np.ndarray = np.zeros((capacity, 3))
+        self._cos: np.ndarray = np.zeros((capacity, 1))
+        self._sin: np.ndarray = np.zeros((capacity, 1))
+        self._scratch: np.ndarray = np.zeros((capacity, MAX_VERTICES))
+        self._screen: np.ndarray = np.zeros((capacity, MAX_VERTICES, 2))
+
+        self._capacity = capacity
+
+    def reserve(self, count: int) -> None:
+        """Grows the arrays once to fit count more bodies, instead of doubling repeatedly during a bulk add."""
+        needed: int = len(self._bodies) + count
+        if needed > self._capacity:
+            capacity: int = self._capacity
+            while capacity < needed:
+                capacity *= 2
+            self._allocate(capacity)
+
+    def add(self, body: b2Body, color: tuple[int, int, int] | None = None) -> int:
+        """Tracks a body, caching the local vertices of its first fixture. Bodies without a color are tracked for interpolation only."""
+        if body in self._indices:
+            self.set_color(body, color)
+            return self._indices[body]
+
+        index: int = len(self._bodies)
+        if index == self._capacity:
+            self._allocate(self._capacity * 2)
+
+        vertices: list[tuple[float, float]] = list(body.fixtures[0].shape.vertices)[:MAX_VERTICES]
+        count: int = len(vertices)
+        # Padding with the first vertex keeps per-body min/max bounds correct
+        vertices.extend([vertices[0]] * (MAX_VERTICES - count))
+
+        self._bodies.append(body)
+        self._indices[body] = index
+        self._colors.append(color)
+        self._counts[index] = count
+        self._local[index] = vertices
+        self._drawn[index] = color is not None
+        self._radius[index] = np.hypot(self._local[index, :, 0], self._local[index, :, 1]).max()
+        self._cells[index] = NO_CELL
+        self._was_drawn[index] = False
+        self._index_dirty = True
+
+        position = body.position
+        self._current[index] = (position[0], position[1], body.angle)
+        self._previous[index] = self._current[index]
+
+        return index
+
+    def remove(self, body: b2Body) -> None:
+        index: int | None = self._indices.pop(body, None)
+        if index is None:
+            return
+
+        self._invalidate(index)
+
+        last: int = len(self._bodies) - 1
+        if index != last:
+            moved: b2Body = self._bodies[last]
+            self._bodies[index] = moved
+            self._colors[index] = self._colors[last]
+            self._indices[moved] = index
+
+            for array in (self._counts, self._local, self._current, self._previous, self._drawn, self._radius, self._cells, self._bounds, self._was_drawn):
+                array[index] = array[last]
+
+        self._bodies.pop()
+        self._colors.pop()
+
+        if self._spatial_hash is not None:
+            self._spatial_hash.remove(body)
+
+    def set_color(self, body: b2Body, color: tuple[int, int, int] | None) -> None:
+        index: int = self._indices[body]
+        self._invalidate(index)
+        self._colors[index] = color
+        self._drawn[index] = color is not None
+
+    def _invalidate(self, index: int) -> None:
+        """Marks where a body was last drawn as dirty and forces it to be reported again the next time it is drawn."""
+        if self._was_drawn[index]:
+            left, top, right, bottom = self._bounds[index].tolist()
+            DirtyRects.mark((left, top, right - left, bottom - top))
+            self._was_drawn[index] = False
+
+    def store_previous(self) -> None:
+        """Copies the current transforms into the previous ones; called right before a physics step."""
+        count: int = len(self._bodies)
+        self._previous[:count] = self._current[:count]
+
+    def refresh(self) -> None:
+        """Reads back the transforms of awake bodies after a physics step. Sleeping bodies keep their cached rows."""
+        rows: list[int] = []
+        transforms: list[tuple[float, float, float]] = []
+
+        for index, body in enumerate(self._bodies):
+            if body.awake:
+                position = body.position
+                rows.append(index)
+                transforms.append((position[0], position[1], body.angle))
+
+        if rows:
+            self._current[rows] = transforms
+            self._index_dirty = True
+
+    def update_index(self) -> None:
+        """Moves bodies whose conservative screen bounds now cover different cells. Only those bodies touch the spatial hash."""
+        self._index_dirty = False
+        count: int = len(self._bodies)
+        if self._spatial_hash is None or count == 0:
+            return
+
+        cell_size: int = self._spatial_hash.cell_size
+        (scale_x, scale_y), (offset_x, offset_y) = self._transform.scale, self._transform.offset
+        radius: np.ndarray = self._radius[:count] * max(abs(scale_x), abs(scale_y))
+        x: np.ndarray = self._current[:count, 0] * scale_x + offset_x
+        y: np.ndarray = self._current[:count, 1] * scale_y + offset_y
+
+        cells: np.ndarray = np.empty((count, 4), dtype = np.int64)
+        cells[:, 0] = np.floor((x - radius) / cell_size)
+        cells[:, 1] = np.floor((y - radius) / cell_size)
+        cells[:, 2] = np.floor((x + radius) / cell_size)
+        cells[:, 3] = np.floor((y + radius) / cell_size)
+
+        changed: np.ndarray = np.flatnonzero((cells != self._cells[:count]).any(axis = 1))
+        if len(changed) == 0:
+            return
+
+        bodies: list[b2Body] = self._bodies
+        for row, cell_range in zip(changed.tolist(), cells[changed].tolist()):
+            self._spatial_hash.move(bodies[row], tuple(cell_range))
+
+        self._cells[:count] = cells
+
+    def query(self, view: pygame.Rect) -> np.ndarray:
+        """Returns the rows of bodies the spatial hash places inside the view."""
+        if self._index_dirty:
+            self.update_index()
+
+        found: set[b2Body] = self._spatial_hash.query(view)
+        indices: dict[b2Body, int] = self._indices
+        return np.fromiter((indices[body] for body in found), dtype = np.intp, count = len(found))
+
+    def get_interpolated_transform(self, body: b2Body, alpha: float) -> tuple[float, float, float] | None:
+        index: int | None = self._indices.get(body)
+        if index is None:
+            return None
+
+        current: np.ndarray = self._current[index]
+        previous: np.ndarray = self._previous[index]
+        return (
+            float(previous[0] + (current[0] - previous[0]) * alpha),
+            float(previous[1] + (current[1] - previous[1]) * alpha),
+            float(previous[2] + (current[2] - previous[2]) * alpha)
+        )
+
+    def compute_screen_vertices(self, alpha: float, rows: np.ndarray | None = None) -> np.ndarray:
+        """Transforms tracked bodies (all, or the given rows) to screen space at the interpolated transform, into a preallocated (n, MAX_VERTICES, 2) array."""
+        if rows is None:
+            count: int = len(self._bodies)
+            current: np.ndarray = self._current[:count]
+            previous: np.ndarray = self._previous[:count]
+            local: np.ndarray = self._local[:count]
+        else:
+            count: int = len(rows)
+            current: np.ndarray = self._current[rows]
+            previous: np.ndarray = self._previous[rows]
+            local: np.ndarray = self._local[rows]
+
+        transforms: np.ndarray = self._interpolated[:count]
+        np.subtract(current, previous, out = transforms)
+        transforms *= alpha
+        transforms += previous
+
+        x: np.ndarray = transforms[:, 0:1]
+        y: np.ndarray = transforms[:, 1:2]
+        c: np.ndarray = np.cos(transforms[:, 2:3], out = self._cos[:count])
+        s: np.ndarray = np.sin(transforms[:, 2:3], out = self._sin[:count])
+
+        local_x: np.ndarray = local[:, :, 0]
+        local_y: np.ndarray = local[:, :, 1]
+        screen: np.ndarray = self._screen[:count]
+        screen_x: np.ndarray = screen[:, :, 0]
+        screen_y: np.ndarray = screen[:, :, 1]
+        scratch: np.ndarray = self._scratch[:count]
+
+        # World space vertices: x + c * lx - s * ly and y + s * lx + c * ly
+        np.multiply(c, local_x, out = screen_x)
+        np.multiply(s, local_y, out = scratch)
+        screen_x -= scratch
+        screen_x += x
+
+        np.multiply(s, local_x, out = screen_y)
+        np.multiply(c, local_y, out = scratch)
+        screen_y += scratch
+        screen_y += y
+
+        return self._transform.apply(screen, out = screen)
+
+    def get_visible(self, screen: np.ndarray, view: pygame.Rect, rows: np.ndarray | None = None) -> np.ndarray:
+        """Returns the positions in screen of drawn bodies whose screen bounds overlap the view."""
+        minimum: np.ndarray = screen.min(axis = 1)
+        maximum: np.ndarray = screen.max(axis = 1)
+
+        visible: np.ndarray = self._drawn[:len(screen)].copy() if rows is None else self._drawn[rows]
+        visible &= maximum[:, 0] >= view.left
+        visible &= minimum[:, 0] <= view.right
+        visible &= maximum[:, 1] >= view.top
+        visible &= minimum[:, 1] <= view.bottom
+
+        return np.flatnonzero(visible)
+
+    def render(self, surface: pygame.Surface, alpha: float, view: pygame.Rect | None = None) -> None:
+        """Draws the visible bodies. With a view and a spatial hash, only bodies the hash places in the view are transformed."""
+        if not self._bodies:
+            return
+
+        rows: np.ndarray | None = None
+        if view is not None and self._spatial_hash is not None:
+            rows = self.query(view)
+            if len(rows) == 0:
+                if DirtyRects.enabled:
+                    self._mark_dirty(rows, self._screen[:0])
+                return
+
+        screen: np.ndarray = self.compute_screen_vertices(alpha, rows)
+        visible: np.ndarray = self.get_visible(screen, view if view is not None else surface.get_rect(), rows)
+        body_rows: np.ndarray = visible if rows is None else rows[visible]
+
+        colors: list[tuple[int, int, int] | None] = self._colors
+        counts: list[int] = self._counts[body_rows].tolist()
+        polygons: list[list[list[float]]] = screen[visible].tolist()
+
+        if DirtyRects.enabled:
+            self._mark_dirty(body_rows, screen[visible])
+
+        draw_polygons(surface, [colors[index] for index in body_rows.tolist()], [vertices[:count] for count, vertices in zip(counts, polygons)])
+
+    def _mark_dirty(self, rows: np.ndarray, vertices: np.ndarray) -> None:
+        """Reports the old and new bounds of bodies that moved, appeared or disappeared since the last frame. Bodies that stayed put cost nothing."""
+        count: int = len(self._bodies)
+        was_drawn: np.ndarray = self._was_drawn[:count]
+
+        bounds: np.ndarray = np.empty((len(rows), 4), dtype = np.int64)
+        bounds[:, 0:2] = np.floor(vertices.min(axis = 1))
+        # Polygon edges are drawn inclusively, so the far edge needs one more pixel
+        bounds[:, 2:4] = np.ceil(vertices.max(axis = 1)) + 1
+
+        previous: np.ndarray = self._bounds[rows]
+        moved: np.ndarray = ~was_drawn[rows] | (bounds != previous).any(axis = 1)
+        hidden: np.ndarray = was_drawn.copy()
+        hidden[rows] = False
+
+        dirty: np.ndarray = np.concatenate((previous[moved & was_drawn[rows]], self._bounds[:count][hidden], bounds[moved]))
+        for left, top, right, bottom in dirty.tolist():
+            DirtyRects.mark((left, top, right - left, bottom - top))
+
+        self._bounds[rows] = bounds
+        was_drawn[:] = False
+        was_drawn[rows] = True
\ No newline at end of file
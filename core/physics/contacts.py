@@ -0,0 +1,99 @@
+import numpy as np
+
+from Box2D import b2Contact, b2ContactListener, b2Fixture
+from typing import Final
+
+from core.physics.sensor import Sensor
+
+CATEGORY_ALL: Final[int] = 0xFFFF
+
+class CollisionBatch():
+    """Every contact that began or ended during one world tick. Fixtures are only guaranteed to be alive while the event is being handled."""
+
+    def __init__(self, begins: list[tuple[b2Fixture, b2Fixture]], ends: list[tuple[b2Fixture, b2Fixture]]) -> None:
+        self._begins: list[tuple[b2Fixture, b2Fixture]] = begins
+        self._ends: list[tuple[b2Fixture, b2Fixture]] = ends
+        self._begin_bits: np.ndarray | None = None
+        self._end_bits: np.ndarray | None = None
+
+    @property
+    def begins(self) -> list[tuple[b2Fixture, b2Fixture]]:
+        return self._begins
+
+    @property
+    def ends(self) -> list[tuple[b2Fixture, b2Fixture]]:
+        return self._ends
+
+    def __len__(self) -> int:
+        return len(self._begins) + len(self._ends)
+
+    def filter(self, category: int, other: int = CATEGORY_ALL, *, ended: bool = False) -> list[tuple[b2Fixture, b2Fixture]]:
+        """Returns the begun (or ended) contacts between a fixture in category and one in other, ordered as (category fixture, other fixture)."""
+        pairs: list[tuple[b2Fixture, b2Fixture]] = self._ends if ended else self._begins
+        if not pairs:
+            return []
+
+        bits: np.ndarray = self._get_bits(ended)
+        forward: np.ndarray = ((bits[:, 0] & category) != 0) & ((bits[:, 1] & other) != 0)
+        backward: np.ndarray = ((bits[:, 1] & category) != 0) & ((bits[:, 0] & other) != 0) & ~forward
+
+        matches: list[tuple[b2Fixture, b2Fixture]] = [pairs[index] for index in np.flatnonzero(forward).tolist()]
+        matches.extend((pairs[index][1], pairs[index][0]) for index in np.flatnonzero(backward).tolist())
+        return matches
+
+    def _get_bits(self, ended: bool) -> np.ndarray:
+        # Category bits are read from the fixtures only when something filters, and then once per batch
+        bits: np.ndarray | None = self._end_bits if ended else self._begin_bits
+        if bits is None:
+            pairs: list[tuple[b2Fixture, b2Fixture]] = self._ends if ended else self._begins
+            bits = np.array([(a.filterData.categoryBits, b.filterData.categoryBits) for a, b in pairs], dtype = np.uint16).reshape(-1, 2)
+            if ended:
+                self._end_bits = bits
+            else:
+                self._begin_bits = bits
+
+        return bits
+
+class ContactListener(b2ContactListener):
+    """Buffers begin and end contacts during World steps so they can be handed out once per tick, and keeps sensor counts current."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._begins: list[tuple[b2Fixture, b2Fixture]] = []
+        self._ends: list[tuple[b2Fixture, b2Fixture]] = []
+        self.recording: bool = False
+        self.sensors: int = 0
+
+    def BeginContact(self, contact: b2Contact) -> None:
+        fixture_a: b2Fixture = contact.fixtureA
+        fixture_b: b2Fixture = contact.fixtureB
+        if self.sensors and fixture_a.sensor != fixture_b.sensor:
+            sensor: Sensor | None = (fixture_a if fixture_a.sensor else fixture_b).userData
+            if isinstance(sensor, Sensor):
+                sensor._begin()
+
+        if self.recording:
+            self._begins.append((fixture_a, fixture_b))
+
+    def EndContact(self, contact: b2Contact) -> None:
+        fixture_a: b2Fixture = contact.fixtureA
+        fixture_b: b2Fixture = contact.fixtureB
+        # Sensors count every end, including those outside Step when a body is destroyed or deactivated
+        if self.sensors and fixture_a.sensor != fixture_b.sensor:
+            sensor: Sensor | None = (fixture_a if fixture_a.sensor else fixture_b).userData
+            if isinstance(sensor, Sensor):
+                sensor._end()
+
+        # Those fixtures may not outlive the tick though, so only ends from Step are batched
+        if self.recording:
+            self._ends.append((fixture_a, fixture_b))
+
+    def flush(self) -> CollisionBatch | None:
+        """Returns the buffered contacts as a batch and starts a new buffer, or None when nothing touched or separated."""
+        if not self._begins and not self._ends:
+            return None
+
+        batch: CollisionBatch = CollisionBatch(self._begins, self._ends)
+        self._begins = []
+        self._ends = []
+        return batch
\ No newline at end of file
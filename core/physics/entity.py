@@ -1,7 +1,9 @@
+import math
 import pygame
 
 from core.entity.entity import Entity
 from core.entity.sprite import SpriteTable
+from core.physics.sensor import Sensor
 
 from typing import TYPE_CHECKING, override
 from Box2D import b2Body
@@ -19,6 +21,10 @@ class PhysicsEntity(Entity):
 
         self._velocity: pygame.Vector2 = pygame.Vector2(self._body.linearVelocity[0], self._body.linearVelocity[1])
         self._body.gravityScale = 0.5
+
+        self._sensors: dict[str, Sensor] = {}
+        self._ground_distance: float = math.inf
+        self._ground_distance_key: tuple[int, float] | None = None
         
     @property
     def world(self) -> 'World':
@@ -28,9 +34,44 @@ class PhysicsEntity(Entity):
     def velocity(self) -> pygame.Vector2:
         return self._velocity
     
+    @property
+    def interpolated_position(self) -> pygame.Vector2:
+        """Top-left screen position of the body, blended between physics steps by the world's alpha."""
+        x, y, _ = self._world.get_interpolated_transform(self._body)
+        screen_x, screen_y = self._world.to_screen_transform.apply_point(x, y)
+        return pygame.Vector2(int(screen_x) - self._size.x / 2, int(screen_y) - self._size.y / 2)
+    
+    def add_sensor(self, name: str, offset: tuple[float, float], size: tuple[float, float]) -> Sensor:
+        """Attaches a sensor box of size pixels, centred offset pixels from the body's centre, e.g. (0, height / 2) for feet."""
+        sensor: Sensor = self._world.create_sensor(self._body, name, offset, size[0], size[1])
+        self._sensors[name] = sensor
+        return sensor
+
+    def remove_sensor(self, name: str) -> None:
+        self._world.destroy_sensor(self._body, self._sensors.pop(name))
+
+    def get_sensor(self, name: str) -> Sensor | None:
+        return self._sensors.get(name)
+
+    def distance_from_ground(self, max_distance: float = 1000.0) -> float:
+        """Pixels between the bottom of the body and the closest fixture below it, or inf beyond max_distance. Raycast at most once per physics step."""
+        key: tuple[int, float] = (self._world.step_count, max_distance)
+        if key != self._ground_distance_key:
+            self._ground_distance_key = key
+            # Cast from the centre: rays starting inside a fixture, like the ground under a resting body, do not hit it
+            x, y = self._world.to_screen_transform.apply_point(*self._body.position)
+            half_height: float = self._size.y / 2
+            hit: tuple | None = self._world.raycast((x, y), (x, y + half_height + max_distance), ignore = self._body)
+            self._ground_distance = max(hit[1] - half_height, 0.0) if hit is not None else math.inf
+
+        return self._ground_distance
+
     def tick(self, deltatime: float) -> None:
         self._velocity = pygame.Vector2(self._body.linearVelocity[0], self._body.linearVelocity[1])
+        x, y = self._world.to_screen_transform.apply_point(*self._body.position)
+        self.position = pygame.Vector2(x - self._size.x / 2, y - self._size.y / 2)
     
     @override
     def render(self, surface: pygame.Surface, deltatime: float) -> None:
-        ...
\ No newline at end of file
+        if self._visible and self._current_sprite:
+            self._draw(surface, self.get_rendered_image(), self.interpolated_position)
\ No newline at end of file
@@ -0,0 +1,113 @@
+import pygame
+
+from Box2D import b2Body
+from typing import TYPE_CHECKING
+
+from core.physics.world import PPM
+
+if TYPE_CHECKING:
+    from core.physics.world import World
+
+class BodyPool():
+    def __init__(self, world: 'World', width: int, height: int, *, kinematic: bool = False, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5, color: tuple[int, int, int] | None = None, prewarm: int = 0) -> None:
+        self._world: 'World' = world
+        self._width: int = width
+        self._height: int = height
+        self._kinematic: bool = kinematic
+        self._density: float = density
+        self._friction: float = friction
+        self._restitution: float = restitution
+        self._color: tuple[int, int, int] | None = color
+
+        self._free: list[b2Body] = []
+        self._in_use: set[b2Body] = set()
+        self._hits: int = 0
+        self._misses: int = 0
+
+        if prewarm > 0:
+            self.prewarm(prewarm)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        acquires: int = self._hits + self._misses
+        return self._hits / acquires if acquires else 0.0
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
+
+    @property
+    def in_use(self) -> int:
+        return len(self._in_use)
+
+    def __contains__(self, body: b2Body) -> bool:
+        return body in self._in_use
+
+    def prewarm(self, count: int) -> None:
+        """Creates count bodies up front and parks them inactive, so the first acquires do not allocate."""
+        positions: list[tuple[float, float]] = [(0, 0)] * count
+        if self._kinematic:
+            bodies: list[b2Body] = self._world.create_kinematic_bodies(positions, (self._width, self._height))
+        else:
+            bodies: list[b2Body] = self._world.create_dynamic_bodies(positions, (self._width, self._height), density = self._density, friction = self._friction, restitution = self._restitution)
+
+        for body in bodies:
+            self._park(body)
+
+    def acquire(self, position: pygame.Vector2 | tuple[float, float], angle: float = 0.0, velocity: tuple[float, float] = (0.0, 0.0)) -> b2Body:
+        """Returns a body placed with its top left at a pixel position, recycling a released one when available."""
+        if not self._free:
+            self._misses += 1
+            body: b2Body = self._create(position)
+            # Created bodies start at 0 rad; turn them like recycled ones
+            body.transform = (body.position, angle)
+        else:
+            self._hits += 1
+            body: b2Body = self._free.pop()
+            # Same conversion as World.to_b2_position, without its type dispatch
+            body.transform = (((position[0] + self._width / 2) / PPM, (self._world.height - position[1] - self._height / 2) / PPM), angle)
+            body.active = True
+            body.awake = True
+            self._world.set_body_color(body, self._color)
+
+        body.linearVelocity = velocity
+        body.angularVelocity = 0.0
+        self._in_use.add(body)
+        return body
+
+    def release(self, body: b2Body) -> None:
+        """Deactivates a body and keeps it for reuse instead of destroying it."""
+        self._in_use.remove(body)
+        self._park(body)
+
+    def clear(self) -> None:
+        """Destroys every pooled body, including those still in use."""
+        for body in self._free + list(self._in_use):
+            self._world.destroy_body(body)
+
+        self._free.clear()
+        self._in_use.clear()
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+
+    def _create(self, position: pygame.Vector2 | tuple[float, float]) -> b2Body:
+        if self._kinematic:
+            return self._world.create_kinematic_body(tuple(position), self._width, self._height, color = self._color)
+
+        return self._world.create_dynamic_body(tuple(position), self._width, self._height, density = self._density, friction = self._friction, restitution = self._restitution, color = self._color)
+
+    def _park(self, body: b2Body) -> None:
+        # Inactive bodies drop out of the broad-phase and the render batch but keep their fixtures
+        body.active = False
+        self._world.batch.remove(body)
+        self._free.append(body)
\ No newline at end of file
@@ -0,0 +1,338 @@
+import multiprocessing
+import queue
+import numpy as np
+import pygame
+
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from typing import Final
+
+from core.logger import Logger
+from core.interfaces.tickable import Tickable
+from core.interfaces.renderable import Renderable
+from core.interfaces.listener import EventListener
+from core.physics.world import PPM, PHYSICS_STEP, VEL_ITERS, POS_ITERS, MAX_SUBSTEPS
+from core.render.coordinates import CoordinateTransform
+from core.render.dirty_rects import DirtyRects
+from core.render.snapshot import draw_polygons
+
+# Header slots, shared as int64
+FRONT: Final[int] = 0
+READING: Final[int] = 1
+STEP: Final[int] = 2
+HEADER_SIZE: Final[int] = 8
+
+# Columns of each published row
+X, Y, ANGLE, VELOCITY_X, VELOCITY_Y, ANGULAR_VELOCITY, ALIVE = range(7)
+COLUMNS: Final[int] = 7
+
+_SPAWN: Final[int] = 0
+_DESTROY: Final[int] = 1
+_IMPULSE: Final[int] = 2
+_VELOCITY: Final[int] = 3
+_STOP: Final[int] = 4
+
+def _map_buffers(buffer: memoryview, capacity: int) -> tuple[np.ndarray, np.ndarray]:
+    header: np.ndarray = np.ndarray((HEADER_SIZE,), dtype = np.int64, buffer = buffer)
+    rows: np.ndarray = np.ndarray((2, capacity, COLUMNS), dtype = np.float64, buffer = buffer, offset = header.nbytes)
+    return header, rows
+
+def _run_worker(name: str, capacity: int, width: int, height: int, gravity: float, ground: bool, commands: multiprocessing.Queue) -> None:
+    """Steps a Box2D world in real time and publishes every body's state into the back buffer after each batch of steps."""
+    from Box2D import b2World, b2Body, b2BodyDef, b2FixtureDef, b2PolygonShape, b2_dynamicBody, b2_kinematicBody
+
+    memory: SharedMemory = SharedMemory(name = name)
+    header, buffers = _map_buffers(memory.buf, capacity)
+
+    world: b2World = b2World((0, gravity), doSleep = True)
+    if ground:
+        # Same ground as World._create_ground_body, along the bottom edge of the screen
+        world.CreateStaticBody(position = (width / 2 / PPM, -5 / PPM), shapes = b2PolygonShape(box = (width / 2 / PPM, 10 / PPM)))
+
+    bodies: dict[int, b2Body] = {}
+    alive: np.ndarray = np.zeros(capacity)
+    body_def: b2BodyDef = b2BodyDef()
+
+    def spawn(ids: list[int], kinematic: bool, centres: list[list[float]], half_extents: list[list[float]], density: float, friction: float, restitution: float) -> None:
+        body_def.type = b2_kinematicBody if kinematic else b2_dynamicBody
+        fixture_defs: dict[tuple[float, float], b2FixtureDef] = {}
+        for body_id, centre, half_extent in zip(ids, centres, half_extents):
+            fixture_def: b2FixtureDef | None = fixture_defs.get(tuple(half_extent))
+            if fixture_def is None:
+                fixture_def = b2FixtureDef(shape = b2PolygonShape(box = half_extent), density = density, friction = friction, restitution = restitution)
+                fixture_defs[tuple(half_extent)] = fixture_def
+
+            body_def.position = centre
+            body: b2Body = world.CreateBody(body_def)
+            body.CreateFixture(fixture_def)
+            bodies[body_id] = body
+            alive[body_id] = 1.0
+
+    def handle(command: tuple) -> bool:
+        kind: int = command[0]
+        if kind == _SPAWN:
+            spawn(*command[1:])
+        elif kind == _DESTROY:
+            world.DestroyBody(bodies.pop(command[1]))
+            alive[command[1]] = 0.0
+        elif kind == _IMPULSE:
+            body: b2Body = bodies[command[1]]
+            body.ApplyLinearImpulse(command[2], body.worldCenter, True)
+        elif kind == _VELOCITY:
+            body: b2Body = bodies[command[1]]
+            body.linearVelocity = command[2]
+            body.awake = True
+        elif kind == _STOP:
+            return False
+
+        return True
+
+    def publish(step: int) -> None:
+        target: int = 1 - int(header[FRONT])
+        # The main process is still reading the back buffer from two publishes ago; skip this one rather than tear it
+        if header[READING] == target:
+            return
+
+        rows: np.ndarray = buffers[target]
+        if bodies:
+            states: list[tuple[float, ...]] = []
+            for body in bodies.values():
+                position = body.position
+                velocity = body.linearVelocity
+                states.append((position[0], position[1], body.angle, velocity[0], velocity[1], body.angularVelocity))
+
+            rows[list(bodies), :ALIVE] = states
+
+        rows[:, ALIVE] = alive
+        header[STEP] = step
+        header[FRONT] = target
+
+    step: int = 0
+    next_step: float = perf_counter()
+    running: bool = True
+    try:
+        while running:
+            # Wait for commands until the next step is due, so spawns and impulses apply with no extra latency
+            try:
+                running = handle(commands.get(timeout = max(next_step - perf_counter(), 0.0)))
+                while running:
+                    running = handle(commands.get_nowait())
+            except queue.Empty:
+                pass
+
+            now: float = perf_counter()
+            if not running or now < next_step:
+                continue
+
+            substeps: int = 0
+            while next_step <= now and substeps < MAX_SUBSTEPS:
+                world.Step(PHYSICS_STEP, VEL_ITERS, POS_ITERS)
+                next_step += PHYSICS_STEP
+                substeps += 1
+                step += 1
+
+            # Too far behind to catch up; drop the backlog rather than spiralling
+            if next_step <= now:
+                next_step = now + PHYSICS_STEP
+
+            publish(step)
+    finally:
+        del header, buffers
+        memory.close()
+
+class PhysicsProcess(Tickable, Renderable):
+    """Runs a Box2D world in a worker process. Bodies are referred to by integer ids, changed through queued commands, and read back
+    from a double-buffered shared memory snapshot that is swapped in once per tick."""
+
+    def __init__(self, width: int, height: int, gravity: float = -9.8, *, capacity: int = 4096, ground: bool = True) -> None:
+        EventListener.__init__(self)
+
+        self._logger: Logger = Logger("PhysicsProcess")
+        self._width: int = width
+        self._height: int = height
+        self._gravity: float = gravity
+        self._capacity: int = capacity
+        self._ground: bool = ground
+        self._to_screen: CoordinateTransform = CoordinateTransform((PPM, -PPM), (0, height))
+        self._to_world: CoordinateTransform = self._to_screen.inverse()
+
+        self._memory: SharedMemory | None = SharedMemory(create = True, size = 8 * (HEADER_SIZE + 2 * capacity * COLUMNS))
+        self._header, self._buffers = _map_buffers(self._memory.buf, capacity)
+        self._header[:] = 0
+        self._header[READING] = -1
+        self._buffers[:] = 0.0
+        self._front: np.ndarray = self._buffers[0]
+
+        # Spawn is used on every platform so the worker never inherits pygame or EventBus state
+        self._context = multiprocessing.get_context("spawn")
+        self._commands: multiprocessing.Queue = self._context.Queue()
+        self._process: multiprocessing.Process | None = None
+
+        self._free: list[int] = list(range(capacity - 1, -1, -1))
+        self._alive: np.ndarray = np.zeros(capacity, dtype = np.bool_)
+        self._local: np.ndarray = np.zeros((capacity, 4, 2))
+        self._colors: list[tuple[int, int, int] | None] = [None] * capacity
+        self._drawn_bounds: pygame.Rect | None = None
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def step_count(self) -> int:
+        """The worker's step count at the snapshot currently being read."""
+        return int(self._header[STEP])
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Which ids the worker has spawned and not destroyed, as of the current snapshot. A view, not a copy."""
+        return self._front[:, ALIVE] > 0
+
+    @property
+    def positions(self) -> np.ndarray:
+        """(capacity, 2) body centres in metres, indexed by id. A view into shared memory, valid until the next tick."""
+        return self._front[:, X:ANGLE]
+
+    @property
+    def angles(self) -> np.ndarray:
+        return self._front[:, ANGLE]
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self._front[:, VELOCITY_X:ANGULAR_VELOCITY]
+
+    @property
+    def angular_velocities(self) -> np.ndarray:
+        return self._front[:, ANGULAR_VELOCITY]
+
+    @property
+    def to_screen_transform(self) -> CoordinateTransform:
+        return self._to_screen
+
+    def start(self) -> None:
+        if self.running:
+            return
+        if self._memory is None:
+            raise RuntimeError("PhysicsProcess was stopped and its shared memory freed; create a new one instead")
+
+        self._process = self._context.Process(
+            target = _run_worker,
+            args = (self._memory.name, self._capacity, self._width, self._height, self._gravity, self._ground, self._commands),
+            name = "physics",
+            daemon = True
+        )
+        self._process.start()
+        self._logger.info(f"Started physics worker (pid {self._process.pid})")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stops the worker and frees the shared memory. The snapshot views are invalid afterwards."""
+        if self._process is not None:
+            self._commands.put((_STOP,))
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._logger.warn("Physics worker did not stop in time, terminating it")
+                self._process.terminate()
+            self._process = None
+
+        if self._memory is None:
+            return
+
+        self._front = np.zeros((self._capacity, COLUMNS))
+        del self._header, self._buffers
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+
+    def create_dynamic_bodies(self, positions: np.ndarray | list[tuple[float, float]], sizes: np.ndarray | list[tuple[float, float]] | tuple[float, float], *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5, color: tuple[int, int, int] | None = None) -> list[int]:
+        """Queues one box body per top-left pixel position and returns their ids. They appear in the snapshot once the worker has spawned them."""
+        return self._spawn(False, positions, sizes, density, friction, restitution, color)
+
+    def create_kinematic_bodies(self, positions: np.ndarray | list[tuple[float, float]], sizes: np.ndarray | list[tuple[float, float]] | tuple[float, float], *, color: tuple[int, int, int] | None = None) -> list[int]:
+        return self._spawn(True, positions, sizes, 1.0, 0.2, 0.0, color)
+
+    def create_dynamic_body(self, position: pygame.Vector2 | tuple[float, float], width: int, height: int, *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5, color: tuple[int, int, int] | None = None) -> int:
+        return self.create_dynamic_bodies([tuple(position)], (width, height), density = density, friction = friction, restitution = restitution, color = color)[0]
+
+    def destroy_body(self, body_id: int) -> None:
+        self._commands.put((_DESTROY, body_id))
+        self._alive[body_id] = False
+        self._colors[body_id] = None
+        self._free.append(body_id)
+
+    def apply_impulse(self, body_id: int, impulse: tuple[float, float]) -> None:
+        """Applies a linear impulse in Box2D units (N s, y up) at the body's centre of mass."""
+        self._commands.put((_IMPULSE, body_id, tuple(impulse)))
+
+    def set_velocity(self, body_id: int, velocity: tuple[float, float]) -> None:
+        """Sets the linear velocity in metres per second, y up."""
+        self._commands.put((_VELOCITY, body_id, tuple(velocity)))
+
+    def _spawn(self, kinematic: bool, positions: np.ndarray | list[tuple[float, float]], sizes: np.ndarray | list[tuple[float, float]] | tuple[float, float], density: float, friction: float, restitution: float, color: tuple[int, int, int] | None) -> list[int]:
+        positions = np.asarray(positions, dtype = np.float64).reshape(-1, 2)
+        sizes = np.broadcast_to(np.asarray(sizes, dtype = np.float64), positions.shape)
+        if len(positions) > len(self._free):
+            raise ValueError(f"Cannot spawn {len(positions)} bodies, only {len(self._free)} of {self._capacity} ids are free")
+
+        ids: list[int] = [self._free.pop() for _ in range(len(positions))]
+        half_extents: np.ndarray = sizes / (2 * PPM)
+        centres: np.ndarray = self._to_world.apply(positions + sizes / 2)
+
+        self._alive[ids] = True
+        # Box corners around the centre in metres, in the same winding Box2D uses
+        self._local[ids] = np.stack((-half_extents, half_extents * (1, -1), half_extents, half_extents * (-1, 1)), axis = 1)
+        for body_id in ids:
+            self._colors[body_id] = color
+
+        # One command for the whole batch instead of one pickle and queue put per body
+        self._commands.put((_SPAWN, ids, kinematic, centres.tolist(), half_extents.tolist(), density, friction, restitution))
+        return ids
+
+    def _acquire(self) -> None:
+        """Marks the newest published buffer as being read, so the worker never writes into it while gameplay and rendering use it.
+        The worker can then publish once more into the other buffer, so the snapshot is at most one tick behind the simulation."""
+        header: np.ndarray = self._header
+        front: int = int(header[FRONT])
+        while True:
+            header[READING] = front
+            # The worker may have swapped between reading FRONT and marking it; mark the new front instead
+            latest: int = int(header[FRONT])
+            if latest == front:
+                break
+            front = latest
+
+        self._front = self._buffers[front]
+
+    def tick(self, deltatime: float) -> None:
+        if self._process is not None:
+            self._acquire()
+
+    def render(self, surface: pygame.Surface, deltatime: float) -> None:
+        rows: np.ndarray = np.flatnonzero(self._alive & (self._front[:, ALIVE] > 0))
+        if len(rows) == 0:
+            return
+
+        states: np.ndarray = self._front[rows]
+        c: np.ndarray = np.cos(states[:, ANGLE])[:, None]
+        s: np.ndarray = np.sin(states[:, ANGLE])[:, None]
+        local: np.ndarray = self._local[rows]
+
+        vertices: np.ndarray = np.empty_like(local)
+        vertices[:, :, 0] = states[:, X:X + 1] + c * local[:, :, 0] - s * local[:, :, 1]
+        vertices[:, :, 1] = states[:, Y:Y + 1] + s * local[:, :, 0] + c * local[:, :, 1]
+        self._to_screen.apply(vertices, out = vertices)
+
+        colors: list[tuple[int, int, int] | None] = [self._colors[body_id] for body_id in rows.tolist()]
+        polygons: list[list[list[float]]] = vertices.tolist()
+        draw_polygons(surface, [color for color in colors if color is not None], [polygon for color, polygon in zip(colors, polygons) if color is not None])
+
+        if DirtyRects.enabled:
+            # One rect around everything drawn now and last frame; per-body tracking would cost more than the bodies
+            minimum: np.ndarray = np.floor(vertices.min(axis = (0, 1)))
+            maximum: np.ndarray = np.ceil(vertices.max(axis = (0, 1))) + 1
+            bounds: pygame.Rect = pygame.Rect(minimum.tolist(), (maximum - minimum).tolist())
+            DirtyRects.mark(bounds if self._drawn_bounds is None else bounds.union(self._drawn_bounds))
+            self._drawn_bounds = bounds
\ No newline at end of file
@@ -0,0 +1,35 @@
+from Box2D import b2Fixture
+
+class Sensor():
+    """A sensor fixture whose overlapping fixture count World's contact listener keeps up to date, so checks are a flag read."""
+
+    def __init__(self, name: str, fixture: b2Fixture) -> None:
+        self._name: str = name
+        self._fixture: b2Fixture = fixture
+        self._count: int = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def fixture(self) -> b2Fixture:
+        return self._fixture
+
+    @property
+    def count(self) -> int:
+        """How many non-sensor fixtures currently overlap the sensor."""
+        return self._count
+
+    @property
+    def active(self) -> bool:
+        return self._count > 0
+
+    def _begin(self) -> None:
+        self._count += 1
+
+    def _end(self) -> None:
+        self._count -= 1
+
+    def __repr__(self) -> str:
+        return f"Sensor({self._name!r}, count = {self._count})"
\ No newline at end of file
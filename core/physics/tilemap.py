@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import numpy as np
+
+from Box2D import b2Body
+from typing import TYPE_CHECKING, Final
+
+from core.logger import Logger
+
+if TYPE_CHECKING:
+    from core.physics.world import World
+
+CACHE_DIRECTORY: Final[str] = os.path.join(".cache", "tilemaps")
+# Bump when the merging changes so stale cached geometry is not reused
+GEOMETRY_VERSION: Final[int] = 1
+
+# Directed boundary edges keep the solid tile on their right (screen space, y down)
+_RIGHT_TURN: Final[dict[tuple[int, int], tuple[int, int]]] = {(1, 0): (0, 1), (0, 1): (-1, 0), (-1, 0): (0, -1), (0, -1): (1, 0)}
+
+class Tilemap():
+    def __init__(self, tiles: np.ndarray, tile_size: int = 32, solid: set[int] | None = None, origin: tuple[float, float] = (0, 0)) -> None:
+        self._tiles: np.ndarray = np.asarray(tiles, dtype = np.int32)
+        self._tile_size: int = tile_size
+        self._origin: tuple[float, float] = origin
+        # Any non-zero tile is solid unless told otherwise
+        self._solid: np.ndarray = np.isin(self._tiles, list(solid)) if solid is not None else self._tiles != 0
+        self._logger: Logger = Logger("Tilemap")
+
+    @property
+    def tiles(self) -> np.ndarray:
+        return self._tiles
+
+    @property
+    def solid(self) -> np.ndarray:
+        return self._solid
+
+    @property
+    def tile_size(self) -> int:
+        return self._tile_size
+
+    @property
+    def width(self) -> int:
+        return self._tiles.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self._tiles.shape[0]
+
+    @classmethod
+    def load(cls, path: str, tile_size: int = 32, solid: set[int] | None = None, origin: tuple[float, float] = (0, 0)) -> "Tilemap":
+        """Loads a grid of tile ids from a CSV file, or from JSON holding either a list of rows or {"tile_size", "tiles"}."""
+        if path.lower().endswith(".json"):
+            with open(path, "r") as file:
+                data: dict | list = json.load(file)
+
+            if isinstance(data, dict):
+                tile_size = data.get("tile_size", tile_size)
+                solid = set(data["solid"]) if "solid" in data else solid
+                data = data["tiles"]
+
+            return cls(np.array(data, dtype = np.int32), tile_size, solid, origin)
+
+        return cls(np.loadtxt(path, delimiter = ",", dtype = np.int32, ndmin = 2), tile_size, solid, origin)
+
+    def get_cache_key(self, chains: bool) -> str:
+        digest = hashlib.sha1(np.ascontiguousarray(self._solid).tobytes())
+        digest.update(f"{self._solid.shape}:{chains}:{GEOMETRY_VERSION}".encode())
+        return digest.hexdigest()
+
+    def merge_rectangles(self) -> list[tuple[int, int, int, int]]:
+        """Greedily covers solid tiles with (x, y, width, height) rectangles in tile units: widest run first, then grown downwards."""
+        solid: np.ndarray = self._solid
+        covered: np.ndarray = np.zeros_like(solid)
+        rows, columns = solid.shape
+        rectangles: list[tuple[int, int, int, int]] = []
+
+        for y in range(rows):
+            open_tiles: np.ndarray = solid[y] & ~covered[y]
+            x: int = 0
+            while x < columns:
+                if not open_tiles[x]:
+                    x += 1
+                    continue
+
+                end: int = x
+                while end < columns and open_tiles[end]:
+                    end += 1
+
+                bottom: int = y + 1
+                while bottom < rows and (solid[bottom, x:end] & ~covered[bottom, x:end]).all():
+                    bottom += 1
+
+                covered[y:bottom, x:end] = True
+                rectangles.append((x, y, end - x, bottom - y))
+                x = end
+
+        return rectangles
+
+    def trace_outlines(self) -> list[list[tuple[int, int]]]:
+        """Returns the boundary loops of every solid region, and of holes inside them, as tile corner points with collinear points removed."""
+        padded: np.ndarray = np.pad(self._solid, 1)
+        inner: np.ndarray = padded[1:-1, 1:-1]
+        edges: dict[tuple[int, int], list[tuple[int, int]]] = {}
+
+        def add(cells: np.ndarray, start: tuple[int, int], direction: tuple[int, int]) -> None:
+            for y, x in np.argwhere(cells).tolist():
+                edges.setdefault((x + start[0], y + start[1]), []).append(direction)
+
+        add(inner & ~padded[:-2, 1:-1], (0, 0), (1, 0))
+        add(inner & ~padded[1:-1, 2:], (1, 0), (0, 1))
+        add(inner & ~padded[2:, 1:-1], (1, 1), (-1, 0))
+        add(inner & ~padded[1:-1, :-2], (0, 1), (0, -1))
+
+        loops: list[list[tuple[int, int]]] = []
+        while edges:
+            start: tuple[int, int] = next(iter(edges))
+            point: tuple[int, int] = start
+            direction: tuple[int, int] = edges[start][0]
+            loop: list[tuple[int, int]] = []
+
+            while True:
+                outgoing: list[tuple[int, int]] = edges[point]
+                # Where two regions touch diagonally, turning right keeps each loop around its own region
+                right: tuple[int, int] = _RIGHT_TURN[direction]
+                if right in outgoing:
+                    direction = right
+                elif direction not in outgoing:
+                    direction = outgoing[0]
+
+                outgoing.remove(direction)
+                if not outgoing:
+                    del edges[point]
+
+                loop.append(point)
+                point = (point[0] + direction[0], point[1] + direction[1])
+                if point == start:
+                    break
+
+            loops.append(self._simplify(loop))
+
+        return loops
+
+    @staticmethod
+    def _simplify(loop: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        simplified: list[tuple[int, int]] = []
+        count: int = len(loop)
+        for index, (x, y) in enumerate(loop):
+            previous_x, previous_y = loop[index - 1]
+            next_x, next_y = loop[(index + 1) % count]
+            if (x - previous_x) * (next_y - y) != (y - previous_y) * (next_x - x):
+                simplified.append((x, y))
+
+        return simplified
+
+    def build_geometry(self, chains: bool = False, cache_directory: str | None = CACHE_DIRECTORY) -> list:
+        """Returns merged rectangles, or outline loops with chains, reading and writing the on-disk cache when given a directory."""
+        cache_path: str | None = None
+        if cache_directory is not None:
+            cache_path = os.path.join(cache_directory, f"{self.get_cache_key(chains)}.json")
+            if os.path.isfile(cache_path):
+                with open(cache_path, "r") as file:
+                    return [[tuple(item) for item in entry] if chains else tuple(entry) for entry in json.load(file)]
+
+        geometry: list = self.trace_outlines() if chains else self.merge_rectangles()
+
+        if cache_path is not None:
+            os.makedirs(cache_directory, exist_ok = True)
+            with open(cache_path, "w") as file:
+                json.dump(geometry, file)
+
+        return geometry
+
+    def create_bodies(self, world: 'World', *, chains: bool = False, color: tuple[int, int, int] | None = (120, 120, 120), cache_directory: str | None = CACHE_DIRECTORY) -> list[b2Body]:
+        """Adds the level to the world as one static box per merged rectangle, or one chain loop per outline."""
+        geometry: list = self.build_geometry(chains, cache_directory)
+        size: int = self._tile_size
+        origin: np.ndarray = np.asarray(self._origin, dtype = np.float64)
+
+        if chains:
+            bodies: list[b2Body] = [world.create_chain_body(np.asarray(loop, dtype = np.float64) * size + origin) for loop in geometry]
+        elif geometry:
+            rectangles: np.ndarray = np.asarray(geometry, dtype = np.float64) * size
+            bodies: list[b2Body] = world.create_static_bodies(rectangles[:, :2] + origin, rectangles[:, 2:], color = color)
+        else:
+            bodies: list[b2Body] = []
+
+        self._logger.info(f"Built {len(bodies)} {'chain' if chains else 'box'} fixture(s) from {int(self._solid.sum())} solid tiles")
+        return bodies
\ No newline at end of file
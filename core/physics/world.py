@@ -1,180 +1,458 @@
-import pygame
-
-from core.logger import Logger
-from core.interfaces.tickable import Tickable
-from core.interfaces.renderable import Renderable
-from core.interfaces.listener import EventListener
-
-from Box2D import b2World, b2PolygonShape, b2BodyDef, b2Body
-from typing import Final, overload
-
-PPM: Final[int | float] = 20
-PHYSICS_STEP: Final[float] = 1 / 60
-VEL_ITERS: Final[int] = 6
-POS_ITERS: Final[int] = 2
-
-class World(b2World, Tickable, Renderable):
-    def __init__(self, width: int, height: int, gravity: float = -9.8) -> None:
-        super().__init__((0, gravity), doSleep = True)
-        EventListener.__init__(self)
-
-        self._logger: Logger = Logger("World")
-        self._gravity: float = gravity
-        self._width: int = width
-        self._height: int = height
-        self._ground_body: b2BodyDef = self._create_ground_body()
-        self._bodies: list[b2Body] = [self.create_dynamic_body((200, 0), 40, 40), self.create_dynamic_body((210, 100), 40, 40), self.create_dynamic_body((600, 0), 40, 40)]
-
-        # for body in bodies
-        # .render() if body instanceof MyBodyClass
-        # ^^^^^^ implementation
-
-    @property
-    def logger(self) -> Logger:
-        return self._logger
-
-    @property
-    def gravity(self) -> float:
-        return self._gravity
-    
-    @property
-    def width(self) -> int:
-        return self._width
-    
-    @property
-    def height(self) -> int:
-        return self._height
-    
-    def pixels_to_metres(self, pixels: int) -> int | float:
-        return pixels / PPM
-    
-    @overload
-    def screen_to_world(self, position: pygame.Vector2) -> pygame.Vector2:
-        ...
-
-    @overload
-    def screen_to_world(self, position: tuple[int, int]) -> tuple[int, int]:
-        ...
-
-    def screen_to_world(self, position: pygame.Vector2 | tuple[int, int]) -> pygame.Vector2 | tuple[int, int]:
-        if isinstance(position, pygame.Vector2):
-            return pygame.Vector2(self.pixels_to_metres(position.x), self.pixels_to_metres(self._height - position.y))
-        elif isinstance(position, tuple):
-            return (self.pixels_to_metres(position[0]), self.pixels_to_metres(self._height - position[1]))
-        else:
-            self.logger.warn(f"Invalid position type passed to {self}.screen_to_world(...)")
-            return position
-        
-    @overload
-    def world_to_screen(self, position: pygame.Vector2) -> pygame.Vector2:
-        ...
-
-    @overload
-    def world_to_screen(self, position: tuple[int, int]) -> tuple[int, int]:
-        ...
-
-    def world_to_screen(self, position: pygame.Vector2 | tuple[int, int]) -> pygame.Vector2 | tuple[int, int]:
-        if isinstance(position, pygame.Vector2):
-            return pygame.Vector2(int(position.x * PPM), int(self._height - position.y * PPM))
-        elif isinstance(position, tuple):
-            return (int(position[0] * PPM), int(self._height - position[1] * PPM))
-        else:
-            self.logger.warn(f"Invalid position type passed to {self}.world_to_screen(...)")
-            return position
-    
-    @overload
-    def to_b2_position(self, position: pygame.Vector2, width: int, height: int) -> pygame.Vector2:
-        ...
-
-    @overload
-    def to_b2_position(self, position: tuple[float, float], width: int, height: int) -> tuple[float, float]:
-        ...
-
-    def to_b2_position(self, position: pygame.Vector2 | tuple[float, float], width: int, height: int) -> pygame.Vector2 | tuple[float, float]:
-        if isinstance(position, pygame.Vector2):
-            return self.screen_to_world(pygame.Vector2(position.x + width / 2, position.y + height / 2))
-        elif isinstance(position, tuple):
-            return self.screen_to_world((position[0] + width / 2, position[1] + height / 2))
-        else:
-            self.logger.warn(f"Invalid position type passed to {self}.to_b2_position(...)")
-            return position
-        
-    @overload
-    def from_b2_position(self, position: pygame.Vector2, width: int, height: int) -> pygame.Vector2:
-        ...
-
-    @overload
-    def from_b2_position(self, position: tuple[float, float], width: int, height: int) -> tuple[float, float]:
-        ...
-
-    def from_b2_position(self, position: pygame.Vector2 | tuple[float, float], width: int, height: int) -> pygame.Vector2 | tuple[float, float]:
-        if isinstance(position, pygame.Vector2):
-            return self.screen_to_world(pygame.Vector2(position.x - width / 2, position.y - height / 2))
-        elif isinstance(position, tuple):
-            return self.screen_to_world((position[0] - width / 2, position[1] - height / 2))
-        else:
-            self.logger.warn(f"Invalid position type passed to {self}.from_b2_position(...)")
-            return position
-    
-    def _create_ground_body(self) -> b2BodyDef:
-        ground_height: int = 10
-        ground_height_metres: float = self.pixels_to_metres(ground_height)
-        ground: b2BodyDef = self.CreateStaticBody(
-            position = self.to_b2_position((0, self._height ), self._width, ground_height),
-            shapes = b2PolygonShape(box = (self.pixels_to_metres(self._width / 2), ground_height_metres))
-        )
-
-        for fixture in ground.fixtures:
-            fixture.restitution = 0.05
-
-        return ground
-    
-    @overload
-    def create_dynamic_body(self, position: pygame.Vector2, width: int, height: int, *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5) -> b2Body:
-        ...
-
-    @overload
-    def create_dynamic_body(self, position: tuple[int, int], width: int, height: int, *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5) -> b2Body:
-        ...
-
-    def create_dynamic_body(self, position: pygame.Vector2 | tuple[int, int], width: int, height: int, *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5) -> b2Body:
-        body: b2Body = self.CreateDynamicBody(position = self.to_b2_position(position, width, height))
-        body.CreatePolygonFixture(
-            box = (self.pixels_to_metres(width / 2), self.pixels_to_metres(height / 2)),
-            density = density,
-            friction = friction,
-            restitution = restitution
-        )
-
-        return body
-    
-    @overload
-    def create_kinematic_body(self, position: pygame.Vector2, width: int, height: int) -> b2Body:
-        ...
-
-    @overload
-    def create_kinematic_body(self, position: tuple[int, int], width: int, height: int) -> b2Body:
-        ...
-
-    def create_kinematic_body(self, position: pygame.Vector2 | tuple[int, int], width: int, height: int) -> b2Body:
-        body: b2Body = self.CreateKinematicBody(position = self.to_b2_position(position, width, height))
-        body.CreatePolygonFixture(
-            box = (self.pixels_to_metres(width / 2), self.pixels_to_metres(height / 2)),
-            density = 1
-        )
-
-        return body
-    
-    def tick(self, deltatime: float) -> None:
-        self.Step(PHYSICS_STEP, VEL_ITERS, POS_ITERS)
-
-    def render(self, surface: pygame.Surface, deltatime: float) -> None:
-        ground_vertices = [(self._ground_body.transform * v) * PPM for v in self._ground_body.fixtures[0].shape.vertices]
-        ground_vertices = [(v[0], self._height - v[1]) for v in ground_vertices]
-        pygame.draw.polygon(surface, (255, 50, 50), ground_vertices)
-
-        for body in self._bodies:
-            vertices = [(body.transform * vertex) * PPM for vertex in body.fixtures[0].shape.vertices]
-            vertices = [(v[0], self._height - v[1]) for v in vertices]
-
-            pygame.draw.polygon(surface, (255, 255, 255), vertices)
\ No newline at end of file
+import math
+import numpy as np
+import pygame
+
+from core.event.bus import EventBus
+from core.event.events import EngineEvent
+from core.logger import Logger
+from core.interfaces.tickable import Tickable
+from core.interfaces.renderable import Renderable
+from core.interfaces.listener import EventListener
+from core.physics.batch import BodyBatch
+from core.physics.contacts import CollisionBatch, ContactListener
+from core.physics.sensor import Sensor
+from core.render.coordinates import CoordinateTransform
+from core.render.spatial_hash import SpatialHash
+
+from Box2D import b2World, b2PolygonShape, b2ChainShape, b2BodyDef, b2Body, b2Fixture, b2FixtureDef, b2RayCastCallback, b2_dynamicBody, b2_kinematicBody, b2_staticBody
+from typing import TYPE_CHECKING, Final, overload
+
+if TYPE_CHECKING:
+    from core.render.camera import Camera
+
+PPM: Final[int | float] = 20
+PHYSICS_STEP: Final[float] = 1 / 60
+VEL_ITERS: Final[int] = 6
+POS_ITERS: Final[int] = 2
+MAX_SUBSTEPS: Final[int] = 5
+CULL_MARGIN: Final[int] = 64
+
+class _ClosestHit(b2RayCastCallback):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reset(None)
+
+    def reset(self, ignore: b2Body | None) -> None:
+        self.ignore: b2Body | None = ignore
+        self.fixture: b2Fixture | None = None
+        self.fraction: float = 1.0
+
+    def ReportFixture(self, fixture: b2Fixture, point, normal, fraction: float) -> float:
+        # Returning -1 skips the fixture, returning the fraction clips the ray to the closest hit so far
+        if fixture.sensor or fixture.body == self.ignore:
+            return -1.0
+
+        self.fixture = fixture
+        self.fraction = fraction
+        return fraction
+
+class World(b2World, Tickable, Renderable):
+    def __init__(self, width: int, height: int, gravity: float = -9.8, *, fixed_timestep: bool = True, max_substeps: int = MAX_SUBSTEPS) -> None:
+        super().__init__((0, gravity), doSleep = True)
+        EventListener.__init__(self)
+
+        self._logger: Logger = Logger("World")
+        self._gravity: float = gravity
+        self._width: int = width
+        self._height: int = height
+        self._fixed_timestep: bool = fixed_timestep
+        self._max_substeps: int = max_substeps
+        self._accumulator: float = 0.0
+        self._alpha: float = 1.0
+        # Box2D metres with y up to screen pixels with y down
+        self._to_screen: CoordinateTransform = CoordinateTransform((PPM, -PPM), (0, height))
+        self._to_world: CoordinateTransform = self._to_screen.inverse()
+        self._batch: BodyBatch = BodyBatch(self._to_screen)
+        self._camera: 'Camera | None' = None
+        self._contact_listener: ContactListener = ContactListener()
+        self._batching_contacts: bool = False
+        self._closest_hit: _ClosestHit = _ClosestHit()
+        self._step_count: int = 0
+        self._ground_body: b2BodyDef = self._create_ground_body()
+        self._bodies: list[b2Body] = [self.create_dynamic_body((200, 0), 40, 40, color = (255, 255, 255)), self.create_dynamic_body((210, 100), 40, 40, color = (255, 255, 255)), self.create_dynamic_body((600, 0), 40, 40, color = (255, 255, 255))]
+
+        # for body in bodies
+        # .render() if body instanceof MyBodyClass
+        # ^^^^^^ implementation
+
+    @property
+    def logger(self) -> Logger:
+        return self._logger
+
+    @property
+    def gravity(self) -> float:
+        return self._gravity
+    
+    @property
+    def width(self) -> int:
+        return self._width
+    
+    @property
+    def height(self) -> int:
+        return self._height
+    
+    @property
+    def fixed_timestep(self) -> bool:
+        return self._fixed_timestep
+    
+    @fixed_timestep.setter
+    def fixed_timestep(self, fixed_timestep: bool) -> None:
+        self._fixed_timestep = fixed_timestep
+        self._accumulator = 0.0
+        self._alpha = 1.0
+
+    @property
+    def max_substeps(self) -> int:
+        return self._max_substeps
+    
+    @max_substeps.setter
+    def max_substeps(self, max_substeps: int) -> None:
+        assert max_substeps > 0
+        self._max_substeps = max_substeps
+
+    @property
+    def batch(self) -> BodyBatch:
+        return self._batch
+
+    @property
+    def camera(self) -> 'Camera | None':
+        return self._camera
+    
+    @camera.setter
+    def camera(self, camera: 'Camera | None') -> None:
+        """Culls rendering to the camera's view; bodies are indexed in a spatial hash while a camera is set."""
+        self._camera = camera
+        if camera is None:
+            self._batch.spatial_hash = None
+        elif self._batch.spatial_hash is None:
+            self._batch.spatial_hash = SpatialHash()
+
+    @property
+    def alpha(self) -> float:
+        """How far the simulation has progressed from the previous step towards the next one, in [0, 1)."""
+        return self._alpha
+    
+    @property
+    def step_count(self) -> int:
+        """How many fixed physics steps have run, for caching per-step queries."""
+        return self._step_count
+
+    @property
+    def to_screen_transform(self) -> CoordinateTransform:
+        """Maps Box2D metres to screen pixels. Shared with the render batch."""
+        return self._to_screen
+
+    @property
+    def to_world_transform(self) -> CoordinateTransform:
+        return self._to_world
+
+    def pixels_to_metres(self, pixels: int) -> int | float:
+        return pixels / PPM
+    
+    @overload
+    def screen_to_world(self, position: pygame.Vector2) -> pygame.Vector2:
+        ...
+
+    @overload
+    def screen_to_world(self, position: tuple[int, int]) -> tuple[int, int]:
+        ...
+
+    def screen_to_world(self, position: pygame.Vector2 | tuple[int, int]) -> pygame.Vector2 | tuple[int, int]:
+        if isinstance(position, pygame.Vector2):
+            return pygame.Vector2(self.pixels_to_metres(position.x), self.pixels_to_metres(self._height - position.y))
+        elif isinstance(position, tuple):
+            return (self.pixels_to_metres(position[0]), self.pixels_to_metres(self._height - position[1]))
+        else:
+            self.logger.warn(f"Invalid position type passed to {self}.screen_to_world(...)")
+            return position
+        
+    @overload
+    def world_to_screen(self, position: pygame.Vector2) -> pygame.Vector2:
+        ...
+
+    @overload
+    def world_to_screen(self, position: tuple[int, int]) -> tuple[int, int]:
+        ...
+
+    def world_to_screen(self, position: pygame.Vector2 | tuple[int, int]) -> pygame.Vector2 | tuple[int, int]:
+        if isinstance(position, pygame.Vector2):
+            return pygame.Vector2(int(position.x * PPM), int(self._height - position.y * PPM))
+        elif isinstance(position, tuple):
+            return (int(position[0] * PPM), int(self._height - position[1] * PPM))
+        else:
+            self.logger.warn(f"Invalid position type passed to {self}.world_to_screen(...)")
+            return position
+    
+    @overload
+    def to_b2_position(self, position: pygame.Vector2, width: int, height: int) -> pygame.Vector2:
+        ...
+
+    @overload
+    def to_b2_position(self, position: tuple[float, float], width: int, height: int) -> tuple[float, float]:
+        ...
+
+    def to_b2_position(self, position: pygame.Vector2 | tuple[float, float], width: int, height: int) -> pygame.Vector2 | tuple[float, float]:
+        if isinstance(position, pygame.Vector2):
+            return self.screen_to_world(pygame.Vector2(position.x + width / 2, position.y + height / 2))
+        elif isinstance(position, tuple):
+            return self.screen_to_world((position[0] + width / 2, position[1] + height / 2))
+        else:
+            self.logger.warn(f"Invalid position type passed to {self}.to_b2_position(...)")
+            return position
+        
+    @overload
+    def from_b2_position(self, position: pygame.Vector2, width: int, height: int) -> pygame.Vector2:
+        ...
+
+    @overload
+    def from_b2_position(self, position: tuple[float, float], width: int, height: int) -> tuple[float, float]:
+        ...
+
+    def from_b2_position(self, position: pygame.Vector2 | tuple[float, float], width: int, height: int) -> pygame.Vector2 | tuple[float, float]:
+        if isinstance(position, pygame.Vector2):
+            screen_position: pygame.Vector2 = self.world_to_screen(position)
+            return pygame.Vector2(screen_position.x - width / 2, screen_position.y - height / 2)
+        elif isinstance(position, tuple):
+            screen_position: tuple[int, int] = self.world_to_screen(position)
+            return (screen_position[0] - width / 2, screen_position[1] - height / 2)
+        else:
+            self.logger.warn(f"Invalid position type passed to {self}.from_b2_position(...)")
+            return position
+    
+    def screen_to_world_array(self, positions: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Converts an (n, 2) array of screen pixels to metres in one pass. Pass out = positions to convert in place."""
+        return self._to_world.apply(positions, out = out)
+
+    def world_to_screen_array(self, positions: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Converts an (n, 2) array of metres to screen pixels. Unlike world_to_screen, the results are not truncated to ints."""
+        return self._to_screen.apply(positions, out = out)
+
+    def to_b2_positions(self, positions: np.ndarray, sizes: np.ndarray | tuple[float, float], out: np.ndarray | None = None) -> np.ndarray:
+        """Converts top-left pixel positions of (n, 2) or shared sizes to body centres in metres."""
+        out = np.add(positions, np.multiply(sizes, 0.5), out = out)
+        return self._to_world.apply(out, out = out)
+
+    def from_b2_positions(self, positions: np.ndarray, sizes: np.ndarray | tuple[float, float], out: np.ndarray | None = None) -> np.ndarray:
+        """Converts body centres in metres to top-left pixel positions for the given sizes."""
+        out = self._to_screen.apply(positions, out = out)
+        out -= np.multiply(sizes, 0.5)
+        return out
+
+    def _create_ground_body(self) -> b2BodyDef:
+        ground_height: int = 10
+        ground_height_metres: float = self.pixels_to_metres(ground_height)
+        ground: b2BodyDef = self.CreateStaticBody(
+            position = self.to_b2_position((0, self._height ), self._width, ground_height),
+            shapes = b2PolygonShape(box = (self.pixels_to_metres(self._width / 2), ground_height_metres))
+        )
+
+        for fixture in ground.fixtures:
+            fixture.restitution = 0.05
+
+        self._batch.add(ground, (255, 50, 50))
+        return ground
+    
+    @overload
+    def create_dynamic_body(self, position: pygame.Vector2, width: int, height: int, *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5, color: tuple[int, int, int] | None = None) -> b2Body:
+        ...
+
+    @overload
+    def create_dynamic_body(self, position: tuple[int, int], width: int, height: int, *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5, color: tuple[int, int, int] | None = None) -> b2Body:
+        ...
+
+    def create_dynamic_body(self, position: pygame.Vector2 | tuple[int, int], width: int, height: int, *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5, color: tuple[int, int, int] | None = None) -> b2Body:
+        body: b2Body = self.CreateDynamicBody(position = self.to_b2_position(position, width, height))
+        body.CreatePolygonFixture(
+            box = (self.pixels_to_metres(width / 2), self.pixels_to_metres(height / 2)),
+            density = density,
+            friction = friction,
+            restitution = restitution
+        )
+
+        self._batch.add(body, color)
+        return body
+    
+    @overload
+    def create_kinematic_body(self, position: pygame.Vector2, width: int, height: int, *, color: tuple[int, int, int] | None = None) -> b2Body:
+        ...
+
+    @overload
+    def create_kinematic_body(self, position: tuple[int, int], width: int, height: int, *, color: tuple[int, int, int] | None = None) -> b2Body:
+        ...
+
+    def create_kinematic_body(self, position: pygame.Vector2 | tuple[int, int], width: int, height: int, *, color: tuple[int, int, int] | None = None) -> b2Body:
+        body: b2Body = self.CreateKinematicBody(position = self.to_b2_position(position, width, height))
+        body.CreatePolygonFixture(
+            box = (self.pixels_to_metres(width / 2), self.pixels_to_metres(height / 2)),
+            density = 1
+        )
+
+        self._batch.add(body, color)
+        return body
+
+    def create_dynamic_bodies(self, positions: np.ndarray | list[tuple[float, float]], sizes: np.ndarray | list[tuple[float, float]] | tuple[float, float], *, density: float = 1.0, friction: float = 0.3, restitution: float = 0.5, color: tuple[int, int, int] | None = None) -> list[b2Body]:
+        """Creates one box body per top-left pixel position. sizes is one (width, height) for all bodies or one per body."""
+        return self._create_bodies(b2_dynamicBody, positions, sizes, density, friction, restitution, color)
+
+    def create_kinematic_bodies(self, positions: np.ndarray | list[tuple[float, float]], sizes: np.ndarray | list[tuple[float, float]] | tuple[float, float], *, color: tuple[int, int, int] | None = None) -> list[b2Body]:
+        return self._create_bodies(b2_kinematicBody, positions, sizes, 1.0, 0.2, 0.0, color)
+
+    def create_static_bodies(self, positions: np.ndarray | list[tuple[float, float]], sizes: np.ndarray | list[tuple[float, float]] | tuple[float, float], *, friction: float = 0.3, restitution: float = 0.05, color: tuple[int, int, int] | None = None) -> list[b2Body]:
+        return self._create_bodies(b2_staticBody, positions, sizes, 0.0, friction, restitution, color)
+
+    def create_chain_body(self, points: np.ndarray | list[tuple[float, float]], *, loop: bool = True, friction: float = 0.3, restitution: float = 0.05) -> b2Body:
+        """Creates a static body with one chain fixture through screen pixel points. Chains are collision only and are not drawn."""
+        vertices: list[list[float]] = self.screen_to_world_array(np.asarray(points, dtype = np.float64)).tolist()
+        shape: b2ChainShape = b2ChainShape(vertices_loop = vertices) if loop else b2ChainShape(vertices_chain = vertices)
+
+        body: b2Body = self.CreateStaticBody(position = (0, 0))
+        body.CreateFixture(b2FixtureDef(shape = shape, friction = friction, restitution = restitution))
+        return body
+
+    def _create_bodies(self, body_type: int, positions: np.ndarray | list[tuple[float, float]], sizes: np.ndarray | list[tuple[float, float]] | tuple[float, float], density: float, friction: float, restitution: float, color: tuple[int, int, int] | None) -> list[b2Body]:
+        positions = np.asarray(positions, dtype = np.float64).reshape(-1, 2)
+        sizes = np.broadcast_to(np.asarray(sizes, dtype = np.float64), positions.shape)
+
+        # Convert every body to metres in one pass instead of per call through to_b2_position
+        half_extents: np.ndarray = sizes / (2 * PPM)
+        centres: np.ndarray = self.to_b2_positions(positions, sizes)
+
+        # Reusing one body def and one fixture def per size skips pybox2d's per-call keyword handling
+        body_def: b2BodyDef = b2BodyDef()
+        body_def.type = body_type
+        fixture_defs: dict[tuple[float, float], b2FixtureDef] = {}
+
+        self._batch.reserve(len(positions))
+        bodies: list[b2Body] = []
+        for position, half_extent in zip(centres.tolist(), half_extents.tolist()):
+            fixture_def: b2FixtureDef | None = fixture_defs.get(tuple(half_extent))
+            if fixture_def is None:
+                fixture_def = b2FixtureDef(shape = b2PolygonShape(box = half_extent), density = density, friction = friction, restitution = restitution)
+                fixture_defs[tuple(half_extent)] = fixture_def
+
+            body_def.position = position
+            body: b2Body = self.CreateBody(body_def)
+            body.CreateFixture(fixture_def)
+            self._batch.add(body, color)
+            bodies.append(body)
+
+        return bodies
+
+    def destroy_body(self, body: b2Body) -> None:
+        self._batch.remove(body)
+        # Sensors go with the body, so stop counting them or the contact listener stays attached
+        sensors: int = sum(1 for fixture in body.fixtures if isinstance(fixture.userData, Sensor))
+        self.DestroyBody(body)
+        if sensors:
+            self._contact_listener.sensors -= sensors
+            self._update_contact_listener()
+
+    def create_sensor(self, body: b2Body, name: str, offset: tuple[float, float], width: float, height: float) -> Sensor:
+        """Attaches a box sensor to a body, centred offset pixels from the body's centre (y down), and counts what overlaps it."""
+        fixture: b2Fixture = body.CreatePolygonFixture(
+            box = (self.pixels_to_metres(width / 2), self.pixels_to_metres(height / 2), (self.pixels_to_metres(offset[0]), -self.pixels_to_metres(offset[1])), 0),
+            isSensor = True
+        )
+
+        sensor: Sensor = Sensor(name, fixture)
+        fixture.userData = sensor
+        self._contact_listener.sensors += 1
+        self._update_contact_listener()
+        return sensor
+
+    def destroy_sensor(self, body: b2Body, sensor: Sensor) -> None:
+        body.DestroyFixture(sensor.fixture)
+        self._contact_listener.sensors -= 1
+        self._update_contact_listener()
+
+    def raycast(self, start: tuple[float, float], end: tuple[float, float], *, ignore: b2Body | None = None) -> tuple[b2Fixture, float] | None:
+        """Returns the closest non-sensor fixture between two screen pixel points and its distance from start in pixels, or None."""
+        start_metres: tuple[float, float] = self._to_world.apply_point(*start)
+        end_metres: tuple[float, float] = self._to_world.apply_point(*end)
+        if start_metres == end_metres:
+            return None
+
+        hit: _ClosestHit = self._closest_hit
+        hit.reset(ignore)
+        self.RayCast(hit, start_metres, end_metres)
+        fixture, fraction = hit.fixture, hit.fraction
+        # Do not keep the fixtures alive through the shared callback
+        hit.reset(None)
+        if fixture is None:
+            return None
+
+        return (fixture, fraction * math.hypot(end[0] - start[0], end[1] - start[1]))
+
+    def set_collision_filter(self, body: b2Body, category: int, mask: int = 0xFFFF) -> None:
+        """Sets the category bits COLLISION subscribers filter on, and which categories the body collides with, for all its fixtures."""
+        for fixture in body.fixtures:
+            # Assigning filterData back makes Box2D re-filter the fixture's existing contacts
+            filter_data = fixture.filterData
+            filter_data.categoryBits = category
+            filter_data.maskBits = mask
+            fixture.filterData = filter_data
+
+    def set_body_color(self, body: b2Body, color: tuple[int, int, int] | None) -> None:
+        """Sets the color World.render draws a body with, or stops drawing it when None."""
+        if body not in self._batch:
+            self._batch.add(body, color)
+        else:
+            self._batch.set_color(body, color)
+    
+    def get_interpolated_transform(self, body: b2Body) -> tuple[float, float, float]:
+        """Returns the body's x, y and angle in world units, blended between the last two steps by alpha."""
+        transform: tuple[float, float, float] | None = self._batch.get_interpolated_transform(body, self._alpha)
+        if transform is None:
+            position = body.position
+            return (position[0], position[1], body.angle)
+        
+        return transform
+    
+    def _step(self) -> None:
+        self._batch.store_previous()
+        self._contact_listener.recording = self._batching_contacts
+        self.Step(PHYSICS_STEP, VEL_ITERS, POS_ITERS)
+        self._contact_listener.recording = False
+        self._step_count += 1
+        self._batch.refresh()
+
+    def _update_contact_listener(self) -> None:
+        # pybox2d calls into Python for every contact while a listener is set, so only set one while it is needed
+        self._batching_contacts = EventBus.subscriber_count(EngineEvent.COLLISION) > 0
+        listening: bool = self._batching_contacts or self._contact_listener.sensors > 0
+        if listening != (self.contactListener is not None):
+            self.contactListener = self._contact_listener if listening else None
+
+    def _emit_collisions(self) -> None:
+        # One event for every contact of every substep, rather than a callback per contact
+        batch: CollisionBatch | None = self._contact_listener.flush()
+        if batch is not None:
+            EventBus.emit_fast(EngineEvent.COLLISION, batch)
+
+    def tick(self, deltatime: float) -> None:
+        self._update_contact_listener()
+        if not self._fixed_timestep:
+            self._step()
+            self._emit_collisions()
+            return
+        
+        self._accumulator += deltatime
+
+        steps: int = 0
+        while self._accumulator >= PHYSICS_STEP and steps < self._max_substeps:
+            self._step()
+            self._accumulator -= PHYSICS_STEP
+            steps += 1
+
+        # Too far behind to catch up this frame; drop the backlog rather than spiralling.
+        if self._accumulator >= PHYSICS_STEP:
+            self._accumulator %= PHYSICS_STEP
+
+        self._alpha = self._accumulator / PHYSICS_STEP
+        self._emit_collisions()
+
+    def render(self, surface: pygame.Surface, deltatime: float) -> None:
+        if self._camera is None:
+            self._batch.render(surface, self._alpha)
+        else:
+            self._batch.render(surface, self._alpha, self._camera.view_rect.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2))
\ No newline at end of file
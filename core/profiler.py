@@ -0,0 +1,193 @@
+import json
+
+from collections import defaultdict, deque
+from enum import Enum
+from time import perf_counter_ns
+from typing import Callable, Final
+
+from core.event import bus
+from core.event.bus import EventBus
+
+DEFAULT_CAPACITY: Final[int] = 1 << 16
+PHASE: Final[str] = "phase"
+
+# (frame, category, name, start ns, duration ns)
+Record = tuple[int, str, str, int, int]
+
+class Profiler():
+    enabled: bool = False
+    _records: list[Record | None] = []
+    _capacity: int = 0
+    _head: int = 0
+    _frame: int = 0
+    _mark: int = 0
+    _names: dict[Callable, str] = {}
+    # Timings from other threads; deque appends and pops are atomic, so they queue here until the main thread stores them
+    _foreign: deque[Record] = deque()
+    _emit: Callable | None = None
+    _emit_fast: Callable | None = None
+
+    @staticmethod
+    def enable(capacity: int = DEFAULT_CAPACITY) -> None:
+        """Starts recording. Event bus emits are swapped for timed versions, so nothing is measured or paid for while disabled."""
+        assert capacity > 0
+        if Profiler.enabled:
+            return
+
+        Profiler._records = [None] * capacity
+        Profiler._capacity = capacity
+        Profiler._head = 0
+        Profiler._mark = perf_counter_ns()
+
+        Profiler._emit = EventBus.emit
+        Profiler._emit_fast = EventBus.emit_fast
+        EventBus.emit = staticmethod(Profiler._profiled_emit)
+        EventBus.emit_fast = staticmethod(Profiler._profiled_emit_fast)
+        Profiler.enabled = True
+
+    @staticmethod
+    def disable() -> None:
+        if not Profiler.enabled:
+            return
+
+        EventBus.emit = staticmethod(Profiler._emit)
+        EventBus.emit_fast = staticmethod(Profiler._emit_fast)
+        # Cached names hold bound methods, which would keep removed entities alive
+        Profiler._names.clear()
+        Profiler.enabled = False
+
+    @staticmethod
+    def toggle() -> None:
+        if Profiler.enabled:
+            Profiler.disable()
+        else:
+            Profiler.enable(Profiler._capacity or DEFAULT_CAPACITY)
+
+    @staticmethod
+    def clear() -> None:
+        Profiler._records = [None] * Profiler._capacity
+        Profiler._head = 0
+        Profiler._foreign.clear()
+
+    @staticmethod
+    def record(category: str, name: str, start: int, duration: int) -> None:
+        """Stores a timing in the ring buffer, overwriting the oldest once it is full. Main thread only; see record_from_thread."""
+        Profiler._records[Profiler._head % Profiler._capacity] = (Profiler._frame, category, name, start, duration)
+        Profiler._head += 1
+
+    @staticmethod
+    def _store(record: Record) -> None:
+        Profiler._records[Profiler._head % Profiler._capacity] = record
+        Profiler._head += 1
+
+    @staticmethod
+    def record_from_thread(category: str, name: str, start: int, duration: int) -> None:
+        """Queues a timing taken off the main thread. record is not thread-safe; these are stored at the next begin_frame."""
+        Profiler._foreign.append((Profiler._frame, category, name, start, duration))
+
+    @staticmethod
+    def begin_frame(frame: int) -> None:
+        foreign: deque[Record] = Profiler._foreign
+        while foreign:
+            Profiler._store(foreign.popleft())
+
+        Profiler._frame = frame
+        Profiler._mark = perf_counter_ns()
+
+    @staticmethod
+    def phase(name: str) -> None:
+        """Closes a main loop phase that started at the previous phase boundary."""
+        now: int = perf_counter_ns()
+        Profiler.record(PHASE, name, Profiler._mark, now - Profiler._mark)
+        Profiler._mark = now
+
+    @staticmethod
+    def get_records() -> list[Record]:
+        """Returns the buffered records, oldest first."""
+        if Profiler._head <= Profiler._capacity:
+            return Profiler._records[:Profiler._head]
+
+        split: int = Profiler._head % Profiler._capacity
+        return Profiler._records[split:] + Profiler._records[:split]
+
+    @staticmethod
+    def get_frame_breakdown(frames: int = 60) -> tuple[dict[str, float], dict[str, float]]:
+        """Returns the average milliseconds per frame spent in each main loop phase and in each callback, over the last frames."""
+        last: int = Profiler._frame
+        phases: dict[str, int] = defaultdict(int)
+        callbacks: dict[str, int] = defaultdict(int)
+        seen: set[int] = set()
+
+        for frame, category, name, _, duration in reversed(Profiler.get_records()):
+            if frame <= last - frames:
+                break
+
+            seen.add(frame)
+            if category == PHASE:
+                phases[name] += duration
+            else:
+                callbacks[f"{category}:{name}"] += duration
+
+        count: int = max(len(seen), 1)
+        return (
+            # Records were walked newest first, so reverse to get the phases in loop order
+            {name: total / count / 1e6 for name, total in reversed(phases.items())},
+            {name: total / count / 1e6 for name, total in sorted(callbacks.items(), key = lambda item: -item[1])}
+        )
+
+    @staticmethod
+    def export_chrome_trace(path: str) -> None:
+        """Writes the buffer in the Chrome trace event format, viewable in chrome://tracing or Perfetto."""
+        events: list[dict] = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000.0,
+                "dur": duration / 1000.0,
+                "pid": 0,
+                "tid": 0,
+                "args": {"frame": frame}
+            }
+            for frame, category, name, start, duration in Profiler.get_records()
+        ]
+
+        with open(path, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    @staticmethod
+    def _get_name(callback: Callable) -> str:
+        name: str | None = Profiler._names.get(callback)
+        if name is None:
+            instance: object | None = getattr(callback, "__self__", None)
+            if instance is not None and not isinstance(instance, type):
+                name = f"{type(instance).__name__}.{callback.__name__}"
+            else:
+                name = getattr(callback, "__qualname__", repr(callback))
+            Profiler._names[callback] = name
+
+        return name
+
+    @staticmethod
+    def _dispatch(event: str, args: tuple, kwargs: dict) -> int:
+        callbacks: tuple[Callable, ...] | None = bus._bus_dispatch.get(event)
+        if callbacks is None:
+            callbacks = EventBus._rebuild(event)
+
+        for callback in callbacks:
+            start: int = perf_counter_ns()
+            callback(*args, **kwargs)
+            Profiler.record(event, Profiler._get_name(callback), start, perf_counter_ns() - start)
+
+        return len(callbacks)
+
+    @staticmethod
+    def _profiled_emit(event: Enum | str, /, *args, **kwargs) -> int:
+        if EventBus.validate_event(event) is None:
+            return 0
+
+        return Profiler._dispatch(event.value if isinstance(event, Enum) else event, args, kwargs)
+
+    @staticmethod
+    def _profiled_emit_fast(event: Enum, /, *args) -> int:
+        return Profiler._dispatch(event._value_, args, {})
\ No newline at end of file
@@ -0,0 +1,55 @@
+import numpy as np
+
+class CoordinateTransform():
+    # Axis-aligned affine transform: x' = x * scale_x + offset_x, y' = y * scale_y + offset_y.
+    # Mutable, so everything sharing an instance sees updates, e.g. when a camera moves.
+    def __init__(self, scale: tuple[float, float] = (1.0, 1.0), offset: tuple[float, float] = (0.0, 0.0)) -> None:
+        self._scale: np.ndarray = np.zeros(2)
+        self._offset: np.ndarray = np.zeros(2)
+        self.set(scale, offset)
+
+    @property
+    def scale(self) -> tuple[float, float]:
+        return (self._scale_x, self._scale_y)
+
+    @property
+    def offset(self) -> tuple[float, float]:
+        return (self._offset_x, self._offset_y)
+
+    def set(self, scale: tuple[float, float], offset: tuple[float, float]) -> None:
+        assert scale[0] != 0 and scale[1] != 0
+        self._scale[:] = scale
+        self._offset[:] = offset
+        # Plain floats for the scalar path, which is faster than indexing the arrays
+        self._scale_x, self._scale_y = float(scale[0]), float(scale[1])
+        self._offset_x, self._offset_y = float(offset[0]), float(offset[1])
+
+    def apply(self, points: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Transforms an (..., 2) array of points in one vectorized pass. Pass out = points to convert a buffer in place."""
+        out = np.multiply(points, self._scale, out = out)
+        out += self._offset
+        return out
+
+    def apply_sizes(self, sizes: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Scales an (..., 2) array of extents, ignoring the offset. Extents stay positive when an axis is flipped."""
+        out = np.multiply(sizes, self._scale, out = out)
+        return np.abs(out, out = out)
+
+    def apply_point(self, x: float, y: float) -> tuple[float, float]:
+        return (x * self._scale_x + self._offset_x, y * self._scale_y + self._offset_y)
+
+    def inverse(self) -> "CoordinateTransform":
+        return CoordinateTransform(
+            (1.0 / self._scale_x, 1.0 / self._scale_y),
+            (-self._offset_x / self._scale_x, -self._offset_y / self._scale_y)
+        )
+
+    def then(self, other: "CoordinateTransform") -> "CoordinateTransform":
+        """Returns a transform that applies this one and then other, as a single multiply-add."""
+        return CoordinateTransform(
+            (self._scale_x * other._scale_x, self._scale_y * other._scale_y),
+            (self._offset_x * other._scale_x + other._offset_x, self._offset_y * other._scale_y + other._offset_y)
+        )
+
+    def __repr__(self) -> str:
+        return f"CoordinateTransform(scale = {self.scale}, offset = {self.offset})"
\ No newline at end of file
@@ -0,0 +1,65 @@
+import pygame
+
+from typing import Final
+
+# Past this share of the frame, one full present is cheaper than many partial ones
+FULL_FRAME_RATIO: Final[float] = 0.5
+
+class DirtyRects():
+    enabled: bool = False
+    _rects: list[pygame.Rect] = []
+    _full: bool = False
+
+    @staticmethod
+    def enable(enabled: bool = True) -> None:
+        DirtyRects.enabled = enabled
+        DirtyRects._rects.clear()
+        DirtyRects._full = enabled
+
+    @staticmethod
+    def mark(rect: pygame.Rect | tuple[float, float, float, float]) -> None:
+        """Reports an area of the display whose pixels changed this frame."""
+        if DirtyRects.enabled and not DirtyRects._full:
+            DirtyRects._rects.append(pygame.Rect(rect))
+
+    @staticmethod
+    def mark_all() -> None:
+        """Reports that the whole display changed, e.g. after a scene switch."""
+        if DirtyRects.enabled:
+            DirtyRects._full = True
+            DirtyRects._rects.clear()
+
+    @staticmethod
+    def collect(bounds: pygame.Rect) -> list[pygame.Rect]:
+        """Returns this frame's dirty areas clipped to bounds with overlaps merged, and resets for the next frame. A full frame comes back as [bounds]."""
+        full: bool = DirtyRects._full
+        rects: list[pygame.Rect] = DirtyRects._rects
+        DirtyRects._full = False
+        DirtyRects._rects = []
+
+        if full:
+            return [bounds.copy()]
+
+        merged: list[pygame.Rect] = DirtyRects.merge([rect.clip(bounds) for rect in rects])
+        if sum(rect.width * rect.height for rect in merged) > bounds.width * bounds.height * FULL_FRAME_RATIO:
+            return [bounds.copy()]
+
+        return merged
+
+    @staticmethod
+    def merge(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Unions overlapping rects until none overlap. Empty rects are dropped."""
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            # A union can grow into rects merged earlier, so keep absorbing until it is disjoint
+            index: int = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        return merged
\ No newline at end of file
@@ -0,0 +1,98 @@
+import pygame
+import threading
+
+from time import perf_counter_ns
+from typing import Callable
+
+from core.logger import Logger
+from core.profiler import Profiler
+from core.render.snapshot import RenderSnapshot
+
+class RenderPipeline():
+    """Replays recorded frames and presents them on a render thread, one frame behind the main loop. Two snapshots alternate:
+    the main thread records the next frame into one while the render thread draws the other."""
+
+    def __init__(self, surface: pygame.Surface, present: Callable[[pygame.Surface, list[pygame.Rect] | None], None]) -> None:
+        self._logger: Logger = Logger("RenderPipeline")
+        self._surface: pygame.Surface = surface
+        self._present: Callable[[pygame.Surface, list[pygame.Rect] | None], None] = present
+        self._snapshots: tuple[RenderSnapshot, RenderSnapshot] = (RenderSnapshot(surface.get_size()), RenderSnapshot(surface.get_size()))
+        self._index: int = 0
+
+        self._condition: threading.Condition = threading.Condition()
+        self._pending: RenderSnapshot | None = None
+        self._running: bool = False
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target = self._run, name = "render", daemon = True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Finishes the frame in flight and stops the render thread."""
+        if not self._running:
+            return
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending is None)
+            self._running = False
+            self._condition.notify_all()
+
+        self._thread.join()
+        self._thread = None
+
+        # The last frame's present can fail with no submit left to report it
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def begin(self) -> RenderSnapshot:
+        """Returns the snapshot to record the next frame into. The render thread never holds it, so no waiting is needed."""
+        snapshot: RenderSnapshot = self._snapshots[self._index]
+        snapshot.clear()
+        return snapshot
+
+    def submit(self, snapshot: RenderSnapshot) -> None:
+        """Waits for the previous frame to finish presenting, then hands this one to the render thread."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending is None)
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+
+            self._pending = snapshot
+            self._condition.notify_all()
+
+        self._index ^= 1
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or not self._running)
+                if self._pending is None:
+                    return
+                snapshot: RenderSnapshot = self._pending
+
+            try:
+                start: int = perf_counter_ns()
+                # Blits, scales and flips release the GIL, so most of this overlaps the main thread's next tick
+                snapshot.replay(self._surface)
+                self._present(self._surface, snapshot.dirty)
+                if Profiler.enabled:
+                    Profiler.record_from_thread("pipeline", "present", start, perf_counter_ns() - start)
+            except BaseException as error:
+                self._logger.error(f"Render thread failed: {error!r}")
+                self._error = error
+
+            with self._condition:
+                self._pending = None
+                self._condition.notify_all()
\ No newline at end of file
@@ -0,0 +1,134 @@
+import pygame
+
+from enum import Enum
+from math import ceil, gcd
+
+class ScaleFilter(Enum):
+    NEAREST = "nearest"
+    SMOOTH = "smooth"
+    INTEGER = "integer"
+
+class Presenter():
+    def __init__(self, screen: pygame.Surface, source_size: tuple[int, int], scale_filter: ScaleFilter = ScaleFilter.NEAREST, background: tuple[int, int, int] = (0, 0, 0)) -> None:
+        self._screen: pygame.Surface = screen
+        self._source_size: tuple[int, int] = source_size
+        self._scale_filter: ScaleFilter = scale_filter
+        self._background: tuple[int, int, int] = background
+
+        self._screen_size: tuple[int, int] = (0, 0)
+        self._target: pygame.Surface = screen
+        self._target_rect: pygame.Rect = screen.get_rect()
+        self._passthrough: bool = False
+        self._period: tuple[int, int, int, int] = (1, 1, 1, 1)
+        self._layout()
+
+    @property
+    def scale_filter(self) -> ScaleFilter:
+        return self._scale_filter
+
+    @scale_filter.setter
+    def scale_filter(self, scale_filter: ScaleFilter) -> None:
+        self._scale_filter = scale_filter
+        self._layout()
+
+    @property
+    def passthrough(self) -> bool:
+        """True when frames land at the internal resolution and are blitted unscaled."""
+        return self._passthrough
+
+    @property
+    def target_rect(self) -> pygame.Rect:
+        """Where the scaled frame lands on the screen."""
+        return self._target_rect
+
+    @property
+    def scale(self) -> tuple[float, float]:
+        return (self._target_rect.width / self._source_size[0], self._target_rect.height / self._source_size[1])
+
+    def _layout(self) -> None:
+        """Works out the destination rect and the preallocated surface frames are scaled into."""
+        screen_size: tuple[int, int] = self._screen.get_size()
+        source_width, source_height = self._source_size
+        self._screen_size = screen_size
+        self._passthrough = screen_size == self._source_size
+
+        if self._passthrough or self._scale_filter != ScaleFilter.INTEGER:
+            self._target_rect = self._screen.get_rect()
+            self._target = self._screen
+            self._update_period()
+            return
+
+        screen_width, screen_height = screen_size
+        factor: int = min(screen_width // source_width, screen_height // source_height)
+        if factor >= 1:
+            size: tuple[int, int] = (source_width * factor, source_height * factor)
+        else:
+            # Window smaller than the internal resolution: shrink by the smallest whole divisor that fits
+            divisor: int = ceil(max(source_width / screen_width, source_height / screen_height))
+            size: tuple[int, int] = (source_width // divisor, source_height // divisor)
+
+        self._target_rect = pygame.Rect((0, 0), size)
+        self._target_rect.center = self._screen.get_rect().center
+        # A subsurface shares the screen's pixels, so scaling into it writes straight to the screen
+        self._target = self._screen.subsurface(self._target_rect)
+        self._passthrough = size == self._source_size
+        self._screen.fill(self._background)
+        self._update_period()
+
+    def _update_period(self) -> None:
+        """Finds the smallest source and target blocks the scale maps onto each other exactly, per axis."""
+        source_width, source_height = self._source_size
+        target_width, target_height = self._target_rect.size
+        divisor_x: int = gcd(source_width, target_width)
+        divisor_y: int = gcd(source_height, target_height)
+        self._period = (source_width // divisor_x, target_width // divisor_x, source_height // divisor_y, target_height // divisor_y)
+
+    def present(self, surface: pygame.Surface) -> None:
+        """Scales the frame into the screen without allocating an intermediate surface."""
+        if self._screen.get_size() != self._screen_size:
+            self._layout()
+
+        if self._passthrough:
+            self._target.blit(surface, (0, 0))
+        elif self._scale_filter == ScaleFilter.SMOOTH:
+            pygame.transform.smoothscale(surface, self._target_rect.size, self._target)
+        else:
+            pygame.transform.scale(surface, self._target_rect.size, self._target)
+
+    def present_regions(self, surface: pygame.Surface, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """Scales only the given areas of the frame into the screen and returns the screen rects that changed."""
+        if self._screen.get_size() != self._screen_size:
+            self.present(surface)
+            return [self._screen.get_rect()]
+
+        offset: tuple[int, int] = self._target_rect.topleft
+        if self._passthrough:
+            for rect in rects:
+                self._target.blit(surface, rect, rect)
+            return [rect.move(offset) for rect in rects]
+
+        source_x, target_x, source_y, target_y = self._period
+        source_bounds: pygame.Rect = surface.get_rect()
+        updated: list[pygame.Rect] = []
+
+        for rect in rects:
+            # Snap to whole scale periods so each region samples exactly like a full-frame scale would
+            left: int = rect.left // source_x
+            top: int = rect.top // source_y
+            right: int = ceil(rect.right / source_x)
+            bottom: int = ceil(rect.bottom / source_y)
+            if right <= left or bottom <= top:
+                continue
+
+            source: pygame.Rect = pygame.Rect(left * source_x, top * source_y, (right - left) * source_x, (bottom - top) * source_y).clip(source_bounds)
+            destination: pygame.Rect = pygame.Rect(left * target_x, top * target_y, (right - left) * target_x, (bottom - top) * target_y)
+
+            region: pygame.Surface = surface.subsurface(source)
+            if self._scale_filter == ScaleFilter.SMOOTH:
+                pygame.transform.smoothscale(region, destination.size, self._target.subsurface(destination))
+            else:
+                pygame.transform.scale(region, destination.size, self._target.subsurface(destination))
+
+            updated.append(destination.move(offset))
+
+        return updated
\ No newline at end of file
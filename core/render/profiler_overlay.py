@@ -0,0 +1,54 @@
+import pygame
+
+from core.event.bus import EventBus
+from core.event.events import EngineEvent
+from core.interfaces.renderable import Renderable
+from core.profiler import Profiler
+from core.render.dirty_rects import DirtyRects
+
+class ProfilerOverlay(Renderable):
+    def __init__(self, position: tuple[int, int] = (8, 8), frames: int = 60, refresh_interval: float = 0.25, max_callbacks: int = 10) -> None:
+        # Lowest priority so the overlay draws over everything else
+        EventBus.subscribe(EngineEvent.RENDER, self.render, priority = -1000)
+
+        self._position: tuple[int, int] = position
+        self._frames: int = frames
+        self._refresh_interval: float = refresh_interval
+        self._max_callbacks: int = max_callbacks
+        self._since_refresh: float = refresh_interval
+        self._surface: pygame.Surface | None = None
+        self.visible: bool = True
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self._font: pygame.font.Font = pygame.font.Font(None, 20)
+
+    def _build_lines(self) -> list[str]:
+        phases, callbacks = Profiler.get_frame_breakdown(self._frames)
+        lines: list[str] = [f"frame {sum(phases.values()):6.2f} ms"]
+        lines.extend(f"  {name:<8} {time:6.2f} ms" for name, time in phases.items())
+        lines.extend(f"{time:6.2f} ms  {name}" for name, time in list(callbacks.items())[:self._max_callbacks])
+        return lines
+
+    def _redraw(self) -> None:
+        lines: list[str] = self._build_lines()
+        line_height: int = self._font.get_linesize()
+        surfaces: list[pygame.Surface] = [self._font.render(line, True, (255, 255, 255)) for line in lines]
+
+        width: int = max(surface.get_width() for surface in surfaces) + 8
+        self._surface = pygame.Surface((width, line_height * len(surfaces) + 8), pygame.SRCALPHA)
+        self._surface.fill((0, 0, 0, 180))
+        for index, surface in enumerate(surfaces):
+            self._surface.blit(surface, (4, 4 + index * line_height))
+
+    def render(self, surface: pygame.Surface, deltatime: float) -> None:
+        if not self.visible or not Profiler.enabled:
+            return
+
+        # Text is only re-laid out a few times a second; between refreshes the cached surface is blitted
+        self._since_refresh += deltatime
+        if self._since_refresh >= self._refresh_interval or self._surface is None:
+            self._since_refresh = 0.0
+            self._redraw()
+
+        DirtyRects.mark(surface.blit(self._surface, self._position))
\ No newline at end of file
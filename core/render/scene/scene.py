@@ -1,22 +1,35 @@
-import pygame
-
-from core.interfaces.tickable import Tickable
-from core.interfaces.renderable import Renderable
-from core.interfaces.listener import EventListener
-
-from core.entity.entity_manager import EntityManager
-
-from core.physics.world import World
-
-class Scene(Tickable, Renderable, EventListener):
-    def __init__(self) -> None:
-        EventListener.__init__(self)
-
-        self.entity_manager: EntityManager = EntityManager()
-        self.world: World = World(1920, 1080)
-
-    def tick(self, deltatime: float) -> None:
-        ...
-
-    def render(self, surface: pygame.Surface, deltatime: float) -> None:
+import pygame
+
+from core.interfaces.tickable import Tickable
+from core.interfaces.renderable import Renderable
+from core.interfaces.listener import EventListener
+
+from core.entity.entity_manager import EntityManager
+
+from core.physics.world import World
+from core.render.camera import Camera
+
+class Scene(Tickable, Renderable, EventListener):
+    def __init__(self) -> None:
+        EventListener.__init__(self)
+
+        self.entity_manager: EntityManager = EntityManager()
+        self.world: World = World(1920, 1080)
+        self._camera: Camera | None = None
+
+    @property
+    def camera(self) -> Camera | None:
+        return self._camera
+    
+    @camera.setter
+    def camera(self, camera: Camera | None) -> None:
+        """Sets the camera that culls the scene's entities and physics bodies."""
+        self._camera = camera
+        self.entity_manager.camera = camera
+        self.world.camera = camera
+
+    def tick(self, deltatime: float) -> None:
+        ...
+
+    def render(self, surface: pygame.Surface, deltatime: float) -> None:
         ...
\ No newline at end of file
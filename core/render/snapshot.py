@@ -0,0 +1,115 @@
+import pygame
+
+from typing import Callable, Iterable, Sequence
+
+Color = tuple[int, int, int] | tuple[int, int, int, int]
+
+class RenderSnapshot():
+    """Stands in for the display surface during RENDER in pipelined mode. Draw calls are recorded with copies of their positions,
+    so a render thread can replay them while the next tick mutates game state. Images are kept by reference and must not be
+    drawn into afterwards; sprites are immutable, and anything redrawn in place should be copied or replaced instead."""
+
+    def __init__(self, size: tuple[int, int]) -> None:
+        self._rect: pygame.Rect = pygame.Rect((0, 0), size)
+        self._commands: list[tuple] = []
+        # Consecutive plain blits are replayed through one Surface.blits call
+        self._blits: list[tuple[pygame.Surface, tuple[float, float]]] = []
+        self.dirty: list[pygame.Rect] | None = None
+
+    def __len__(self) -> int:
+        return len(self._commands) + (1 if self._blits else 0)
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        rect: pygame.Rect = self._rect.copy()
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def get_size(self) -> tuple[int, int]:
+        return self._rect.size
+
+    def get_width(self) -> int:
+        return self._rect.width
+
+    def get_height(self) -> int:
+        return self._rect.height
+
+    def fill(self, color: Color, rect: pygame.Rect | None = None, special_flags: int = 0) -> pygame.Rect:
+        self._flush_blits()
+        self._commands.append((_fill, color, None if rect is None else pygame.Rect(rect), special_flags))
+        return self._rect.copy() if rect is None else pygame.Rect(rect).clip(self._rect)
+
+    def blit(self, source: pygame.Surface, dest: Sequence[float] | pygame.Rect, area: pygame.Rect | None = None, special_flags: int = 0) -> pygame.Rect:
+        """Records a blit and returns the area it will cover, like Surface.blit."""
+        position: tuple[float, float] = (dest[0], dest[1])
+        if area is None and special_flags == 0:
+            self._blits.append((source, position))
+            size: tuple[int, int] = source.get_size()
+        else:
+            self._flush_blits()
+            area = None if area is None else pygame.Rect(area)
+            self._commands.append((_blit, source, position, area, special_flags))
+            size: tuple[int, int] = source.get_size() if area is None else area.size
+
+        return pygame.Rect(position, size).clip(self._rect)
+
+    def blits(self, sequence: Iterable[tuple], doreturn: bool = True) -> list[pygame.Rect] | None:
+        rects: list[pygame.Rect] = [self.blit(*entry) for entry in sequence]
+        return rects if doreturn else None
+
+    def draw_polygons(self, colors: Sequence[Color], polygons: Sequence[Sequence[Sequence[float]]]) -> None:
+        self._flush_blits()
+        self._commands.append((_draw_polygons, colors, polygons))
+
+    def draw_rect(self, color: Color, rect: pygame.Rect, width: int = 0) -> None:
+        self._flush_blits()
+        self._commands.append((_draw_rect, color, pygame.Rect(rect), width))
+
+    def call(self, callback: Callable[..., None], *args) -> None:
+        """Records callback(surface, *args) to run on the render thread. args should not be mutated by later ticks."""
+        self._flush_blits()
+        self._commands.append((callback, *args))
+
+    def replay(self, surface: pygame.Surface) -> None:
+        self._flush_blits()
+        for function, *args in self._commands:
+            function(surface, *args)
+
+    def clear(self) -> None:
+        self._commands.clear()
+        self._blits = []
+        self.dirty = None
+
+    def _flush_blits(self) -> None:
+        if self._blits:
+            self._commands.append((_blits, self._blits))
+            self._blits = []
+
+def _fill(surface: pygame.Surface, color: Color, rect: pygame.Rect | None, special_flags: int) -> None:
+    surface.fill(color, rect, special_flags)
+
+def _blit(surface: pygame.Surface, source: pygame.Surface, position: tuple[float, float], area: pygame.Rect | None, special_flags: int) -> None:
+    surface.blit(source, position, area, special_flags)
+
+def _blits(surface: pygame.Surface, sequence: list[tuple[pygame.Surface, tuple[float, float]]]) -> None:
+    surface.blits(sequence, False)
+
+def _draw_polygons(surface: pygame.Surface, colors: Sequence[Color], polygons: Sequence[Sequence[Sequence[float]]]) -> None:
+    for color, polygon in zip(colors, polygons):
+        pygame.draw.polygon(surface, color, polygon)
+
+def _draw_rect(surface: pygame.Surface, color: Color, rect: pygame.Rect, width: int) -> None:
+    pygame.draw.rect(surface, color, rect, width)
+
+def draw_polygons(surface: pygame.Surface | RenderSnapshot, colors: Sequence[Color], polygons: Sequence[Sequence[Sequence[float]]]) -> None:
+    """Draws filled polygons onto a surface, or records them when rendering into a snapshot."""
+    if isinstance(surface, RenderSnapshot):
+        surface.draw_polygons(colors, polygons)
+    else:
+        _draw_polygons(surface, colors, polygons)
+
+def draw_rect(surface: pygame.Surface | RenderSnapshot, color: Color, rect: pygame.Rect, width: int = 0) -> None:
+    if isinstance(surface, RenderSnapshot):
+        surface.draw_rect(color, rect, width)
+    else:
+        pygame.draw.rect(surface, color, rect, width)
\ No newline at end of file
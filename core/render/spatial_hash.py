@@ -0,0 +1,85 @@
+import pygame
+
+from math import floor
+from typing import Hashable
+
+class SpatialHash():
+    def __init__(self, cell_size: int = 256) -> None:
+        assert cell_size > 0
+
+        self._cell_size: int = cell_size
+        self._cells: dict[tuple[int, int], set[Hashable]] = {}
+        self._ranges: dict[Hashable, tuple[int, int, int, int]] = {}
+
+    @property
+    def cell_size(self) -> int:
+        return self._cell_size
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._ranges
+
+    def get_cell_range(self, rect: pygame.Rect | tuple[float, float, float, float]) -> tuple[int, int, int, int]:
+        """Returns the inclusive (left, top, right, bottom) cell coordinates covered by an (x, y, width, height) rect."""
+        x, y, width, height = rect
+        cell_size: int = self._cell_size
+        return (floor(x / cell_size), floor(y / cell_size), floor((x + width) / cell_size), floor((y + height) / cell_size))
+
+    def update(self, item: Hashable, rect: pygame.Rect | tuple[float, float, float, float]) -> None:
+        """Inserts an item or moves it to its new bounds, touching the grid only when the set of covered cells changed."""
+        self.move(item, self.get_cell_range(rect))
+
+    def move(self, item: Hashable, cell_range: tuple[int, int, int, int]) -> None:
+        previous: tuple[int, int, int, int] | None = self._ranges.get(item)
+        if previous == cell_range:
+            return
+
+        if previous is not None:
+            self._unlink(item, previous)
+
+        self._ranges[item] = cell_range
+        cells: dict[tuple[int, int], set[Hashable]] = self._cells
+        left, top, right, bottom = cell_range
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                cell: set[Hashable] | None = cells.get((cell_x, cell_y))
+                if cell is None:
+                    cells[(cell_x, cell_y)] = {item}
+                else:
+                    cell.add(item)
+
+    def remove(self, item: Hashable) -> None:
+        previous: tuple[int, int, int, int] | None = self._ranges.pop(item, None)
+        if previous is not None:
+            self._unlink(item, previous)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._ranges.clear()
+
+    def query(self, rect: pygame.Rect | tuple[float, float, float, float]) -> set[Hashable]:
+        """Returns every item whose cells overlap the rect. Items are matched by cell, so results can include near misses."""
+        cells: dict[tuple[int, int], set[Hashable]] = self._cells
+        found: set[Hashable] = set()
+
+        left, top, right, bottom = self.get_cell_range(rect)
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                cell: set[Hashable] | None = cells.get((cell_x, cell_y))
+                if cell:
+                    found |= cell
+
+        return found
+
+    def _unlink(self, item: Hashable, cell_range: tuple[int, int, int, int]) -> None:
+        cells: dict[tuple[int, int], set[Hashable]] = self._cells
+        left, top, right, bottom = cell_range
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                cell: set[Hashable] | None = cells.get((cell_x, cell_y))
+                if cell is not None:
+                    cell.discard(item)
+                    if not cell:
+                        del cells[(cell_x, cell_y)]
\ No newline at end of file
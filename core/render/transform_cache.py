@@ -0,0 +1,93 @@
+import pygame
+
+from collections import OrderedDict
+
+class TransformCache():
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, rotation_step: float = 1.0) -> None:
+        assert max_bytes > 0 and rotation_step > 0
+
+        self._entries: OrderedDict[tuple[pygame.Surface, int, bool], pygame.Surface] = OrderedDict()
+        self._max_bytes: int = max_bytes
+        self._rotation_step: float = rotation_step
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        assert max_bytes > 0
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @property
+    def rotation_step(self) -> float:
+        return self._rotation_step
+
+    def get(self, image: pygame.Surface, rotation: float = 0.0, flip: bool = False) -> pygame.Surface:
+        """Returns image rotated by rotation degrees then optionally flipped horizontally. The result is shared and must not be drawn onto."""
+        step: int = round(rotation / self._rotation_step) % round(360 / self._rotation_step)
+        if step == 0 and not flip:
+            return image
+
+        key: tuple[pygame.Surface, int, bool] = (image, step, flip)
+        transformed: pygame.Surface | None = self._entries.get(key)
+        if transformed is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return transformed
+
+        self._misses += 1
+        transformed = image
+        if step != 0:
+            transformed = pygame.transform.rotate(transformed, step * self._rotation_step)
+
+        if flip:
+            transformed = pygame.transform.flip(transformed, True, False)
+
+        self._entries[key] = transformed
+        self._bytes += self._get_surface_bytes(transformed)
+        self._evict()
+
+        return transformed
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+
+    def _evict(self) -> None:
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            _, surface = self._entries.popitem(last = False)
+            self._bytes -= self._get_surface_bytes(surface)
+
+    @staticmethod
+    def _get_surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
\ No newline at end of file
@@ -1,36 +1,46 @@
-import pygame
-
-from core.engine import Engine
-from core.input.keyboard.keyboard import Keyboard
-from core.input.keyboard.key import Key
-from core.render.scene.scene import Scene
-
-from player import Player
-
-from Box2D import b2Body
-
-class Game(Engine):
-    def __init__(self):
-        super().__init__()
-        pygame.display.set_caption("Bird Game")
-
-        self.scene: Scene = Scene()
-        self.player: Player = Player(self.scene.world)
-        # self.player_body: b2Body = self.scene.world.create_dynamic_body(self.player.position, self.player.size.x, self.player.size.y)
-
-    def tick(self, deltatime: float) -> None:
-        if Keyboard.get_pressed(Key.KEY_ESCAPE):
-            self.stop()
-
-        # self.player_body.position = self.scene.world.to_b2_position(self.player.position, self.player.size.x, self.player.size.y)
-
-    def render(self, surface: pygame.Surface, deltatime: float) -> None:
-        surface.fill((0, 0, 0))
-
-        ground_vertices = [(self.player._body.transform * v) * 20 for v in self.player._body.fixtures[0].shape.vertices]
-        ground_vertices = [(v[0], 1080 - v[1]) for v in ground_vertices]
-        pygame.draw.polygon(surface, (0, 50, 50), ground_vertices)
-
-if __name__ == "__main__":
-    game = Game()
+import argparse
+import pygame
+
+from core.assets.atlas import TextureAtlas
+from core.assets.cache import AssetCache
+from core.engine import Engine
+from core.input.keyboard.keyboard import Keyboard
+from core.input.keyboard.key import Key
+from core.render.scene.scene import Scene
+
+from player import Player
+
+from Box2D import b2Body
+
+class Game(Engine):
+    def __init__(self, flags: int = 0b0, *, fixed_deltatime: float | None = None, record_input: str | None = None, replay_input: str | None = None):
+        super().__init__(flags, fixed_deltatime = fixed_deltatime, record_input = record_input, replay_input = replay_input)
+        pygame.display.set_caption("Bird Game")
+        if TextureAtlas.exists("assets/atlas"):
+            AssetCache.use_atlas(TextureAtlas.load("assets/atlas"))
+        else:
+            AssetCache.preload_directory("assets")
+
+        self.scene: Scene = Scene()
+        self.player: Player = Player(self.scene.world)
+        self.scene.world.set_body_color(self.player._body, (0, 50, 50))
+        self.scene.entity_manager.add(self.player)
+        # self.player_body: b2Body = self.scene.world.create_dynamic_body(self.player.position, self.player.size.x, self.player.size.y)
+
+    def tick(self, deltatime: float) -> None:
+        if Keyboard.get_pressed(Key.KEY_ESCAPE):
+            self.stop()
+
+        # self.player_body.position = self.scene.world.to_b2_position(self.player.position, self.player.size.x, self.player.size.y)
+
+    def render(self, surface: pygame.Surface, deltatime: float) -> None:
+        surface.fill((0, 0, 0))
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Bird Game")
+    parser.add_argument("--record", metavar = "PATH", help = "record the input stream to a file")
+    parser.add_argument("--replay", metavar = "PATH", help = "replay a recorded input stream headless and unthrottled")
+    arguments: argparse.Namespace = parser.parse_args()
+
+    game = Game(record_input = arguments.record, replay_input = arguments.replay)
     game.start()
\ No newline at end of file